@@ -1,17 +1,41 @@
 import boto3
 import json
 import os
+import time
+import sys
+import argparse
+import threading
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def audit_extractions():
+# The search index is built with the OCR package's own tokenizer, so queries and backfill agree;
+# lambda/ holds the modules the package shares with the other Lambdas
+sys.path[:0] = [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda', d) for d in ('ocr_package', '')]
+
+BUCKET = 'ocr-site-bc930bd1'
+TABLE_NAME = 'ocr-extractions'
+OCR_FUNCTION = 'ocr-textract'
+# Textract DetectDocumentText / StartDocumentTextDetection, USD per page
+TEXTRACT_PRICE_PER_PAGE = 0.0015
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tiff', '.tif')
+# Partition value of timestamp-index (extraction_list.LIST_PARTITION in the OCR package)
+LIST_PARTITION = 'extraction'
+# Version counters behind the list ETags (lambda/collection_version.py)
+VERSIONS_TABLE = 'ocr-collection-versions'
+# Full-text search postings (lambda/ocr_package/search_index.py)
+SEARCH_TABLE = 'ocr-search-index'
+# Near-duplicate LSH buckets (lambda/ocr_package/near_duplicates.py)
+SIMHASH_TABLE = 'ocr-simhash-buckets'
+
+def audit_extractions(report_path=None):
     """Audit S3 files and DynamoDB extractions to ensure completeness"""
 
     # AWS clients
     s3_client = boto3.client('s3', region_name='eu-west-2')
     dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
-    table = dynamodb.Table('ocr-extractions')
+    table = dynamodb.Table(TABLE_NAME)
 
-    bucket = 'ocr-site-bc930bd1'
+    bucket = BUCKET
 
     print("🔍 Starting extraction audit...")
     print("=" * 60)
@@ -79,7 +103,7 @@ def audit_extractions():
         issues = []
 
         # Check required fields
-        if not record.get('text'):
+        if not record.get('text') and not record.get('result_key'):
             issues.append("missing text")
         if not record.get('filename'):
             issues.append("missing filename")
@@ -128,13 +152,16 @@ def audit_extractions():
     processed_files = len(existing_extractions)
     healthy_records = len(existing_extractions) - len(quality_issues)
 
-    print("
-📈 SUMMARY:"    print(f"  Total S3 files: {total_files}")
+    print("\n📈 SUMMARY:")
+    print(f"  Total S3 files: {total_files}")
     print(f"  Processed files: {processed_files} ({processed_files/total_files*100:.1f}%)")
     print(f"  Healthy records: {healthy_records} ({healthy_records/total_files*100:.1f}%)")
     print(f"  Missing extractions: {len(missing_extractions)}")
     print(f"  Records with issues: {len(quality_issues)}")
 
+    if report_path:
+        save_report(report_path, missing_extractions, quality_issues)
+
     return {
         's3_files': s3_files,
         'db_extractions': db_extractions,
@@ -143,6 +170,407 @@ def audit_extractions():
         'existing_extractions': existing_extractions
     }
 
+def save_report(path, missing_extractions, quality_issues):
+    """Write the audit findings as JSON, the input `backfill --report` reads back."""
+    report = {
+        'generated': datetime.now().isoformat(),
+        'missing_extractions': [
+            {'key': f['key'], 'size': f['size'], 'last_modified': str(f['last_modified'])}
+            for f in missing_extractions
+        ],
+        'quality_issues': [
+            {'key': key, 'issues': issues, 'file_exists': file_exists}
+            for key, issues, file_exists in quality_issues
+        ]
+    }
+    with open(path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n💾 Report saved to {path}")
+
+
+class TokenBucket:
+    """Thread-safe limit of `rate` acquisitions per second, with bursts of up to `rate`."""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def load_checkpoint(path):
+    """Keys already finished by an earlier run: {key: result}. 5xx and 429 results are retried."""
+    done = {}
+    if path and os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    entry = json.loads(line)
+                    done[entry['key']] = entry
+    return {key: entry for key, entry in done.items() if entry.get('status', 500) < 500 and entry['status'] != 429}
+
+
+def estimate_cost(files, pdf_pages, tps):
+    """Print the Textract cost and duration of a backfill without running it."""
+    images = [f for f in files if f['key'].lower().endswith(IMAGE_EXTENSIONS)]
+    pdfs = [f for f in files if f['key'].lower().endswith('.pdf')]
+    image_cost = len(images) * TEXTRACT_PRICE_PER_PAGE
+    # PDFs with a text layer never reach Textract; assume every page is scanned for the upper bound
+    pdf_cost = len(pdfs) * pdf_pages * TEXTRACT_PRICE_PER_PAGE
+    print(f"\n💰 DRY RUN: {len(files)} files to backfill")
+    print(f"  Images: {len(images)} (~${image_cost:.2f}; multi-page TIFFs and tiled photos cost more)")
+    print(f"  PDFs: {len(pdfs)} ($0.00 with a text layer, up to ~${pdf_cost:.2f} if all {pdf_pages} page(s) are scanned)")
+    print(f"  Total: ${image_cost:.2f} - ${image_cost + pdf_cost:.2f} at ${TEXTRACT_PRICE_PER_PAGE}/page")
+    print(f"  Duration at {tps} files/s: at least {len(files) / tps / 60:.1f} min")
+
+
+def backfill(files, workers=4, tps=2.0, checkpoint_path='backfill_checkpoint.jsonl',
+             dry_run=False, pdf_pages=2, function_name=OCR_FUNCTION):
+    """Re-run OCR on files with no extraction record by invoking the OCR Lambda for each.
+
+    The deployed function runs the exact /ocr flow (content cache, PDF text layer, Textract,
+    S3 result body), so backfilled records match uploads. Starts are limited to `tps` per second
+    to stay inside the Textract quota, and each finished key is appended to a JSONL checkpoint so
+    an interrupted run resumes where it stopped.
+    """
+    done = load_checkpoint(checkpoint_path)
+    todo = [f for f in files if f['key'] not in done]
+    if done:
+        print(f"⏩ Skipping {len(files) - len(todo)} files already in {checkpoint_path}")
+    if dry_run:
+        estimate_cost(todo, pdf_pages, tps)
+        return []
+    if not todo:
+        print("✅ Nothing to backfill")
+        return []
+
+    # Large TIFFs run as async Textract jobs; the worker flag makes the function wait for them
+    lambda_client = boto3.client('lambda', region_name='eu-west-2', config=botocore_config(workers))
+    limiter = TokenBucket(tps)
+    checkpoint_lock = threading.Lock()
+    checkpoint = open(checkpoint_path, 'a')
+
+    def process(file):
+        limiter.acquire()
+        start = time.perf_counter()
+        try:
+            response = lambda_client.invoke(
+                FunctionName=function_name,
+                Payload=json.dumps({
+                    'rawPath': '/ocr',
+                    'queryStringParameters': {'s3_key': file['key']},
+                    'worker': True
+                }).encode('utf-8')
+            )
+            payload = json.loads(response['Payload'].read())
+            if 'FunctionError' in response:
+                result = {'key': file['key'], 'status': 500, 'error': payload.get('errorMessage', 'function error')}
+            else:
+                body = json.loads(payload.get('body') or '{}')
+                result = {'key': file['key'], 'status': payload.get('statusCode', 500)}
+                if 'id' in body:
+                    result['id'] = body['id']
+                if 'error' in body:
+                    result['error'] = body['error']
+        except Exception as e:
+            result = {'key': file['key'], 'status': 500, 'error': str(e)}
+        result['ms'] = round((time.perf_counter() - start) * 1000)
+        with checkpoint_lock:
+            checkpoint.write(json.dumps(result) + '\n')
+            checkpoint.flush()
+        return result
+
+    print(f"🔧 Backfilling {len(todo)} files with {workers} workers at {tps} files/s...")
+    results = []
+    started = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(process, f) for f in todo]
+            for i, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+                results.append(result)
+                status = "✅" if result['status'] < 400 else "❌"
+                detail = result.get('error') or result.get('id', '')
+                print(f"  [{i}/{len(todo)}] {status} {result['status']} {result['key']} {detail}")
+    finally:
+        checkpoint.close()
+
+    failed = [r for r in results if r['status'] >= 400]
+    retryable = [r for r in failed if r['status'] >= 500 or r['status'] == 429]
+    print(f"\n📈 BACKFILL: {len(results) - len(failed)} extracted, {len(failed)} failed "
+          f"({len(retryable)} will be retried on the next run) in {time.perf_counter() - started:.0f}s")
+    return results
+
+
+def bump_list_version():
+    """Invalidate the history ETags after changing records behind the API's back."""
+    table = boto3.resource('dynamodb', region_name='eu-west-2').Table(VERSIONS_TABLE)
+    table.update_item(
+        Key={'collection': 'extractions'},
+        UpdateExpression='ADD version :one',
+        ExpressionAttributeValues={':one': 1}
+    )
+
+
+def index_for_list(dry_run=False):
+    """Set list_pk on records written before timestamp-index existed, so the history list shows them."""
+    table = boto3.resource('dynamodb', region_name='eu-west-2').Table(TABLE_NAME)
+    scan = {
+        'FilterExpression': 'attribute_not_exists(list_pk)',
+        'ProjectionExpression': 'id, #ts',
+        'ExpressionAttributeNames': {'#ts': 'timestamp'}
+    }
+    items = []
+    response = table.scan(**scan)
+    items.extend(response.get('Items', []))
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'], **scan)
+        items.extend(response.get('Items', []))
+
+    # The index sort key is timestamp; records without one can't be listed in order anyway
+    undated = [item['id'] for item in items if not item.get('timestamp')]
+    todo = [item for item in items if item.get('timestamp')]
+    print(f"🗂️  {len(todo)} record(s) missing list_pk, {len(undated)} without a timestamp (skipped)")
+    if dry_run:
+        return todo
+    for i, item in enumerate(todo, 1):
+        table.update_item(
+            Key={'id': item['id']},
+            UpdateExpression='SET list_pk = :pk',
+            ExpressionAttributeValues={':pk': LIST_PARTITION}
+        )
+        if i % 100 == 0:
+            print(f"  {i}/{len(todo)}")
+    if todo:
+        bump_list_version()
+    print(f"✅ Indexed {len(todo)} record(s)")
+    return todo
+
+
+def reconcile_file_status(dry_run=False):
+    """Repair file_exists/object_size/etag on records whose S3 events were lost or never sent."""
+    s3_client = boto3.client('s3', region_name='eu-west-2')
+    table = boto3.resource('dynamodb', region_name='eu-west-2').Table(TABLE_NAME)
+
+    objects = {}
+    paginator = s3_client.get_paginator('list_objects_v2')
+    for page in paginator.paginate(Bucket=BUCKET, Prefix='r/'):
+        for obj in page.get('Contents', []):
+            objects[obj['Key']] = {'size': obj['Size'], 'etag': obj['ETag'].strip('"')}
+
+    scan = {'ProjectionExpression': 'id, s3_key, file_exists, object_size, etag'}
+    items = []
+    response = table.scan(**scan)
+    items.extend(response.get('Items', []))
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'], **scan)
+        items.extend(response.get('Items', []))
+
+    drifted = []
+    for item in items:
+        if not item.get('s3_key'):
+            continue
+        obj = objects.get(item['s3_key'])
+        if obj:
+            stale = (item.get('file_exists') is not True or item.get('etag') != obj['etag']
+                     or item.get('object_size') != obj['size'])
+        else:
+            stale = item.get('file_exists') is not False
+        if stale:
+            drifted.append((item, obj))
+
+    print(f"🔁 {len(drifted)} of {len(items)} record(s) out of step with S3 ({len(objects)} objects under r/)")
+    if dry_run:
+        for item, obj in drifted[:20]:
+            print(f"  {item['id']} {item['s3_key']}: file_exists {item.get('file_exists')} -> {obj is not None}")
+        return drifted
+
+    now = datetime.utcnow().isoformat() + '+00:00'
+    for item, obj in drifted:
+        # s3_sequencer is left alone: later events carry larger sequencers and still apply
+        if obj:
+            table.update_item(
+                Key={'id': item['id']},
+                UpdateExpression='SET file_exists = :e, object_size = :s, etag = :t, file_checked_at = :now',
+                ExpressionAttributeValues={':e': True, ':s': obj['size'], ':t': obj['etag'], ':now': now}
+            )
+        else:
+            table.update_item(
+                Key={'id': item['id']},
+                UpdateExpression='SET file_exists = :e, file_checked_at = :now REMOVE object_size, etag',
+                ExpressionAttributeValues={':e': False, ':now': now}
+            )
+    if drifted:
+        bump_list_version()
+    print(f"✅ Reconciled {len(drifted)} record(s)")
+    return drifted
+
+
+def index_for_search(rebuild=False, dry_run=False):
+    """Add records to the search index: those written before it existed, or all of them with rebuild."""
+    from search_index import DOC_TERM, index_document
+    from result_store import get_result
+
+    s3_client = boto3.client('s3', region_name='eu-west-2')
+    dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
+    table = dynamodb.Table(TABLE_NAME)
+    search_table = dynamodb.Table(SEARCH_TABLE)
+
+    scan = {'ProjectionExpression': 'id, result_key, #t', 'ExpressionAttributeNames': {'#t': 'text'}}
+    items = []
+    response = table.scan(**scan)
+    items.extend(response.get('Items', []))
+    while 'LastEvaluatedKey' in response:
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'], **scan)
+        items.extend(response.get('Items', []))
+
+    if rebuild:
+        todo = items
+    else:
+        indexed = set()
+        query = {'KeyConditionExpression': 'term = :doc', 'ExpressionAttributeValues': {':doc': DOC_TERM}, 'ProjectionExpression': 'id'}
+        response = search_table.query(**query)
+        indexed.update(item['id'] for item in response.get('Items', []))
+        while 'LastEvaluatedKey' in response:
+            response = search_table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **query)
+            indexed.update(item['id'] for item in response.get('Items', []))
+        todo = [item for item in items if item['id'] not in indexed]
+    print(f"🔎 {len(todo)} of {len(items)} record(s) to index for search")
+    if dry_run:
+        return todo
+
+    failed = 0
+    for i, item in enumerate(todo, 1):
+        try:
+            text = get_result(s3_client, BUCKET, item['result_key']).get('text', '') if item.get('result_key') else item.get('text', '')
+            index_document(search_table, item['id'], text)
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {item['id']}: {e}")
+        if i % 100 == 0:
+            print(f"  {i}/{len(todo)}")
+    if todo:
+        bump_list_version()
+    print(f"✅ Indexed {len(todo) - failed} record(s) for search, {failed} failed")
+    return todo
+
+
+def index_for_near_duplicates(dry_run=False):
+    """Empty the near-duplicate buckets and file every record with a simhash under the current bands."""
+    from near_duplicates import index_signature
+
+    dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
+    table = dynamodb.Table(TABLE_NAME)
+    simhash_table = dynamodb.Table(SIMHASH_TABLE)
+
+    def scan_all(source, **scan):
+        items = []
+        response = source.scan(**scan)
+        items.extend(response.get('Items', []))
+        while 'LastEvaluatedKey' in response:
+            response = source.scan(ExclusiveStartKey=response['LastEvaluatedKey'], **scan)
+            items.extend(response.get('Items', []))
+        return items
+
+    items = [item for item in scan_all(table, ProjectionExpression='id, simhash, duplicate_of') if item.get('simhash')]
+    buckets = scan_all(simhash_table, ProjectionExpression='band, id')
+    print(f"🧬 {len(buckets)} bucket entries to clear, {len(items)} record(s) to file")
+    if dry_run:
+        return items
+
+    with simhash_table.batch_writer() as writer:
+        for bucket in buckets:
+            writer.delete_item(Key={'band': bucket['band'], 'id': bucket['id']})
+    failed = 0
+    for item in items:
+        try:
+            index_signature(simhash_table, item['id'], int(item['simhash'], 16), item.get('duplicate_of'))
+        except Exception as e:
+            failed += 1
+            print(f"  ❌ {item['id']}: {e}")
+    print(f"✅ Filed {len(items) - failed} record(s) in the near-duplicate buckets, {failed} failed")
+    return items
+
+
+def botocore_config(workers):
+    from botocore.config import Config
+
+    # One connection per worker, and long enough reads for a full extraction
+    return Config(max_pool_connections=max(10, workers), read_timeout=310, retries={'max_attempts': 2})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Audit OCR extractions and backfill missing ones')
+    sub = parser.add_subparsers(dest='command')
+
+    audit = sub.add_parser('audit', help='cross-check S3 uploads against extraction records (default)')
+    audit.add_argument('--save-report', help='write missing extractions and quality issues to this JSON file')
+
+    fill = sub.add_parser('backfill', help='re-run OCR on files missing an extraction record')
+    fill.add_argument('--report', help='saved audit report to read (default: run the audit now)')
+    fill.add_argument('--workers', type=int, default=4, help='concurrent OCR invocations')
+    fill.add_argument('--tps', type=float, default=2.0, help='max files started per second (Textract quota)')
+    fill.add_argument('--checkpoint', default='backfill_checkpoint.jsonl', help='progress file used to resume')
+    fill.add_argument('--dry-run', action='store_true', help='only print the cost estimate')
+    fill.add_argument('--pdf-pages', type=int, default=2, help='assumed pages per PDF for the estimate')
+    fill.add_argument('--limit', type=int, help='backfill at most this many files')
+    fill.add_argument('--function', default=OCR_FUNCTION, help='OCR Lambda to invoke')
+
+    index = sub.add_parser('index', help='add old records to the timestamp-index used by the history list')
+    index.add_argument('--dry-run', action='store_true', help='only count the records to update')
+
+    reconcile = sub.add_parser('reconcile', help='repair file_exists on records against the S3 listing')
+    reconcile.add_argument('--dry-run', action='store_true', help='only report the records that drifted')
+
+    search = sub.add_parser('search-index', help='add records written before the search index existed to it')
+    search.add_argument('--rebuild', action='store_true', help='re-index every record, not only missing ones')
+    search.add_argument('--dry-run', action='store_true', help='only count the records to index')
+
+    simhash = sub.add_parser('simhash-index', help='rebuild the near-duplicate buckets with the current bands')
+    simhash.add_argument('--dry-run', action='store_true', help='only count the entries and records')
+
+    args = parser.parse_args()
+    if args.command == 'simhash-index':
+        index_for_near_duplicates(args.dry_run)
+        return
+    if args.command == 'search-index':
+        index_for_search(args.rebuild, args.dry_run)
+        return
+    if args.command == 'reconcile':
+        reconcile_file_status(args.dry_run)
+        return
+    if args.command == 'index':
+        index_for_list(args.dry_run)
+        return
+    if args.command != 'backfill':
+        audit_extractions(getattr(args, 'save_report', None))
+        return
+
+    if args.report:
+        with open(args.report) as f:
+            missing = json.load(f)['missing_extractions']
+    else:
+        result = audit_extractions()
+        if not result:
+            return
+        missing = result['missing_extractions']
+    if args.limit:
+        missing = missing[:args.limit]
+    backfill(missing, args.workers, args.tps, args.checkpoint, args.dry_run, args.pdf_pages, args.function)
+
+
 if __name__ == "__main__":
-    audit_extractions()</content>
-<parameter name="filePath">audit_extractions.py
\ No newline at end of file
+    main()
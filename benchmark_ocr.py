@@ -0,0 +1,890 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+# Make the OCR Lambda modules importable when run from the repo root, then the modules it shares
+# with the other Lambdas (rate_limiter, collection_version), which only live under lambda/
+sys.path[:0] = [os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lambda', d) for d in ('ocr_package', '')]
+
+DISHES = [
+    'Tajarin al burro e tartufo', 'Vitello tonnato', 'Agnolotti del plin',
+    'Brasato al Barolo', 'Bagna cauda', 'Risotto alla milanese',
+    'Bonet', 'Panna cotta', 'Fritto misto alla piemontese', 'Insalata russa',
+]
+
+
+def make_menu_pdf(page_count, lines_per_page=30, image_kb=0):
+    """Build a text-layer PDF that looks like a restaurant menu, without extra dependencies.
+
+    image_kb adds an incompressible image to every page so file size tracks a scanned menu.
+    """
+    objects = []
+    page_ids = []
+    font_id = 3
+    objects.append(b'<< /Type /Catalog /Pages 2 0 R >>')
+    objects.append(None)  # Pages tree, filled in once the kids are known
+    objects.append(b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>')
+    for p in range(page_count):
+        ops = ['BT', '/F1 11 Tf', '14 TL', '50 800 Td']
+        for i in range(lines_per_page):
+            dish = DISHES[(p + i) % len(DISHES)]
+            ops.append(f'({dish} ........ {8 + (p * 7 + i) % 23},00 EUR) Tj T*')
+        ops.append('ET')
+        xobjects = b''
+        if image_kb:
+            side = int((image_kb * 1024) ** 0.5)
+            pixels = os.urandom(side * side)
+            objects.append(b'<< /Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace /DeviceGray '
+                           b'/BitsPerComponent 8 /Length %d >>\nstream\n%s\nendstream' % (side, side, len(pixels), pixels))
+            xobjects = b' /XObject << /Im1 %d 0 R >>' % len(objects)
+            ops.insert(0, 'q 595 0 0 842 0 0 cm /Im1 Do Q')
+        stream = '\n'.join(ops).encode('latin-1')
+        objects.append(b'<< /Length %d >>\nstream\n%s\nendstream' % (len(stream), stream))
+        content_id = len(objects)
+        objects.append(b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+                       b'/Resources << /Font << /F1 %d 0 R >>%s >> /Contents %d 0 R >>' % (font_id, xobjects, content_id))
+        page_ids.append(len(objects))
+    kids = b' '.join(b'%d 0 R' % i for i in page_ids)
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (kids, page_count)
+
+    out = io.BytesIO()
+    out.write(b'%PDF-1.4\n')
+    offsets = []
+    for num, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b'%d 0 obj\n%s\nendobj\n' % (num, body))
+    xref_pos = out.tell()
+    out.write(b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1))
+    for off in offsets:
+        out.write(b'%010d 00000 n \n' % off)
+    out.write(b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref_pos))
+    return out.getvalue()
+
+
+def extract_buffered(path, engine_name, text_out):
+    """The original lambda_ocr PDF path: whole file in memory, text built with +=."""
+    from pypdf import PdfReader
+    with open(path, 'rb') as f:
+        content = f.read()
+    reader = PdfReader(io.BytesIO(content))
+    text = ''
+    for page in reader.pages:
+        text += page.extract_text() + '\n\n'
+    if text_out:
+        with open(text_out, 'w') as f:
+            f.write(text)
+    return len(reader.pages)
+
+
+def extract_streaming(path, engine_name, text_out):
+    # The engine is used directly, without the pypdf fallback, so failures show up in the numbers
+    from pdf_extract import ENGINES
+    pages = 0
+    out = open(text_out, 'w') if text_out else None
+    try:
+        for _, page_text in ENGINES[engine_name]().iter_pages(path):
+            pages += 1
+            if out:
+                out.write(page_text + '\n\n')
+    finally:
+        if out:
+            out.close()
+    return pages
+
+
+MODES = {
+    'buffered': extract_buffered,
+    'streaming': extract_streaming,
+}
+
+
+def peak_rss_mb():
+    # ru_maxrss survives exec, so a child forked from a big parent would inherit its peak;
+    # VmHWM is reset with the new address space
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_child(args):
+    """Runs inside a fresh interpreter so every measurement starts from the same baseline."""
+    start = time.perf_counter()
+    pages = MODES[args.mode](args.path, args.engine, args.text_out)
+    elapsed = time.perf_counter() - start
+    print(f'{pages} {elapsed:.4f} {peak_rss_mb():.1f}')
+
+
+def measure(mode, path, engine='pypdf', text_out=None):
+    cmd = [sys.executable, __file__, '_child', mode, path, '--engine', engine]
+    if text_out:
+        cmd += ['--text-out', text_out]
+    out = subprocess.run(cmd, capture_output=True, text=True, check=True).stdout.split()
+    return int(out[0]), float(out[1]), float(out[2])
+
+
+def bench_rss(args):
+    """Peak RSS per extraction mode for PDFs of increasing page count.
+
+    Fails if the streaming mode's peak grows by more than --max-growth-mb from the smallest PDF to
+    the largest: the Lambda's path must stay flat whatever the page count.
+    """
+    print(f"{'pages':>6} {'mode':>10} {'seconds':>9} {'peak MB':>8}")
+    streaming = []
+    for page_count in args.pages:
+        fd, path = tempfile.mkstemp(suffix='.pdf')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(make_menu_pdf(page_count, image_kb=args.image_kb))
+        try:
+            for mode in args.modes:
+                pages, elapsed, rss = measure(mode, path)
+                print(f'{pages:>6} {mode:>10} {elapsed:>9.3f} {rss:>8.1f}')
+                if mode == 'streaming':
+                    streaming.append(rss)
+        finally:
+            os.remove(path)
+    if len(streaming) < 2:
+        return True
+    growth = max(streaming) - streaming[0]
+    ok = growth <= args.max_growth_mb
+    print(f"{'OK' if ok else 'FAIL'} streaming peak RSS grew {growth:.1f} MB from {min(args.pages)} to "
+          f"{max(args.pages)} pages (bound {args.max_growth_mb:g} MB)")
+    return ok
+
+
+def bench_workers(args):
+    """Pages/sec of PDF text extraction per worker count, checking output matches the serial run."""
+    from pdf_extract import iter_pdf_pages
+    fd, path = tempfile.mkstemp(suffix='.pdf')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(make_menu_pdf(args.pages, lines_per_page=args.lines))
+    try:
+        print(f"{'workers':>7} {'seconds':>9} {'pages/s':>9} {'same output':>12}")
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            pages = list(iter_pdf_pages(path, workers))
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = pages
+            print(f'{workers:>7} {elapsed:>9.3f} {len(pages) / elapsed:>9.1f} {str(pages == baseline):>12}')
+    finally:
+        os.remove(path)
+
+
+def token_parity(text, reference):
+    """Share of the reference's word tokens (with multiplicity) that the other engine also produced."""
+    got = Counter(text.split())
+    want = Counter(reference.split())
+    if not want:
+        return 1.0 if not got else 0.0
+    return sum((got & want).values()) / sum(want.values())
+
+
+def corpus_files(args, workdir):
+    if args.corpus:
+        return sorted(
+            os.path.join(args.corpus, name) for name in os.listdir(args.corpus)
+            if name.lower().endswith('.pdf')
+        )
+    # No corpus given: synthesize small, medium and long menus
+    paths = []
+    for pages in (1, 4, 12, 40):
+        path = os.path.join(workdir, f'menu_{pages:02d}p.pdf')
+        with open(path, 'wb') as f:
+            f.write(make_menu_pdf(pages, lines_per_page=45))
+        paths.append(path)
+    return paths
+
+
+def bench_engines(args):
+    """Wall time, peak memory and text parity (vs pypdf) for each PDF engine over a corpus."""
+    with tempfile.TemporaryDirectory() as workdir:
+        print(f"{'file':<28} {'engine':>8} {'pages':>6} {'seconds':>9} {'peak MB':>8} {'parity':>7}")
+        totals = {engine: [0.0, 0.0] for engine in args.engines}
+        for path in corpus_files(args, workdir):
+            reference = None
+            for engine in args.engines:
+                text_out = os.path.join(workdir, f'{engine}.txt')
+                try:
+                    pages, elapsed, rss = measure('streaming', path, engine, text_out)
+                except subprocess.CalledProcessError as e:
+                    last_line = (e.stderr.strip().splitlines() or ['?'])[-1]
+                    print(f'{os.path.basename(path):<28} {engine:>8} failed: {last_line}')
+                    continue
+                with open(text_out) as f:
+                    text = f.read()
+                if reference is None:
+                    reference = text
+                totals[engine][0] += elapsed
+                totals[engine][1] = max(totals[engine][1], rss)
+                print(f'{os.path.basename(path):<28} {engine:>8} {pages:>6} {elapsed:>9.3f} {rss:>8.1f} '
+                      f'{token_parity(text, reference):>7.1%}')
+        print()
+        for engine, (elapsed, rss) in totals.items():
+            print(f'{engine:>8}: {elapsed:.3f}s total, {rss:.1f} MB peak')
+
+
+class StubTextract:
+    """Stand-in for the Textract async API: a job finishes `delay` seconds after it starts."""
+
+    def __init__(self, blocks, delay=2.0, pages=1):
+        self.blocks = blocks
+        self.delay = delay
+        self.pages = pages
+        self.started = {}
+
+    def start_document_text_detection(self, DocumentLocation, **kwargs):
+        job_id = f'stub-job-{len(self.started) + 1}'
+        self.started[job_id] = time.monotonic()
+        return {'JobId': job_id}
+
+    def get_document_text_detection(self, JobId, MaxResults=1000, NextToken=None):
+        if time.monotonic() - self.started[JobId] < self.delay:
+            return {'JobStatus': 'IN_PROGRESS'}
+        start = int(NextToken or 0)
+        response = {
+            'JobStatus': 'SUCCEEDED',
+            'DocumentMetadata': {'Pages': self.pages},
+            'Blocks': self.blocks[start:start + MaxResults]
+        }
+        if start + MaxResults < len(self.blocks):
+            response['NextToken'] = str(start + MaxResults)
+        return response
+
+
+class DictTable:
+    """Just enough of a DynamoDB Table for the job-tracking helpers."""
+
+    def __init__(self, key):
+        self.key = key
+        self.items = {}
+
+    def put_item(self, Item):
+        self.items[Item[self.key]] = dict(Item)
+
+    def get_item(self, Key):
+        item = self.items.get(Key[self.key])
+        return {'Item': item} if item else {}
+
+
+def make_textract_blocks(lines, words_per_line=6, pages=1):
+    """Synthetic LINE/WORD blocks shaped like a detect_document_text response."""
+    blocks = []
+    lines_per_page = max(1, lines // pages)
+    for i in range(lines):
+        page = min(pages, i // lines_per_page + 1)
+        top = (i % lines_per_page) / lines_per_page
+        dish = DISHES[i % len(DISHES)].split()
+        word_ids = []
+        for j in range(words_per_line):
+            word_id = f'w{i}-{j}'
+            word_ids.append(word_id)
+            blocks.append({
+                'BlockType': 'WORD', 'Id': word_id, 'Page': page,
+                'Text': dish[j % len(dish)], 'Confidence': 80 + (i * 7 + j) % 20,
+                'Geometry': {'BoundingBox': {'Top': top, 'Left': 0.05 + j * 0.1, 'Width': 0.09, 'Height': 0.01}}
+            })
+        blocks.append({
+            'BlockType': 'LINE', 'Id': f'l{i}', 'Page': page,
+            'Text': ' '.join(dish[j % len(dish)] for j in range(words_per_line)),
+            'Confidence': 90.0,
+            'Geometry': {'BoundingBox': {'Top': top, 'Left': 0.05, 'Width': 0.6, 'Height': 0.01}},
+            'Relationships': [{'Type': 'CHILD', 'Ids': word_ids}]
+        })
+    return blocks
+
+
+def bench_async(args):
+    """Request latency of the async Textract flow (start + polls) against a stub that simulates delay."""
+    from textract_jobs import start_job, get_job, poll_job
+    from ocr_document import parse_textract_blocks
+
+    textract = StubTextract(make_textract_blocks(args.lines, pages=args.pages), delay=args.delay, pages=args.pages)
+    jobs = DictTable('job_id')
+
+    start = time.perf_counter()
+    job_id = start_job(textract, jobs, 'bucket', 'r/1/menu.tiff', 'menu.tiff')
+    print(f'start request: {(time.perf_counter() - start) * 1000:.2f} ms -> job {job_id}')
+
+    polls = 0
+    while True:
+        polls += 1
+        start = time.perf_counter()
+        status, blocks, pages, _ = poll_job(textract, get_job(jobs, job_id)['job_id'])
+        if status == 'IN_PROGRESS':
+            print(f'poll {polls}: {status} ({(time.perf_counter() - start) * 1000:.2f} ms)')
+            time.sleep(args.interval)
+            continue
+        text, lines, words, avg = parse_textract_blocks(blocks)
+        print(f'poll {polls}: {status}, {pages} pages, {len(blocks)} blocks -> {len(lines)} lines, '
+              f'{len(words)} words, avg {avg}% ({(time.perf_counter() - start) * 1000:.2f} ms)')
+        break
+    # Every page of the stub's result must come back, once, after the delay
+    ok = status == 'SUCCEEDED' and pages == args.pages and len(lines) == args.lines and polls > 1
+    print(f"{'OK' if ok else 'FAIL'} async job: {status}, {pages}/{args.pages} pages, "
+          f"{len(lines)}/{args.lines} lines after {polls} polls")
+    return ok
+
+
+def legacy_parse_textract_blocks(blocks):
+    """The dict-based parser ocr_document replaced, kept as the baseline for `parse`."""
+    block_map = {b['Id']: b for b in blocks}
+    words = []
+    for b in blocks:
+        if b['BlockType'] == 'WORD':
+            box = b.get('Geometry', {}).get('BoundingBox', {})
+            words.append({
+                'text': b.get('Text', ''),
+                'confidence': round(b.get('Confidence', 0), 1),
+                'top': (b.get('Page', 1) - 1) * 100 + box.get('Top', 0),
+                'left': box.get('Left', 0)
+            })
+    avg_confidence = round(sum(w['confidence'] for w in words) / len(words), 1) if words else 0.0
+    lines = [b for b in blocks if b['BlockType'] == 'LINE']
+    lines.sort(key=lambda b: (b.get('Page', 1), b.get('Geometry', {}).get('BoundingBox', {}).get('Top', 0)))
+    sections = []
+    all_lines = []
+    for line in lines:
+        line_words = []
+        for rel in line.get('Relationships', []):
+            if rel['Type'] == 'CHILD':
+                for wid in rel['Ids']:
+                    w = block_map.get(wid)
+                    if w and w['BlockType'] == 'WORD':
+                        line_words.append({'text': w.get('Text', ''), 'confidence': round(w.get('Confidence', 0), 1)})
+        indent = int(line.get('Geometry', {}).get('BoundingBox', {}).get('Left', 0) * 80)
+        sections.append(' ' * indent + line.get('Text', ''))
+        all_lines.append({'text': line.get('Text', ''), 'words': line_words, 'indent': indent})
+    return '\n'.join(sections), all_lines, words, avg_confidence
+
+
+def bench_parse(args):
+    """Time and peak allocation of parsing a large Textract response, old dict parser vs Document model."""
+    import tracemalloc
+    from ocr_document import Document
+
+    # One LINE per `words_per_line` WORDs, so blocks = lines * (words_per_line + 1)
+    blocks = make_textract_blocks(args.blocks // 7, words_per_line=6, pages=args.pages)
+    print(f'{len(blocks)} blocks, {args.pages} pages')
+
+    parsers = {
+        'legacy': lambda: legacy_parse_textract_blocks(blocks),
+        'document': lambda: Document.from_textract_blocks(blocks),
+        'document+json': lambda: Document.from_textract_blocks(blocks).to_json(),
+    }
+    for name, parse in parsers.items():
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            parse()
+            timings.append(time.perf_counter() - start)
+        tracemalloc.start()
+        result = parse()
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del result
+        print(f'{name:>14}: {min(timings) * 1000:7.1f} ms best of {args.repeat}, '
+              f'{retained / 1e6:6.2f} MB retained, {peak / 1e6:6.2f} MB peak')
+
+    text, lines, words, avg = legacy_parse_textract_blocks(blocks)
+    result = Document.from_textract_blocks(blocks).to_json()
+    same = (sorted(w['text'] for w in words) == sorted(w['text'] for w in result['words'])
+            and len(lines) == len(result['lines']))
+    print(f'same lines/words as legacy: {same}; avg confidence {avg} vs {result["avg_confidence"]}')
+
+
+def bench_offload(args):
+    """DynamoDB item size and scan read units with the result inline vs offloaded to gzip S3 bodies."""
+    import gzip
+    import compact_format
+    from ocr_document import parse_textract_blocks
+
+    print(f'{"lines":>6} {"inline item":>12} {"meta item":>10} {"gzip body":>10} {"scan RCU inline":>16} {"offloaded":>10}')
+    for line_count in args.lines:
+        text, lines, words, avg = parse_textract_blocks(make_textract_blocks(line_count, pages=max(1, line_count // 60)))
+        meta = {
+            'id': '0' * 36, 'filename': 'menu.pdf', 's3_key': 'r/turin/default/menu.pdf',
+            'result_key': f'extractions/{"0" * 36}.json.gz', 'result_bytes': 0,
+            'line_count': len(lines), 'avg_confidence': avg, 'timestamp': '2026-01-01T00:00:00+00:00', 'hash': '0' * 64
+        }
+        inline = dict(meta, text=text, lines=lines, words=words)
+        inline_bytes = len(json.dumps(inline))
+        meta_bytes = len(json.dumps(meta))
+        body = {'text': text, 'compact': compact_format.encode(lines, words)}
+        body_bytes = len(gzip.compress(json.dumps(body, separators=(',', ':')).encode()))
+        # A scan reads whole items, billed per 4 KB (eventually consistent = half a unit); 20 items like this one
+        rcu = lambda size: 20 * size / 4096 / 2
+        over = ' (over 400 KB limit)' if inline_bytes > 400 * 1024 else ''
+        print(f'{line_count:>6} {inline_bytes / 1024:>10.1f}KB {meta_bytes / 1024:>8.2f}KB {body_bytes / 1024:>8.1f}KB '
+              f'{rcu(inline_bytes):>16.1f} {rcu(meta_bytes):>10.2f}{over}')
+
+
+def bench_compact(args):
+    """Bytes on the wire and client parse time: word objects vs ?format=compact (plain and packed)."""
+    import gzip
+    import compact_format
+    from ocr_document import parse_textract_blocks
+
+    text, lines, words, avg = parse_textract_blocks(make_textract_blocks(args.lines, pages=max(1, args.lines // 60)))
+    print(f'{len(lines)} lines, {len(words)} words')
+    bodies = {
+        'objects': {'text': text, 'lines': lines, 'words': words},
+        'compact': {'text': text, 'compact': compact_format.encode(lines, words)},
+        'packed': {'text': text, 'compact': compact_format.encode(lines, words, pack=True)},
+    }
+    for name, body in bodies.items():
+        raw = json.dumps(body).encode('utf-8')
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            parsed = json.loads(raw)
+            if 'compact' in parsed:
+                parsed['lines'], parsed['words'] = compact_format.decode(parsed.pop('compact'))
+            timings.append(time.perf_counter() - start)
+        # Quantization keeps 1/10000 of a page, so compare positions at that precision
+        same = (parsed['lines'] == lines and len(parsed['words']) == len(words) and all(
+            a['text'] == b['text'] and a['confidence'] == b['confidence'] and abs(a['top'] - b['top']) < 1e-4
+            for a, b in zip(parsed['words'], words)))
+        print(f'{name:>8}: {len(raw) / 1024:8.1f} KB raw, {len(gzip.compress(raw)) / 1024:7.1f} KB gzip, '
+              f'parse+decode {min(timings) * 1000:6.1f} ms, round-trip ok: {same}')
+
+
+def make_menu_photo(width, height, rotate=False):
+    """A phone-photo-like JPEG of a menu: colour noise behind dark text, optionally stored sideways with EXIF."""
+    from PIL import Image, ImageDraw
+
+    image = Image.effect_noise((width, height), 24).convert('RGB')
+    image = Image.blend(image, Image.new('RGB', (width, height), (236, 226, 205)), 0.7)
+    draw = ImageDraw.Draw(image)
+    step = max(12, height // 60)
+    for i, y in enumerate(range(step, height - step, step)):
+        draw.text((width // 12, y), f'{DISHES[i % len(DISHES)]} ........ {8 + i % 23},00', fill=(40, 30, 20))
+    exif = Image.Exif()
+    if rotate:
+        # Stored rotated; Orientation 6 tells viewers to turn it 90 degrees clockwise
+        image = image.transpose(Image.ROTATE_90)
+        exif[0x0112] = 6
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=92, exif=exif)
+    return buffer.getvalue()
+
+
+def bench_preprocess(args):
+    """Bytes saved and time per stage of the image preprocessing run before Textract."""
+    from image_preprocess import preprocess_image
+
+    if args.images:
+        samples = [(name, open(os.path.join(args.images, name), 'rb').read())
+                   for name in sorted(os.listdir(args.images))
+                   if name.lower().endswith(('.png', '.jpg', '.jpeg'))]
+    else:
+        samples = [(f'{w}x{h}{" exif-rotated" if rot else ""}', make_menu_photo(w, h, rot))
+                   for w, h, rot in ((1600, 1200, False), (4032, 3024, False), (4032, 3024, True), (8000, 6000, False))]
+
+    stages = ('decode', 'orient', 'grayscale', 'resize', 'encode')
+    print(f'{"image":>24} {"original":>10} {"sent":>10} {"saved":>7}  ' + ' '.join(f'{s:>9}' for s in stages))
+    for name, data in samples:
+        encoded, content_type, stats = preprocess_image(data)
+        sent = len(encoded) if encoded is not None else len(data)
+        print(f'{name:>24} {len(data) / 1024:>8.0f}KB {sent / 1024:>8.0f}KB {100 * (1 - sent / len(data)):>6.0f}%  '
+              + ' '.join(f'{stats[s + "_ms"]:>7.1f}ms' for s in stages))
+
+
+def simulate_tile_blocks(truth, crop_box):
+    """The blocks Textract would return for one tile of a page whose words are `truth`.
+
+    Words cut by the tile edge come back clipped with a garbled `~` suffix, like a half-visible word.
+    """
+    x0, y0, x1, y1 = crop_box
+    tile_w, tile_h = x1 - x0, y1 - y0
+    blocks = []
+    rows = {}
+    for text, row, (left, top, right, bottom) in truth:
+        if right <= x0 or left >= x1 or bottom <= y0 or top >= y1:
+            continue
+        clipped = left < x0 or right > x1 or top < y0 or bottom > y1
+        left, top, right, bottom = max(left, x0), max(top, y0), min(right, x1), min(bottom, y1)
+        word_id = f'{text}-{x0}-{y0}'
+        blocks.append({
+            'BlockType': 'WORD', 'Id': word_id, 'Text': text + ('~' if clipped else ''), 'Confidence': 60.0 if clipped else 95.0,
+            'Geometry': {'BoundingBox': {'Left': (left - x0) / tile_w, 'Top': (top - y0) / tile_h,
+                                         'Width': (right - left) / tile_w, 'Height': (bottom - top) / tile_h}}
+        })
+        rows.setdefault(row, []).append(blocks[-1])
+    for row, words in rows.items():
+        blocks.append({
+            'BlockType': 'LINE', 'Id': f'line{row}-{x0}-{y0}', 'Text': ' '.join(w['Text'] for w in words), 'Confidence': 90.0,
+            'Geometry': {'BoundingBox': dict(words[0]['Geometry']['BoundingBox'])},
+            'Relationships': [{'Type': 'CHILD', 'Ids': [w['Id'] for w in words]}]
+        })
+    return blocks
+
+
+class SleepTextract:
+    """detect_document_text that just waits, to measure how tiled OCR latency scales with concurrency."""
+
+    def __init__(self, latency):
+        self.latency = latency
+
+    def detect_document_text(self, Document):
+        time.sleep(self.latency)
+        return {'Blocks': []}
+
+
+def bench_tiles(args):
+    """Tiled OCR: overlap de-duplication on a simulated page, and latency vs tile concurrency."""
+    from ocr_document import Document
+    from tiled_ocr import TILE_OVERLAP, TILE_SIZE, merge_tile_blocks, plan_tiles
+
+    width, height = args.width, args.height
+    truth = []
+    word_w, word_h, gap = 180, 40, 30
+    for row, top in enumerate(range(50, height - word_h, 90)):
+        for col, left in enumerate(range(50, width - word_w, word_w + gap)):
+            truth.append((f'r{row}c{col}', row, (left, top, left + word_w, top + word_h)))
+    tiles = plan_tiles(width, height)
+    merged, dropped = merge_tile_blocks([(tile, simulate_tile_blocks(truth, tile[0])) for tile in tiles], width, height)
+    result = Document.from_textract_blocks(merged).to_json()
+    found = Counter(w['text'] for w in result['words'])
+    expected = {text for text, _, _ in truth}
+    print(f'{width}x{height}, {len(tiles)} tiles of {TILE_SIZE}px with {TILE_OVERLAP}px overlap, {len(truth)} words')
+    print(f'  kept {len(result["words"])} words, dropped {dropped} overlap copies; '
+          f'missing {len(expected - set(found))}, duplicated {sum(1 for c in found.values() if c > 1)}, '
+          f'clipped kept {sum(1 for t in found if t.endswith("~"))}')
+
+    # Each run in a fresh interpreter: the peak is what the Lambda's tiling costs, not this process
+    fd, path = tempfile.mkstemp(suffix='.jpg')
+    with os.fdopen(fd, 'wb') as f:
+        f.write(make_menu_photo(width, height))
+    try:
+        for concurrency in args.concurrency:
+            out = subprocess.run(
+                [sys.executable, __file__, '_tile_child', path, str(concurrency), str(args.latency)],
+                capture_output=True, text=True, check=True
+            ).stdout.split()
+            print(f'  concurrency {concurrency}: {float(out[1]):.2f}s total ({out[0]} tiles, '
+                  f'{args.latency:.1f}s per Textract call), peak RSS {float(out[2]):.0f} MB')
+    finally:
+        os.remove(path)
+
+
+def run_tile_child(args):
+    from tiled_ocr import ocr_tiled_image
+    with open(args.path, 'rb') as f:
+        photo = f.read()
+    start = time.perf_counter()
+    _, stats = ocr_tiled_image(SleepTextract(args.latency), photo, concurrency=args.concurrency)
+    print(f'{stats["tiles"]} {time.perf_counter() - start:.4f} {peak_rss_mb():.1f}')
+
+
+class NullS3:
+    """put_object that only counts bytes, for timing the result-store stage without S3."""
+
+    def put_object(self, Body, **kwargs):
+        return {'ContentLength': len(Body)}
+
+
+def run_local_pipeline(kind, args, workdir):
+    """One local extraction timed with the Lambda's StageMetrics; S3 and Textract are simulated."""
+    import hashlib
+    from metrics import StageMetrics
+    from ocr_document import Document
+    from result_store import put_result
+
+    metrics = StageMetrics(DocumentType=kind)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if kind == 'pdf':
+            from pdf_extract import iter_pdf_pages, page_lines_and_words, get_engine
+            data = make_menu_pdf(args.pages, lines_per_page=args.lines)
+            path = os.path.join(workdir, 'menu.pdf')
+            with metrics.stage('download'):
+                with open(path, 'wb') as f:
+                    f.write(data)
+            metrics.count('source_bytes', len(data))
+            with metrics.stage('hash'):
+                with open(path, 'rb') as f:
+                    hashlib.sha256(f.read()).hexdigest()
+            text_parts, lines, words = [], [], []
+            with metrics.stage('pdf_parse'):
+                for page_num, page_text in iter_pdf_pages(path, 1, get_engine('pypdf')):
+                    page_lines, page_words = page_lines_and_words(page_num, page_text)
+                    text_parts.append(page_text)
+                    lines.extend(page_lines)
+                    words.extend(page_words)
+            metrics.count('pages', len(text_parts))
+            text = '\n\n'.join(text_parts)
+        else:
+            blocks = make_textract_blocks(args.lines)
+            with metrics.stage('textract'):
+                time.sleep(args.latency)
+            with metrics.stage('parse'):
+                result = Document.from_textract_blocks(blocks).to_json()
+            text, lines, words = result['text'], result['lines'], result['words']
+        metrics.count('lines', len(lines))
+        metrics.count('words', len(words))
+        with metrics.stage('save'):
+            put_result(NullS3(), 'bucket', 'id', {'text': text, 'lines': lines, 'words': words})
+    return metrics.record()
+
+
+# Singular and plural (or accented and plain) spellings that must reach the same search term
+SEARCH_TERM_PAIRS = [
+    ('pizza', 'pizze'), ('tagliatella', 'tagliatelle'), ('vino', 'vini'), ('pane', 'pani'),
+    ('Caffè', 'caffe'), ('Crème brûlée', 'creme brulee'),
+]
+
+
+def check_tokens(args):
+    """Fails if a pair in SEARCH_TERM_PAIRS tokenizes differently, i.e. a search for one misses the other."""
+    from search_index import tokenize
+    ok = True
+    for a, b in SEARCH_TERM_PAIRS:
+        same = tokenize(a) == tokenize(b)
+        ok = ok and same
+        print(f"  {a!r} -> {tokenize(a)}  {b!r} -> {tokenize(b)}{'' if same else '  MISMATCH'}")
+    print(f"{'OK' if ok else 'FAIL'} search tokenizer: {len(SEARCH_TERM_PAIRS)} spelling pairs")
+    return ok
+
+
+def read_emf_records(path):
+    """EMF records from a log export: one JSON object per line, possibly after a timestamp prefix."""
+    records = []
+    with open(path) as f:
+        for line in f:
+            start = line.find('{')
+            if start < 0 or '"_aws"' not in line:
+                continue
+            try:
+                records.append(json.loads(line[start:]))
+            except ValueError:
+                continue
+    return records
+
+
+def bench_stages(args):
+    """Mean time per pipeline stage by document type, from Lambda EMF logs or a local run."""
+    from metrics import stage_summary
+
+    if args.logs:
+        records = read_emf_records(args.logs)
+        print(f'{len(records)} EMF records from {args.logs}')
+    else:
+        with tempfile.TemporaryDirectory() as workdir:
+            records = [run_local_pipeline(kind, args, workdir) for kind in ('pdf', 'image') for _ in range(args.repeat)]
+        print(f'Local pipeline: {args.pages}-page text PDF and a {args.lines}-line photo '
+              f'(Textract simulated at {args.latency * 1000:.0f} ms, S3 skipped), {args.repeat} run(s) each')
+    for kind, stages in stage_summary(records).items():
+        total = sum(ms for _, ms in stages) or 1
+        print(f'  {kind}:')
+        for name, ms in stages:
+            print(f'    {name[:-3]:<14} {ms:>9.1f} ms  {ms / total * 100:>5.1f}%')
+
+
+class ThrottlingException(Exception):
+    """Shaped like a botocore ClientError for a throttled call."""
+
+    def __init__(self):
+        super().__init__('Rate exceeded')
+        self.response = {'Error': {'Code': 'ThrottlingException'}}
+
+
+class QuotaService:
+    """A service that accepts `limit` calls per sliding second and throttles the rest."""
+
+    def __init__(self, limit, latency):
+        import threading
+        self.limit = limit
+        self.latency = latency
+        self.calls = []
+        self.accepted = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+
+    def detect_document_text(self, Document):
+        with self.lock:
+            now = time.monotonic()
+            self.calls = [t for t in self.calls if now - t < 1.0]
+            if len(self.calls) >= self.limit:
+                self.throttled += 1
+                raise ThrottlingException()
+            self.calls.append(now)
+            self.accepted += 1
+        time.sleep(self.latency)
+        return {'Blocks': []}
+
+
+class CounterTable:
+    """In-memory stand-in for the ocr-rate-limits table: conditional atomic ADD on `calls`."""
+
+    class ConditionalCheckFailedException(Exception):
+        pass
+
+    def __init__(self):
+        import threading
+        import types
+        self.items = {}
+        self.lock = threading.Lock()
+        self.meta = types.SimpleNamespace(client=types.SimpleNamespace(exceptions=self))
+
+    def update_item(self, Key, ExpressionAttributeValues, **kwargs):
+        with self.lock:
+            calls = self.items.get(Key['pk'], 0)
+            if calls >= ExpressionAttributeValues[':limit']:
+                raise self.ConditionalCheckFailedException()
+            self.items[Key['pk']] = calls + ExpressionAttributeValues[':one']
+
+
+def bench_ratelimit(args):
+    """Concurrent callers against a stub with a fixed quota, per limiter setup. Fails unless every
+    call succeeds with the shared limiter, with no throttle or RateLimitExceeded reaching a caller."""
+    from concurrent.futures import ThreadPoolExecutor
+    from rate_limiter import RateLimiter, RateLimitExceeded
+
+    # The window limit must sit below the service quota: the two clocks aren't aligned
+    modes = {
+        'none': lambda: None,
+        'backoff only': lambda: RateLimiter('textract', rate=args.limit),
+        'shared + backoff': lambda: RateLimiter('textract', rate=args.limit * 0.8, table=table),
+    }
+    ok = False
+    print(f'{args.callers} concurrent callers x {args.calls} calls, service quota {args.limit}/s, '
+          f'{args.latency * 1000:.0f} ms per call')
+    for name, make_limiter in modes.items():
+        service = QuotaService(args.limit, args.latency)
+        table = CounterTable()
+        errors = Counter()
+
+        def caller(_):
+            # One limiter per caller, like one per Lambda container; only the table is shared
+            limiter = make_limiter()
+            for _ in range(args.calls):
+                try:
+                    if limiter is None:
+                        service.detect_document_text(Document={})
+                    else:
+                        limiter.call(service.detect_document_text, Document={})
+                except (ThrottlingException, RateLimitExceeded) as e:
+                    errors[type(e).__name__] += 1
+
+        start = time.perf_counter()
+        # Silence the limiter's per-throttle log lines
+        with contextlib.redirect_stdout(io.StringIO()), ThreadPoolExecutor(max_workers=args.callers) as pool:
+            list(pool.map(caller, range(args.callers)))
+        elapsed = time.perf_counter() - start
+        total = args.callers * args.calls
+        print(f'  {name:<17} {service.accepted}/{total} succeeded, {service.throttled} throttled responses, '
+              f'{sum(errors.values())} errors to callers, {elapsed:.1f}s ({service.accepted / elapsed:.1f}/s)')
+        if name == 'shared + backoff':
+            ok = service.accepted == total and not errors
+    print(f"{'OK' if ok else 'FAIL'} shared limiter: no caller-visible throttles")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local benchmarks and checks for the OCR Lambda extraction paths')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rss = sub.add_parser('rss', help='peak memory of PDF extraction vs page count')
+    rss.add_argument('--pages', type=int, nargs='+', default=[1, 10, 50, 100, 200])
+    rss.add_argument('--image-kb', type=int, default=256, help='scanned image size per page')
+    rss.add_argument('--modes', nargs='+', default=list(MODES), choices=list(MODES))
+    rss.add_argument('--max-growth-mb', type=float, default=8,
+                     help='most the streaming peak RSS may grow from the smallest to the largest PDF')
+    rss.set_defaults(func=bench_rss)
+
+    workers = sub.add_parser('workers', help='PDF pages/sec vs worker process count')
+    workers.add_argument('--pages', type=int, default=120)
+    workers.add_argument('--lines', type=int, default=60, help='text lines per page')
+    workers.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 6])
+    workers.set_defaults(func=bench_workers)
+
+    engines = sub.add_parser('engines', help='compare PDF engines on a corpus of menu PDFs')
+    engines.add_argument('--corpus', help='directory of PDFs (default: synthetic menus)')
+    engines.add_argument('--engines', nargs='+', default=['pypdf', 'pymupdf'])
+    engines.set_defaults(func=bench_engines)
+
+    jobs = sub.add_parser('async', help='async Textract job flow against a stub that simulates delay')
+    jobs.add_argument('--delay', type=float, default=3.0, help='seconds until the stub job finishes')
+    jobs.add_argument('--interval', type=float, default=1.0, help='seconds between polls')
+    jobs.add_argument('--pages', type=int, default=20)
+    jobs.add_argument('--lines', type=int, default=1200)
+    jobs.set_defaults(func=bench_async)
+
+    parse = sub.add_parser('parse', help='Textract block parsing: legacy dicts vs the Document model')
+    parse.add_argument('--blocks', type=int, default=10000)
+    parse.add_argument('--pages', type=int, default=10)
+    parse.add_argument('--repeat', type=int, default=5)
+    parse.set_defaults(func=bench_parse)
+
+    offload = sub.add_parser('offload', help='DynamoDB item size with results inline vs in gzip S3 bodies')
+    offload.add_argument('--lines', type=int, nargs='+', default=[50, 200, 1000, 3000])
+    offload.set_defaults(func=bench_offload)
+
+    compact = sub.add_parser('compact', help='/ocr response size and parse time, word objects vs columnar')
+    compact.add_argument('--lines', type=int, default=2000)
+    compact.add_argument('--repeat', type=int, default=5)
+    compact.set_defaults(func=bench_compact)
+
+    preprocess = sub.add_parser('preprocess', help='image preprocessing: bytes saved and time per stage')
+    preprocess.add_argument('--images', help='directory of menu photos (default: synthetic photos)')
+    preprocess.set_defaults(func=bench_preprocess)
+
+    tiles = sub.add_parser('tiles', help='tiled OCR: overlap de-duplication and latency vs concurrency')
+    tiles.add_argument('--width', type=int, default=8000)
+    tiles.add_argument('--height', type=int, default=6000)
+    tiles.add_argument('--latency', type=float, default=0.5, help='simulated seconds per Textract call')
+    tiles.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8])
+    tiles.set_defaults(func=bench_tiles)
+
+    ratelimit = sub.add_parser('ratelimit', help='concurrent callers against a throttled service, with and without rate_limiter')
+    ratelimit.add_argument('--callers', type=int, default=50)
+    ratelimit.add_argument('--calls', type=int, default=4, help='calls per caller')
+    ratelimit.add_argument('--limit', type=float, default=25, help='service quota in calls per second')
+    ratelimit.add_argument('--latency', type=float, default=0.05, help='seconds per accepted call')
+    ratelimit.set_defaults(func=bench_ratelimit)
+
+    stages = sub.add_parser('stages', help='mean time per OCR pipeline stage by document type (EMF metrics)')
+    stages.add_argument('--logs', help='CloudWatch log export of the OCR Lambda (default: run a local pipeline)')
+    stages.add_argument('--pages', type=int, default=20)
+    stages.add_argument('--lines', type=int, default=600, help='text lines per PDF page / in the photo')
+    stages.add_argument('--latency', type=float, default=1.2, help='simulated Textract seconds')
+    stages.add_argument('--repeat', type=int, default=3)
+    stages.set_defaults(func=bench_stages)
+
+    tokens = sub.add_parser('tokens', help='search tokenizer: singular/plural and accented spellings meet')
+    tokens.set_defaults(func=check_tokens)
+
+    child = sub.add_parser('_child')
+    child.add_argument('mode', choices=list(MODES))
+    child.add_argument('path')
+    child.add_argument('--engine', default='pypdf')
+    child.add_argument('--text-out')
+    child.set_defaults(func=run_child)
+
+    tile_child = sub.add_parser('_tile_child')
+    tile_child.add_argument('path')
+    tile_child.add_argument('concurrency', type=int)
+    tile_child.add_argument('latency', type=float)
+    tile_child.set_defaults(func=run_tile_child)
+
+    args = parser.parse_args()
+    # Checks (rss, async, ratelimit, tokens) return False on failure; the other benchmarks only print
+    if args.func(args) is False:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
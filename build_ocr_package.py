@@ -0,0 +1,238 @@
+import argparse
+import compileall
+import os
+import py_compile
+import re
+import shutil
+import subprocess
+import sys
+
+# Builds lambda/build/ocr_package, the directory terraform zips for the OCR, worker, thumbnail and
+# file status Lambdas: a copy of lambda/ocr_package without files the handlers never load, plus the
+# Linux builds of its compiled dependencies, with bytecode precompiled so a cold start doesn't spend
+# INIT time compiling.
+ROOT = os.path.dirname(os.path.abspath(__file__))
+SOURCE_DIR = os.path.join(ROOT, 'lambda', 'ocr_package')
+BUILD_DIR = os.path.join(ROOT, 'lambda', 'build', 'ocr_package')
+NATIVE_DIR = os.path.join(ROOT, 'lambda', 'build', 'native')
+
+# Compiled dependencies, installed as manylinux wheels for the Lambda runtime (x86_64, Python 3.11)
+# whatever machine runs the build; a copy built for another platform has no usable _imaging / _mupdf.
+# python3.11 runs on Amazon Linux 2 (glibc 2.26): PyMuPDF after 1.26.0 only ships manylinux_2_28 wheels.
+NATIVE_PACKAGES = ('pillow==12.1.1', 'pymupdf==1.26.0')
+NATIVE_PLATFORM = 'manylinux2014_x86_64'
+NATIVE_PYTHON = '3.11'
+
+# Modules shared with the single-file Lambdas live only under lambda/; the build copies them in
+SHARED_DIR = os.path.join(ROOT, 'lambda')
+SHARED_MODULES = ('rate_limiter.py', 'collection_version.py')
+
+# Nothing in the OCR package connects to PostgreSQL; pg8000 and its dependencies are leftovers
+# (the runtime's boto3 brings its own dateutil)
+UNUSED_PACKAGES = {'pg8000', 'scramp', 'asn1crypto', 'dateutil', 'six.py', 'bin', '__pycache__'}
+# Come from NATIVE_PACKAGES instead, if a local install left them in the source tree
+NATIVE_MODULES = {'PIL', 'fitz', 'pymupdf'}
+UNUSED_SUFFIXES = ('.dist-info', '.pyi', '.exe', '.pyc')
+# Uploads are JPEG (MPO on some phones), PNG or TIFF; thumbnails are written as WebP.
+# Pillow imports its format plugins inside try/except ImportError, so missing ones are skipped.
+PIL_PLUGINS = {'JpegImagePlugin', 'MpoImagePlugin', 'PngImagePlugin', 'TiffImagePlugin', 'WebPImagePlugin'}
+UNUSED_PIL_MODULES = {
+    'ImageTk', 'ImageQt', 'ImageGrab', 'ImageShow', 'ImageWin', '_tkinter_finder', 'ImageDraw2', 'PSDraw',
+    'BdfFontFile', 'PcfFontFile', 'FontFile', 'GimpGradientFile', 'GimpPaletteFile', 'WalImageFile', 'GdImageFile',
+    'report', '__main__',
+}
+
+# Handler modules whose import is the Lambda INIT phase, and what that import may cost
+HANDLER_MODULES = ('lambda_ocr', 'thumbnails', 'file_status')
+IMPORT_BUDGET_MS = float(os.environ.get('IMPORT_BUDGET_MS', '60'))
+# Imported at INIT by boto3 itself; the budget only covers our code and what it pulls in
+RUNTIME_PACKAGES = ('boto3', 'botocore', 's3transfer', 'jmespath', 'urllib3', 'dateutil', 'six')
+# Must only be imported by the branch that needs them
+LAZY_PACKAGES = ('pypdf', 'fitz', 'pymupdf', 'PIL', 'pdf2image', 'multiprocessing')
+
+
+def python_path(package_dir):
+    # The source tree has no copy of the shared modules; a built package must carry its own.
+    # An inherited PYTHONPATH stays after them, since boto3 may only be installed there.
+    paths = [package_dir] + ([SHARED_DIR] if package_dir == SOURCE_DIR else [])
+    if os.environ.get('PYTHONPATH'):
+        paths.append(os.environ['PYTHONPATH'])
+    return os.pathsep.join(paths)
+
+
+def is_unused(directory, name):
+    if name in UNUSED_PACKAGES or name.endswith(UNUSED_SUFFIXES):
+        return True
+    if directory == SOURCE_DIR and name in NATIVE_MODULES:
+        return True
+    if os.path.basename(directory) == 'PIL':
+        module = name.split('.')[0]
+        if module.endswith('ImagePlugin') and module not in PIL_PLUGINS:
+            return True
+        return module in UNUSED_PIL_MODULES
+    return False
+
+
+def build(output=BUILD_DIR):
+    shutil.rmtree(output, ignore_errors=True)
+    dropped = [0, 0]
+
+    def ignore(directory, names):
+        skipped = [name for name in names if is_unused(directory, name)]
+        for name in skipped:
+            path = os.path.join(directory, name)
+            dropped[0] += 1
+            dropped[1] += directory_size(path)
+        return skipped
+
+    shutil.copytree(SOURCE_DIR, output, ignore=ignore)
+    install_native_packages()
+    shutil.copytree(NATIVE_DIR, output, ignore=ignore, dirs_exist_ok=True)
+    for name in SHARED_MODULES:
+        shutil.copyfile(os.path.join(SHARED_DIR, name), os.path.join(output, name))
+    # Unchecked-hash .pyc files are used without comparing source timestamps, which the zip doesn't keep
+    compileall.compile_dir(
+        output, quiet=1, optimize=0, workers=0,
+        invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH
+    )
+    print(f"Built {os.path.relpath(output, ROOT)}: {directory_size(output) / 1e6:.1f} MB, "
+          f"dropped {dropped[0]} unused entries ({dropped[1] / 1e6:.1f} MB)")
+    if sys.version_info[:2] != (3, 11):
+        print(f"Warning: bytecode compiled with Python {sys.version_info[0]}.{sys.version_info[1]}; "
+              f"the Lambda runtime (3.11) will ignore it")
+
+
+def install_native_packages(target=NATIVE_DIR):
+    """pip-install NATIVE_PACKAGES as Lambda-runtime wheels into target (reused while the pins don't change)."""
+    stamp = target + '.packages'
+    wanted = '\n'.join(NATIVE_PACKAGES + (NATIVE_PLATFORM, NATIVE_PYTHON))
+    if os.path.exists(stamp):
+        with open(stamp) as f:
+            if f.read() == wanted:
+                return
+    shutil.rmtree(target, ignore_errors=True)
+    subprocess.run(
+        [sys.executable, '-m', 'pip', 'install', '--quiet', '--no-deps', '--only-binary=:all:',
+         '--platform', NATIVE_PLATFORM, '--python-version', NATIVE_PYTHON, '--implementation', 'cp',
+         '--target', target, *NATIVE_PACKAGES],
+        check=True
+    )
+    with open(stamp, 'w') as f:
+        f.write(wanted)
+    print(f"Installed {', '.join(NATIVE_PACKAGES)} for {NATIVE_PLATFORM} / Python {NATIVE_PYTHON}")
+
+
+def directory_size(path):
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(path) for f in files)
+
+
+def import_tree(package_dir, module):
+    """(depth, module name, cumulative ms) for `import module`, parents before children, from -X importtime."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=package_dir, capture_output=True, text=True,
+        env={**os.environ, 'PYTHONPATH': python_path(package_dir), 'AWS_DEFAULT_REGION': 'eu-west-2'}
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"import {module} failed: {result.stderr.strip().splitlines()[-1]}")
+    entries = []
+    for line in result.stderr.splitlines():
+        match = re.match(r'import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)', line)
+        if match:
+            entries.append((len(match.group(2)) // 2, match.group(3), int(match.group(1)) / 1000))
+    # importtime lists children before their parent
+    entries.reverse()
+    # Only the handler's own subtree: interpreter start-up (site, encodings, ...) comes before it
+    for i, (depth, name, _) in enumerate(entries):
+        if depth == 0 and name == module:
+            end = next((j for j in range(i + 1, len(entries)) if entries[j][0] == 0), len(entries))
+            return entries[i:end]
+    raise RuntimeError(f"import {module} not found in -X importtime output")
+
+
+def import_cost(tree):
+    """(ms excluding RUNTIME_PACKAGES subtrees, {direct child: ms}, lazy packages that were imported)."""
+    total = tree[0][2]
+    runtime_depth = None
+    children = {}
+    eager = set()
+    for depth, name, ms in tree[1:]:
+        package = name.split('.')[0]
+        if runtime_depth is not None and depth > runtime_depth:
+            continue
+        runtime_depth = None
+        if package in RUNTIME_PACKAGES:
+            # boto3 and friends are loaded by every Lambda here; charge only our own code
+            total -= ms
+            runtime_depth = depth
+            continue
+        if package in LAZY_PACKAGES:
+            eager.add(package)
+        if depth == 1:
+            children[name] = ms
+    return total, children, sorted(eager)
+
+
+def check_imports(package_dir=BUILD_DIR, modules=HANDLER_MODULES, budget_ms=IMPORT_BUDGET_MS):
+    """Fail if importing a handler loads a lazy package or costs more than the budget."""
+    ok = True
+    for module in modules:
+        try:
+            total, children, eager = import_cost(import_tree(package_dir, module))
+        except RuntimeError as e:
+            print(f"FAIL {e}")
+            ok = False
+            continue
+        slowest = ', '.join(f'{name} {ms:.1f}' for name, ms in sorted(children.items(), key=lambda i: -i[1])[:5])
+        status = 'OK' if total <= budget_ms and not eager else 'FAIL'
+        print(f"{status} import {module}: {total:.1f} ms excluding boto3 (budget {budget_ms:.0f} ms); "
+              f"slowest imports: {slowest or '-'}")
+        if eager:
+            print(f"  imported at INIT but should be lazy: {', '.join(eager)}")
+        ok = ok and status == 'OK'
+    return ok
+
+
+def check_native(package_dir=BUILD_DIR):
+    """Fail if Pillow's or MuPDF's compiled extension doesn't load from the package.
+
+    Image preprocessing, tiling, thumbnails and scanned-page OCR only log their ImportError at run
+    time, so a package built with the wrong wheels deploys fine and quietly does none of them. The
+    check can only run where the build host matches the Lambda runtime.
+    """
+    if not (sys.platform == 'linux' and os.uname().machine == 'x86_64'
+            and '.'.join(map(str, sys.version_info[:2])) == NATIVE_PYTHON):
+        print(f"SKIP native imports: only checkable on Linux x86_64 with Python {NATIVE_PYTHON}")
+        return True
+    result = subprocess.run(
+        [sys.executable, '-c', 'import PIL._imaging, PIL._webp, fitz'],
+        cwd=package_dir, capture_output=True, text=True, env={**os.environ, 'PYTHONPATH': package_dir}
+    )
+    if result.returncode != 0:
+        print(f"FAIL native imports: {result.stderr.strip().splitlines()[-1]}")
+        return False
+    print("OK native imports: PIL._imaging, PIL._webp, fitz")
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the OCR Lambda package and check its cold-start import cost')
+    parser.add_argument('--check', action='store_true',
+                        help='only check the import budget of lambda/ocr_package, without building')
+    parser.add_argument('--modules', nargs='+', default=list(HANDLER_MODULES), help='handler modules to import')
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+
+    package_dir = SOURCE_DIR if args.check else BUILD_DIR
+    if not args.check:
+        build()
+        if not check_native(package_dir):
+            sys.exit(1)
+    if not check_imports(package_dir, args.modules, args.budget_ms):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
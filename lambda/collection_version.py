@@ -0,0 +1,75 @@
+import os
+import hashlib
+
+# One version counter per collection (extractions, menu, todos) in VERSIONS_TABLE, bumped with an
+# atomic ADD on every write. Reads return it as an ETag, so a client that already has the current
+# version gets 304 from one GetItem on this table instead of a query and re-serialization.
+# The only copy: build_ocr_package.py and the terraform zips of the other Lambdas bundle this file.
+VERSIONS_TABLE = os.environ.get('VERSIONS_TABLE')
+
+_table = None
+
+
+def versions_table():
+    global _table
+    if _table is None and VERSIONS_TABLE:
+        import boto3
+        _table = boto3.resource('dynamodb', region_name='eu-west-2').Table(VERSIONS_TABLE)
+    return _table
+
+
+def bump_version(collection, table=None):
+    """Mark the collection as changed; returns the new version, or None without a table or on error."""
+    table = table or versions_table()
+    if table is None:
+        return None
+    try:
+        response = table.update_item(
+            Key={'collection': collection},
+            UpdateExpression='ADD version :one',
+            ExpressionAttributeValues={':one': 1},
+            ReturnValues='UPDATED_NEW'
+        )
+        return int(response['Attributes']['version'])
+    except Exception as e:
+        # A missed bump only costs clients a stale 304 until the next write; never fail the write
+        print(f"Version bump error for {collection}: {e}")
+        return None
+
+
+def current_version(collection, table=None):
+    """The collection's version (0 before its first write), or None without a table or on error."""
+    table = table or versions_table()
+    if table is None:
+        return None
+    try:
+        item = table.get_item(Key={'collection': collection}, ConsistentRead=True).get('Item')
+        return int(item['version']) if item else 0
+    except Exception as e:
+        print(f"Version read error for {collection}: {e}")
+        return None
+
+
+def collection_etag(collection, version, params=None):
+    """Weak ETag for one representation: the version plus a digest of the query parameters."""
+    if version is None:
+        return None
+    variant = '&'.join(f'{k}={v}' for k, v in sorted((params or {}).items()))
+    digest = hashlib.sha1(variant.encode('utf-8')).hexdigest()[:8]
+    return f'W/"{collection}-{version}-{digest}"'
+
+
+def is_not_modified(event, etag):
+    """True if the request's If-None-Match already names this ETag."""
+    if not etag:
+        return False
+    headers = {k.lower(): v for k, v in (event.get('headers') or {}).items()}
+    candidates = [tag.strip() for tag in headers.get('if-none-match', '').split(',')]
+    return etag in candidates or '*' in candidates
+
+
+def not_modified_response(etag):
+    return {
+        'statusCode': 304,
+        'headers': {'Access-Control-Allow-Origin': '*', 'ETag': etag}
+    }
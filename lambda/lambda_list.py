@@ -1,6 +1,14 @@
 import os
 import json
 import boto3
+# Bundled from lambda/ocr_package by the list_lambda_zip archive
+import compact_format
+from result_store import get_result, write_result
+from near_duplicates import remove_signature
+from extraction_list import SUMMARY_PROJECTION, page_size, query_page
+from search_index import index_document, remove_document, search, load_items
+from collection_version import bump_version, current_version, collection_etag, is_not_modified, not_modified_response
+
 
 def lambda_handler(event, context):
     table_name = os.environ['TABLE_NAME']
@@ -21,7 +29,15 @@ def lambda_handler(event, context):
                 'body': json.dumps({'error': 'Missing id parameter'})
             }
         try:
+            item = table.get_item(Key={'id': item_id}).get('Item') or {}
             table.delete_item(Key={'id': item_id})
+            if item.get('result_key'):
+                s3_client.delete_object(Bucket=bucket, Key=item['result_key'])
+            if item.get('simhash') and os.environ.get('SIMHASH_TABLE'):
+                remove_signature(dynamodb.Table(os.environ['SIMHASH_TABLE']), item_id, item['simhash'])
+            if os.environ.get('SEARCH_TABLE'):
+                remove_document(dynamodb.Table(os.environ['SEARCH_TABLE']), item_id)
+            bump_version('extractions')
         except Exception as e:
             return {
                 'statusCode': 500,
@@ -49,12 +65,28 @@ def lambda_handler(event, context):
                 'body': json.dumps({'error': 'Missing id or text'})
             }
         try:
-            table.update_item(
-                Key={'id': item_id},
-                UpdateExpression='SET #t = :t, corrected = :c',
-                ExpressionAttributeNames={'#t': 'text'},
-                ExpressionAttributeValues={':t': corrected_text, ':c': True}
-            )
+            item = table.get_item(Key={'id': item_id}).get('Item') or {}
+            if item.get('result_key'):
+                # Offloaded result: rewrite the S3 body, keep only the flag in DynamoDB
+                result = get_result(s3_client, bucket, item['result_key'])
+                result['text'] = corrected_text
+                write_result(s3_client, bucket, item['result_key'], result)
+                table.update_item(
+                    Key={'id': item_id},
+                    UpdateExpression='SET corrected = :c',
+                    ExpressionAttributeValues={':c': True}
+                )
+            else:
+                table.update_item(
+                    Key={'id': item_id},
+                    UpdateExpression='SET #t = :t, corrected = :c',
+                    ExpressionAttributeNames={'#t': 'text'},
+                    ExpressionAttributeValues={':t': corrected_text, ':c': True}
+                )
+            # Search by the corrected text from now on
+            if os.environ.get('SEARCH_TABLE'):
+                index_document(dynamodb.Table(os.environ['SEARCH_TABLE']), item_id, corrected_text)
+            bump_version('extractions')
         except Exception as e:
             return {
                 'statusCode': 500,
@@ -67,37 +99,130 @@ def lambda_handler(event, context):
             'body': json.dumps({'updated': item_id})
         }
 
-    # GET: list all extractions
+    params = event.get('queryStringParameters') or {}
+
+    # GET /search?q=...: extractions ranked by the query terms they contain, from the search index alone
+    path = event.get('rawPath') or event.get('requestContext', {}).get('http', {}).get('path', '')
+    if path.endswith('/search'):
+        query = (params.get('q') or '').strip()
+        if not query or not os.environ.get('SEARCH_TABLE'):
+            return {
+                'statusCode': 400,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': 'Missing q parameter' if not query else 'Search is not configured'})
+            }
+        etag = collection_etag('extractions', current_version('extractions'), {**params, 'route': 'search'})
+        if is_not_modified(event, etag):
+            return not_modified_response(etag)
+        try:
+            limit = page_size(params.get('limit'))
+            hits = search(dynamodb.Table(os.environ['SEARCH_TABLE']), query, limit)
+            # Summary columns of the hits; ids of extractions deleted meanwhile drop out here
+            items = load_items(dynamodb, table_name, [item_id for item_id, _, _ in hits], **SUMMARY_PROJECTION)
+            ranking = {item_id: (score, terms) for item_id, score, terms in hits}
+            for item in items:
+                item['score'], item['matched'] = ranking[item['id']]
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': f'Invalid limit parameter: {str(e)}'})
+            }
+        except Exception as e:
+            return {
+                'statusCode': 500,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': str(e)})
+            }
+        return {
+            'statusCode': 200,
+            'headers': {'Access-Control-Allow-Origin': '*', **({'ETag': etag} if etag else {})},
+            'body': json.dumps({'query': query, 'results': items}, default=lambda d: int(d) if d == int(d) else float(d))
+        }
+
+    # GET /extractions/{id} (or ?id=...): one extraction with its full text, lines and words (fetched from S3)
+    item_id = (event.get('pathParameters') or {}).get('id') or params.get('id')
+    if item_id:
+        etag = collection_etag('extractions', current_version('extractions'), {**params, 'id': item_id})
+        if is_not_modified(event, etag):
+            return not_modified_response(etag)
+        try:
+            item = table.get_item(Key={'id': item_id}).get('Item')
+            if not item:
+                return {
+                    'statusCode': 404,
+                    'headers': {'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({'error': 'Extraction not found'})
+                }
+            if item.get('result_key'):
+                result = get_result(s3_client, bucket, item['result_key'])
+                item['text'] = result.get('text', '')
+                item['lines'] = result.get('lines', [])
+                item['words'] = result.get('words', [])
+            # ?format=compact: columnar lines/words, as /ocr returns them
+            if params.get('format') == 'compact' and 'lines' in item:
+                lines = json.loads(json.dumps(item.pop('lines'), default=float))
+                words = json.loads(json.dumps(item.pop('words', []), default=float))
+                pack = (params.get('pack') or '').lower() in ('1', 'true')
+                item['compact'] = compact_format.encode(lines, words, pack=pack)
+        except Exception as e:
+            return {
+                'statusCode': 500,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': str(e)})
+            }
+        return {
+            'statusCode': 200,
+            'headers': {'Access-Control-Allow-Origin': '*', **({'ETag': etag} if etag else {})},
+            'body': json.dumps({'extraction': item}, default=lambda d: int(d) if d == int(d) else float(d))
+        }
+
+    # Conditional GET: the version is read before the data, so a response never carries a newer ETag
+    etag = collection_etag('extractions', current_version('extractions'), params)
+    if is_not_modified(event, etag):
+        return not_modified_response(etag)
+
+    # GET: one page of extractions, newest first, from the timestamp index
     try:
-        response = table.scan()
-        items = response.get('Items', [])
-        # Sort by timestamp (most recent first) instead of filtering duplicates
-        items.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        items = items[:20]  # Limit to 20 most recent extractions
+        limit = page_size(params.get('limit'))
+        # Summary columns only: the list never carries text, lines or words
+        items, next_cursor = query_page(table, limit, params.get('next'), **SUMMARY_PROJECTION)
+    except ValueError as e:
+        return {
+            'statusCode': 400,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'Invalid limit or next parameter: {str(e)}'})
+        }
+    except Exception as e:
+        return {
+            'statusCode': 500,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': str(e)})
+        }
+    try:
+        # ?collapse=1: one entry per menu, the newest upload of each group of near-duplicates on this page
+        if (params.get('collapse') or '').lower() in ('1', 'true'):
+            groups = {}
+            for item in items:
+                group = item.get('duplicate_of') or item['id']
+                if group in groups:
+                    groups[group]['duplicates'] += 1
+                else:
+                    item['duplicates'] = 0
+                    groups[group] = item
+            items = list(groups.values())
         for item in items:
             if 'line_count' in item:
                 item['line_count'] = int(item['line_count'])
             if 'avg_confidence' in item:
                 item['avg_confidence'] = float(item['avg_confidence'])
-            if 'words' in item:
-                # Convert Decimal confidence values to float for JSON serialization
-                for word in item['words']:
-                    if 'confidence' in word:
-                        word['confidence'] = float(word['confidence'])
             if 'corrected' not in item:
                 item['corrected'] = False
-            # Check if S3 file exists
-            s3_key = item.get('s3_key')
-            if s3_key:
-                try:
-                    s3_client.head_object(Bucket=bucket, Key=s3_key)
-                    item['file_exists'] = True
-                except s3_client.exceptions.NoSuchKey:
-                    item['file_exists'] = False
-                except Exception:
-                    item['file_exists'] = False  # Assume missing on error
-            else:
+            # Kept current by S3 events (file_status.py); records never reconciled are assumed present
+            if not item.get('s3_key'):
                 item['file_exists'] = False
+            elif 'file_exists' not in item:
+                item['file_exists'] = True
     except Exception as e:
         return {
             'statusCode': 500,
@@ -107,6 +232,6 @@ def lambda_handler(event, context):
 
     return {
         'statusCode': 200,
-        'headers': {'Access-Control-Allow-Origin': '*'},
-        'body': json.dumps({'extractions': items})
+        'headers': {'Access-Control-Allow-Origin': '*', **({'ETag': etag} if etag else {})},
+        'body': json.dumps({'extractions': items, 'next': next_cursor}, default=lambda d: int(d) if d == int(d) else float(d))
     }
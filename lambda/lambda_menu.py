@@ -6,6 +6,8 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from boto3.dynamodb.conditions import Attr
 import base64
+from rate_limiter import RateLimitExceeded, BEDROCK_OPERATIONS, rate_limited
+from collection_version import bump_version, current_version, collection_etag, is_not_modified, not_modified_response
 
 def lambda_handler(event, context):
     bucket = os.environ['BUCKET']
@@ -16,7 +18,7 @@ def lambda_handler(event, context):
     dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
     table = dynamodb.Table(table_name)
     s3 = boto3.client('s3', region_name='eu-west-2')
-    bedrock = boto3.client('bedrock-runtime', region_name='eu-west-2')
+    bedrock = rate_limited(boto3.client('bedrock-runtime', region_name='eu-west-2'), BEDROCK_OPERATIONS)
 
     if method == 'GET' and path == '/menu':
         extraction_id = event.get('queryStringParameters', {}).get('extraction_id')
@@ -26,6 +28,10 @@ def lambda_handler(event, context):
                 'headers': {'Access-Control-Allow-Origin': '*'},
                 'body': json.dumps({'error': 'Missing extraction_id'})
             }
+        # Unchanged since the client's copy: answer 304 without scanning the menu table
+        etag = collection_etag('menu', current_version('menu'), {'extraction_id': extraction_id})
+        if is_not_modified(event, etag):
+            return not_modified_response(etag)
         try:
             response = table.scan(
                 FilterExpression=Attr('extraction_id').eq(extraction_id)
@@ -37,7 +43,7 @@ def lambda_handler(event, context):
                     item['ptb'] = float(item['ptb'])
             return {
                 'statusCode': 200,
-                'headers': {'Access-Control-Allow-Origin': '*'},
+                'headers': {'Access-Control-Allow-Origin': '*', **({'ETag': etag} if etag else {})},
                 'body': json.dumps({'menu_items': items})
             }
         except Exception as e:
@@ -57,7 +63,8 @@ def lambda_handler(event, context):
         ptb = Decimal(str(body['ptb']))
 
         # Generate image
-        prompt = f"A delicious, appetizing photo of {dish_name} dish made with {', '.join([f'{ing['quantity']} {ing['name']}' for ing in ingredients])}"
+        ingredient_list = ', '.join(f"{ing['quantity']} {ing['name']}" for ing in ingredients)
+        prompt = f"A delicious, appetizing photo of {dish_name} dish made with {ingredient_list}"
         try:
             response = bedrock.invoke_model(
                 modelId='amazon.titan-image-generator-v1',
@@ -99,12 +106,19 @@ def lambda_handler(event, context):
                 'image_key': image_key,
                 'timestamp': timestamp
             })
+            bump_version('menu')
 
             return {
                 'statusCode': 200,
                 'headers': {'Access-Control-Allow-Origin': '*'},
                 'body': json.dumps({'id': item_id, 'image_key': image_key})
             }
+        except RateLimitExceeded as e:
+            return {
+                'statusCode': 429,
+                'headers': {'Access-Control-Allow-Origin': '*', 'Retry-After': str(int(e.retry_after) + 1)},
+                'body': json.dumps({'error': str(e)})
+            }
         except Exception as e:
             return {
                 'statusCode': 500,
@@ -128,7 +142,8 @@ def lambda_handler(event, context):
                           current_item['ingredients'] != ingredients)
 
             if regenerate:
-                prompt = f"A delicious, appetizing photo of {dish_name} dish made with {', '.join([f'{ing['quantity']} {ing['name']}' for ing in ingredients])}"
+                ingredient_list = ', '.join(f"{ing['quantity']} {ing['name']}" for ing in ingredients)
+                prompt = f"A delicious, appetizing photo of {dish_name} dish made with {ingredient_list}"
                 response = bedrock.invoke_model(
                     modelId='amazon.titan-image-generator-v1',
                     body=json.dumps({
@@ -169,12 +184,19 @@ def lambda_handler(event, context):
                     ':ik': image_key
                 }
             )
+            bump_version('menu')
 
             return {
                 'statusCode': 200,
                 'headers': {'Access-Control-Allow-Origin': '*'},
                 'body': json.dumps({'updated': item_id})
             }
+        except RateLimitExceeded as e:
+            return {
+                'statusCode': 429,
+                'headers': {'Access-Control-Allow-Origin': '*', 'Retry-After': str(int(e.retry_after) + 1)},
+                'body': json.dumps({'error': str(e)})
+            }
         except Exception as e:
             return {
                 'statusCode': 500,
@@ -195,6 +217,7 @@ def lambda_handler(event, context):
             table.delete_item(Key={'id': item_id})
             if 'image_key' in item:
                 s3.delete_object(Bucket=bucket, Key=item['image_key'])
+            bump_version('menu')
             return {
                 'statusCode': 200,
                 'headers': {'Access-Control-Allow-Origin': '*'},
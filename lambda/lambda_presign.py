@@ -2,6 +2,7 @@ import os
 import json
 import boto3
 from botocore.config import Config
+from boto3.dynamodb.conditions import Key
 import pg8000
 
 def lambda_handler(event, context):
@@ -54,23 +55,32 @@ def lambda_handler(event, context):
 
     s3_key = f"r/{restaurant}/{key}"  # Simplified S3 key with just restaurant_id/filename
 
-    # Check for duplicate hash - temporarily removed for debugging
-    # try:
-    #     dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
-    #     table = dynamodb.Table(table_name)
-    #     response = table.scan(
-    #         FilterExpression=boto3.dynamodb.conditions.Attr('hash').eq(hash_value)
-    #     )
-    #     if response['Items']:
-    #         return {
-    #             'statusCode': 409,
-    #             'headers': {'Access-Control-Allow-Origin': '*},
-    #             'body': json.dumps({'error': 'Image has already been processed'})
-    #     }
-    # except Exception as e:
-    #     # If DynamoDB check fails, log the error but allow upload
-    #     print(f"DynamoDB check failed: {e}")
-    #     pass
+    # Content already extracted? Tell the browser to skip the upload and fetch the cached result
+    try:
+        dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
+        table = dynamodb.Table(table_name)
+        response = table.query(
+            IndexName='hash-index',
+            KeyConditionExpression=Key('hash').eq(hash_value.lower())
+        )
+        for match in response['Items']:
+            existing = table.get_item(Key={'id': match['id']}).get('Item')
+            # Only this restaurant's copy, and only while the upload is still there: otherwise the
+            # browser would skip the upload for a key that is gone or belongs to someone else
+            if (existing and existing.get('s3_key', '').startswith(f"r/{restaurant}/")
+                    and existing.get('file_exists') is not False):
+                return {
+                    'statusCode': 200,
+                    'headers': {'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({
+                        'duplicate': True,
+                        'id': existing['id'],
+                        's3_key': existing['s3_key']
+                    })
+                }
+    except Exception as e:
+        # If the DynamoDB check fails, log the error but allow upload
+        print(f"DynamoDB check failed: {e}")
 
     url = s3.generate_presigned_url(
         ClientMethod='put_object',
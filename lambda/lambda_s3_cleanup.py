@@ -2,6 +2,17 @@ import os
 import json
 import pg8000
 import boto3
+from urllib.parse import unquote_plus
+
+
+def s3_records(event):
+    """S3 records from a direct bucket notification or from the ocr-s3-events SNS topic."""
+    for record in event.get('Records', []):
+        if 'Sns' in record:
+            yield from s3_records(json.loads(record['Sns']['Message']))
+        elif 's3' in record:
+            yield record
+
 
 def lambda_handler(event, context):
     # Database connection
@@ -15,8 +26,8 @@ def lambda_handler(event, context):
     cursor = conn.cursor()
 
     # Process S3 events
-    for record in event['Records']:
-        s3_key = record['s3']['object']['key']
+    for record in s3_records(event):
+        s3_key = unquote_plus(record['s3']['object']['key'])
         print(f"Processing S3 event for object: {s3_key}")
 
         if record['eventName'].startswith('ObjectCreated'):
@@ -3,6 +3,7 @@ import json
 import uuid
 import boto3
 from datetime import datetime, timezone
+from collection_version import bump_version, current_version, collection_etag, is_not_modified, not_modified_response
 
 def lambda_handler(event, context):
     table_name = os.environ['TABLE_NAME']
@@ -13,6 +14,10 @@ def lambda_handler(event, context):
     table = dynamodb.Table(table_name)
 
     if method == 'GET' and path == '/todos':
+        # Unchanged since the client's copy: answer 304 without scanning the todo table
+        etag = collection_etag('todos', current_version('todos'))
+        if is_not_modified(event, etag):
+            return not_modified_response(etag)
         try:
             response = table.scan()
             items = response.get('Items', [])
@@ -20,7 +25,7 @@ def lambda_handler(event, context):
             items.sort(key=lambda x: x.get('timestamp', x.get('id', '')), reverse=True)
             return {
                 'statusCode': 200,
-                'headers': {'Access-Control-Allow-Origin': '*'},
+                'headers': {'Access-Control-Allow-Origin': '*', **({'ETag': etag} if etag else {})},
                 'body': json.dumps({'todos': items})
             }
         except Exception as e:
@@ -45,6 +50,7 @@ def lambda_handler(event, context):
                 'completed': completed,
                 'timestamp': timestamp
             })
+            bump_version('todos')
             return {
                 'statusCode': 200,
                 'headers': {'Access-Control-Allow-Origin': '*'},
@@ -78,6 +84,7 @@ def lambda_handler(event, context):
                 update_params['UpdateExpression'] = update_expression
 
             table.update_item(**update_params)
+            bump_version('todos')
             return {
                 'statusCode': 200,
                 'headers': {'Access-Control-Allow-Origin': '*'},
@@ -100,6 +107,7 @@ def lambda_handler(event, context):
             }
         try:
             table.delete_item(Key={'id': item_id})
+            bump_version('todos')
             return {
                 'statusCode': 200,
                 'headers': {'Access-Control-Allow-Origin': '*'},
@@ -1,10 +1,12 @@
 import os
 import json
 import boto3
+from rate_limiter import RateLimitExceeded, COMPREHEND_OPERATIONS, rate_limited
 
 def lambda_handler(event, context):
     """Validate extracted text using Amazon Comprehend."""
-    comprehend = boto3.client('comprehend', region_name='eu-west-2')
+    # Five Comprehend calls per request: all go through the shared limiter
+    comprehend = rate_limited(boto3.client('comprehend', region_name='eu-west-2'), COMPREHEND_OPERATIONS)
 
     # Parse body (POST request with JSON body)
     try:
@@ -102,6 +104,12 @@ def lambda_handler(event, context):
             'suspicious_tokens': low_syntax_count
         }
 
+    except RateLimitExceeded as e:
+        return {
+            'statusCode': 429,
+            'headers': {'Access-Control-Allow-Origin': '*', 'Retry-After': str(int(e.retry_after) + 1)},
+            'body': json.dumps({'error': str(e)})
+        }
     except Exception as e:
         return {
             'statusCode': 500,
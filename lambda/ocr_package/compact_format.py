@@ -0,0 +1,107 @@
+import base64
+import sys
+from array import array
+
+# Columnar encoding of the /ocr `lines`/`words` lists (?format=compact).
+# Confidence is already rounded to 0.1, so scaling by 10 is lossless; positions keep 1/10000 of a page.
+FORMAT_VERSION = 1
+CONFIDENCE_SCALE = 10
+POSITION_SCALE = 10000
+
+# Integer columns and their array typecodes when base64-packed (?pack=1)
+PACKED_COLUMNS = {
+    'word_conf': 'H',
+    'word_top': 'i',
+    'word_left': 'i',
+    'line_indent': 'H',
+    'line_words': 'I',
+    'line_word_conf': 'H',
+}
+
+
+def _pack(values, typecode):
+    packed = array(typecode, values)
+    # Always little-endian on the wire, which is what the browser's DataView decoder reads
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode('ascii')
+
+
+def _unpack(data, typecode):
+    values = array(typecode)
+    values.frombytes(base64.b64decode(data))
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values.tolist()
+
+
+def encode(lines, words, pack=False):
+    """Encode lines/words as parallel integer and string columns."""
+    line_words = [w for line in lines for w in line['words']]
+    # Line words are normally the leading run of `words`, so they're sent once and referenced by count
+    shared = len(line_words) <= len(words) and all(
+        a['text'] == b['text'] and a['confidence'] == b['confidence'] for a, b in zip(line_words, words)
+    )
+    columns = {
+        'v': FORMAT_VERSION,
+        'word_text': [w['text'] for w in words],
+        'word_conf': [round(w['confidence'] * CONFIDENCE_SCALE) for w in words],
+        'word_top': [round(w.get('top', 0) * POSITION_SCALE) for w in words],
+        'word_left': [round(w.get('left', 0) * POSITION_SCALE) for w in words],
+        # null when the line text is just its words joined by spaces
+        'line_text': [
+            None if line['text'] == ' '.join(w['text'] for w in line['words']) else line['text'] for line in lines
+        ],
+        'line_indent': [line.get('indent', 0) for line in lines],
+        'line_words': [len(line['words']) for line in lines],
+    }
+    if not shared:
+        columns['line_word_text'] = [w['text'] for w in line_words]
+        columns['line_word_conf'] = [round(w['confidence'] * CONFIDENCE_SCALE) for w in line_words]
+    if pack:
+        for name, typecode in PACKED_COLUMNS.items():
+            if name in columns:
+                columns[name] = _pack(columns[name], typecode)
+        columns['packed'] = True
+    return columns
+
+
+def decode(columns):
+    """Rebuild the (lines, words) lists from `encode` output."""
+    def column(name):
+        values = columns.get(name, [])
+        if columns.get('packed') and name in PACKED_COLUMNS:
+            return _unpack(values, PACKED_COLUMNS[name])
+        return values
+
+    word_text = columns['word_text']
+    word_conf = column('word_conf')
+    word_top = column('word_top')
+    word_left = column('word_left')
+    words = [
+        {
+            'text': word_text[i],
+            'confidence': word_conf[i] / CONFIDENCE_SCALE,
+            'top': word_top[i] / POSITION_SCALE,
+            'left': word_left[i] / POSITION_SCALE
+        }
+        for i in range(len(word_text))
+    ]
+
+    if 'line_word_text' in columns:
+        source_text, source_conf = columns['line_word_text'], column('line_word_conf')
+    else:
+        source_text, source_conf = word_text, word_conf
+    lines = []
+    pos = 0
+    for text, indent, count in zip(columns['line_text'], column('line_indent'), column('line_words')):
+        line_words = [
+            {'text': source_text[i], 'confidence': source_conf[i] / CONFIDENCE_SCALE} for i in range(pos, pos + count)
+        ]
+        pos += count
+        lines.append({
+            'text': text if text is not None else ' '.join(w['text'] for w in line_words),
+            'words': line_words,
+            'indent': indent
+        })
+    return lines, words
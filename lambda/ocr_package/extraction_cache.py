@@ -0,0 +1,63 @@
+import hashlib
+import re
+from decimal import Decimal
+
+from boto3.dynamodb.conditions import Key
+
+# GSI on ocr-extractions keyed by the SHA-256 of the uploaded file
+HASH_INDEX = 'hash-index'
+CHUNK_SIZE = 1024 * 1024
+_SHA256_RE = re.compile(r'^[0-9a-f]{64}$')
+
+
+def is_sha256(value):
+    return bool(value) and bool(_SHA256_RE.match(value))
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sha256_bytes(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def sha256_s3_object(s3_client, bucket, key):
+    """Hash an S3 object by streaming its body, without holding it in memory."""
+    obj = s3_client.get_object(Bucket=bucket, Key=key)
+    digest = hashlib.sha256()
+    for chunk in obj['Body'].iter_chunks(CHUNK_SIZE):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def from_dynamo(value):
+    """Convert Decimals back to int/float so the value can be JSON-encoded."""
+    if isinstance(value, list):
+        return [from_dynamo(v) for v in value]
+    if isinstance(value, dict):
+        return {k: from_dynamo(v) for k, v in value.items()}
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return value
+
+
+def find_cached_extraction(table, content_hash):
+    """Return the stored extraction for this content hash, or None.
+
+    The index only projects keys, so a hit costs one Query plus one GetItem.
+    """
+    response = table.query(
+        IndexName=HASH_INDEX,
+        KeyConditionExpression=Key('hash').eq(content_hash),
+        Limit=1
+    )
+    items = response.get('Items', [])
+    if not items:
+        return None
+    item = table.get_item(Key={'id': items[0]['id']}).get('Item')
+    return from_dynamo(item) if item else None
@@ -0,0 +1,65 @@
+import json
+import base64
+
+from boto3.dynamodb.conditions import Key
+
+# GSI on ocr-extractions for the history list: every item carries the same list_pk, and the index
+# sorts them by timestamp, so the newest page is one Query whatever the table size. Items written
+# before the index existed get list_pk from `python audit_extractions.py index`.
+TIMESTAMP_INDEX = 'timestamp-index'
+LIST_PARTITION = 'extraction'
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Columns the history list shows; text, lines and words are fetched per item by GET /extractions/{id}
+SUMMARY_FIELDS = (
+    'id', 'filename', 's3_key', 'timestamp', 'line_count', 'avg_confidence', 'corrected',
+    'thumbnail_key', 'duplicate_of', 'file_exists'
+)
+# timestamp is a DynamoDB reserved word, so every field goes through a placeholder
+SUMMARY_PROJECTION = {
+    'ProjectionExpression': ', '.join(f'#f{i}' for i in range(len(SUMMARY_FIELDS))),
+    'ExpressionAttributeNames': {f'#f{i}': field for i, field in enumerate(SUMMARY_FIELDS)}
+}
+
+
+def encode_cursor(last_key):
+    """Opaque `next` value for a LastEvaluatedKey (id, list_pk, timestamp)."""
+    if not last_key:
+        return None
+    data = json.dumps(last_key, separators=(',', ':'), sort_keys=True).encode('utf-8')
+    return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor):
+    """LastEvaluatedKey back from a `next` value; ValueError if it was not one of ours."""
+    try:
+        data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        key = json.loads(data)
+    except Exception:
+        raise ValueError('Invalid cursor')
+    if not isinstance(key, dict) or set(key) != {'id', 'list_pk', 'timestamp'}:
+        raise ValueError('Invalid cursor')
+    return key
+
+
+def page_size(value):
+    """The `limit` parameter, clamped to 1..MAX_PAGE_SIZE; ValueError if not a number."""
+    if not value:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(value), MAX_PAGE_SIZE))
+
+
+def query_page(table, limit=DEFAULT_PAGE_SIZE, cursor=None, **kwargs):
+    """(items, next cursor) for one page of extractions, newest first."""
+    query = {
+        'IndexName': TIMESTAMP_INDEX,
+        'KeyConditionExpression': Key('list_pk').eq(LIST_PARTITION),
+        'ScanIndexForward': False,
+        'Limit': limit,
+        **kwargs
+    }
+    if cursor:
+        query['ExclusiveStartKey'] = decode_cursor(cursor)
+    response = table.query(**query)
+    return response.get('Items', []), encode_cursor(response.get('LastEvaluatedKey'))
@@ -0,0 +1,87 @@
+import os
+import json
+import boto3
+from datetime import datetime, timezone
+from boto3.dynamodb.conditions import Key
+from s3_events import iter_s3_records, object_key
+from collection_version import bump_version
+
+# Keeps file_exists / object_size / etag on ocr-extractions in step with the uploads, from the
+# same ocr-s3-events notifications the thumbnail and cleanup Lambdas get, so listing the history
+# needs no S3 calls. `python audit_extractions.py reconcile` repairs any drift (lost events).
+S3_KEY_INDEX = 's3_key-index'
+# S3 sequencers are hex strings of varying length; padded to one width they compare in event order
+SEQUENCER_WIDTH = 32
+
+
+def sequencer(record):
+    return record['s3']['object'].get('sequencer', '').rjust(SEQUENCER_WIDTH, '0')
+
+
+def extraction_ids(table, s3_key):
+    response = table.query(IndexName=S3_KEY_INDEX, KeyConditionExpression=Key('s3_key').eq(s3_key))
+    ids = [item['id'] for item in response.get('Items', [])]
+    while 'LastEvaluatedKey' in response:
+        response = table.query(
+            IndexName=S3_KEY_INDEX,
+            KeyConditionExpression=Key('s3_key').eq(s3_key),
+            ExclusiveStartKey=response['LastEvaluatedKey']
+        )
+        ids.extend(item['id'] for item in response.get('Items', []))
+    return ids
+
+
+def record_file_status(table, s3_key, exists, seq, size=None, etag=None):
+    """Set the file fields on every extraction of s3_key; returns how many were updated.
+
+    Notifications can arrive out of order, so an update only applies if its sequencer is newer
+    than the one stored with the last update.
+    """
+    values = {':e': exists, ':seq': seq, ':now': datetime.now(timezone.utc).isoformat()}
+    if exists:
+        update = 'SET file_exists = :e, object_size = :s, etag = :t, s3_sequencer = :seq, file_checked_at = :now'
+        values[':s'] = size
+        values[':t'] = etag
+    else:
+        update = 'SET file_exists = :e, s3_sequencer = :seq, file_checked_at = :now REMOVE object_size, etag'
+    updated = 0
+    for item_id in extraction_ids(table, s3_key):
+        try:
+            table.update_item(
+                Key={'id': item_id},
+                UpdateExpression=update,
+                ConditionExpression='attribute_exists(id) AND (attribute_not_exists(s3_sequencer) OR s3_sequencer < :seq)',
+                ExpressionAttributeValues=values
+            )
+            updated += 1
+        except table.meta.client.exceptions.ConditionalCheckFailedException:
+            pass
+    if updated:
+        bump_version('extractions')
+    return updated
+
+
+def lambda_handler(event, context):
+    table = boto3.resource('dynamodb', region_name='eu-west-2').Table(os.environ['TABLE_NAME'])
+
+    for record in iter_s3_records(event):
+        key = object_key(record)
+        if not key.startswith('r/'):
+            continue
+        exists = record['eventName'].startswith('ObjectCreated')
+        obj = record['s3']['object']
+        try:
+            updated = record_file_status(
+                table, key, exists, sequencer(record),
+                obj.get('size'), (obj.get('eTag') or '').strip('"') or None
+            )
+            print(f"{record['eventName']} {key}: {updated} extraction(s) updated")
+        except Exception as e:
+            # Raise so SNS retries the delivery; reconcile catches anything that is still lost
+            print(f"File status error for {key}: {e}")
+            raise
+
+    return {
+        'statusCode': 200,
+        'body': json.dumps('File status updated')
+    }
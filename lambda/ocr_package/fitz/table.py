@@ -1,2 +0,0 @@
-# pylint: disable=wildcard-import,unused-wildcard-import
-from pymupdf.table import *
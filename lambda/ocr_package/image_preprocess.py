@@ -0,0 +1,99 @@
+import io
+import os
+import time
+
+# Shrink photos before Textract: fix EXIF orientation, drop colour, cap resolution, re-encode
+PREPROCESS_IMAGES = os.environ.get('PREPROCESS_IMAGES', 'true').lower() == 'true'
+# Longest side after resizing; menu text stays legible well below phone-camera resolution
+MAX_IMAGE_SIDE = int(os.environ.get('MAX_IMAGE_SIDE', '3000'))
+JPEG_QUALITY = int(os.environ.get('PREPROCESS_JPEG_QUALITY', '85'))
+# Synchronous Textract limits for images read from S3
+TEXTRACT_MAX_BYTES = 10 * 1024 * 1024
+TEXTRACT_MAX_SIDE = 10000
+# Derived objects live outside r/ so they never show up as uploads
+DERIVED_PREFIX = 'preprocessed/'
+
+
+def derived_key(key):
+    return f'{DERIVED_PREFIX}{key}'
+
+
+def preprocess_image(data):
+    """Return (encoded bytes or None, content type, stats) for an uploaded image.
+
+    None means the original should go to Textract unchanged: re-encoding didn't shrink it and
+    it needed neither rotating nor resizing.
+    """
+    from PIL import Image, ImageOps
+
+    stats = {'original_bytes': len(data)}
+    timer = time.perf_counter()
+
+    def lap(stage):
+        nonlocal timer
+        now = time.perf_counter()
+        stats[f'{stage}_ms'] = round((now - timer) * 1000, 1)
+        timer = now
+
+    image = Image.open(io.BytesIO(data))
+    source_format = image.format
+    if source_format == 'JPEG':
+        # Let libjpeg decode straight to grayscale at a reduced scale (1/2, 1/4, 1/8) that still
+        # covers MAX_IMAGE_SIDE: a 48 MP photo never has to exist as full-size RGB in the Lambda's memory
+        image.draft('L', (MAX_IMAGE_SIDE, MAX_IMAGE_SIDE))
+    image.load()
+    lap('decode')
+
+    # EXIF Orientation tag: 1 (or missing) means the pixels are already upright
+    rotated = image.getexif().get(0x0112, 1) not in (0, 1)
+    if rotated:
+        image = ImageOps.exif_transpose(image)
+    lap('orient')
+
+    if image.mode != 'L':
+        image = image.convert('L')
+    lap('grayscale')
+
+    original_size = image.size
+    resized = max(image.size) > MAX_IMAGE_SIDE
+    if resized:
+        image.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE), Image.LANCZOS)
+    stats['width'], stats['height'] = image.size
+    lap('resize')
+
+    # Photos stay JPEG; screenshots and scans (PNG etc.) stay lossless
+    buffer = io.BytesIO()
+    if source_format == 'JPEG':
+        image.save(buffer, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+        content_type = 'image/jpeg'
+    else:
+        image.save(buffer, format='PNG', optimize=True)
+        content_type = 'image/png'
+    encoded = buffer.getvalue()
+    lap('encode')
+
+    stats['derived_bytes'] = len(encoded)
+    must_replace = rotated or resized or len(data) > TEXTRACT_MAX_BYTES or max(original_size) > TEXTRACT_MAX_SIDE
+    if len(encoded) >= len(data) and not must_replace:
+        stats['saved_bytes'] = 0
+        return None, content_type, stats
+    stats['saved_bytes'] = len(data) - len(encoded)
+    stats['rotated'] = rotated
+    stats['resized'] = resized
+    return encoded, content_type, stats
+
+
+def prepare_textract_input(s3_client, bucket, key, data):
+    """Preprocess an uploaded image (already downloaded as `data`) and upload the result if it helps.
+
+    Returns (key Textract should read, derived key to delete afterwards or None, stats).
+    """
+    encoded, content_type, stats = preprocess_image(data)
+    if encoded is None:
+        return key, None, stats
+
+    start = time.perf_counter()
+    target = derived_key(key)
+    s3_client.put_object(Bucket=bucket, Key=target, Body=encoded, ContentType=content_type)
+    stats['upload_ms'] = round((time.perf_counter() - start) * 1000, 1)
+    return target, target, stats
@@ -1,17 +1,529 @@
 import os
 import json
+import time
 import uuid
 import boto3
-import hashlib
 from datetime import datetime, timezone
 from decimal import Decimal
-from pypdf import PdfReader
-import io
+from pdf_extract import spool_s3_object, iter_pdf_pages, iter_selected_pages, page_lines_and_words, pdf_worker_count, get_engine, has_text_layer
+from scanned_pages import ocr_scanned_pages
+from image_preprocess import PREPROCESS_IMAGES, prepare_textract_input
+from thumbnails import thumbnail_key
+from tiled_ocr import TILE_IMAGES, should_tile, ocr_tiled_image
+from extraction_cache import is_sha256, sha256_bytes, sha256_file, sha256_s3_object, from_dynamo, find_cached_extraction
+from extraction_list import LIST_PARTITION
+from metrics import StageMetrics
+from collection_version import bump_version
+from near_duplicates import simhash, to_hex, find_near_duplicate, index_signature
+from search_index import SEARCH_TABLE, index_document
+from page_store import parse_page_ranges, stored_page_count, load_pages, save_pages
+from ocr_document import Document, parse_textract_blocks
+import compact_format
+from result_store import put_result, load_result
+from rate_limiter import RateLimitExceeded, TEXTRACT_OPERATIONS, rate_limited
+from s3_events import sqs_message_records, object_key
+import upload_status
+from textract_jobs import ALWAYS_ASYNC_EXTENSIONS, ASYNC_EXTENSIONS, start_job, get_job, claim_job, release_job, finish_job, poll_job
+
+# Stop taking new SQS messages when less than this much of the invocation is left
+WORKER_MIN_REMAINING_MS = 30 * 1000
+# How often the background worker checks an async Textract job it is waiting on
+WORKER_JOB_POLL_SECONDS = 5
+# The ocr-uploads redrive policy's maxReceiveCount: the last attempt before the dead-letter queue
+WORKER_MAX_RECEIVES = 3
+
+# The most keys one POST /ocr/batch may list, and how many go to SQS per SendMessageBatch
+OCR_BATCH_MAX_KEYS = 25
+SQS_BATCH_SIZE = 10
+
+# Send PDF pages without a text layer to Textract (hybrid pipeline)
+OCR_SCANNED_PAGES = os.environ.get('OCR_SCANNED_PAGES', 'true').lower() == 'true'
+
+# LSH buckets of text signatures for near-duplicate menus (see near_duplicates.py); unset = off
+SIMHASH_TABLE = os.environ.get('SIMHASH_TABLE')
+
+
+def result_fields(lines, words, params):
+    """`lines`/`words` for a response body, or one columnar `compact` field for ?format=compact."""
+    if params.get('format') == 'compact':
+        pack = (params.get('pack') or '').lower() in ('1', 'true')
+        return {'compact': compact_format.encode(lines, words, pack=pack)}
+    return {'lines': lines, 'words': words}
+
+
+def busy_response(error):
+    """429 for a Textract call the rate limiter gave up on, so clients (and the worker) retry."""
+    print(f"Rate limited: {error}")
+    return {
+        'statusCode': 429,
+        'headers': {'Access-Control-Allow-Origin': '*', 'Retry-After': str(int(error.retry_after) + 1)},
+        'body': json.dumps({'error': str(error), 'retry_after': error.retry_after})
+    }
+
+
+def cached_response(item, key, params):
+    """Answer from a stored extraction of the same content.
+
+    The upload is left in place: it may belong to another restaurant, whose tblUploads row the
+    cleanup Lambda would drop along with it.
+    """
+    print(f"Cache hit for hash {item.get('hash')}: extraction {item['id']}")
+    return {
+        'statusCode': 200,
+        'headers': {'Access-Control-Allow-Origin': '*'},
+        'body': json.dumps({
+            'text': item.get('text', ''),
+            'key': key,
+            'id': item['id'],
+            'timestamp': item.get('timestamp'),
+            'avg_confidence': item.get('avg_confidence', 0.0),
+            **result_fields(item.get('lines', []), item.get('words', []), params),
+            'cached': True
+        })
+    }
+
+
+def object_matches_hash(s3_client, bucket, key, content_hash):
+    try:
+        return sha256_s3_object(s3_client, bucket, key) == content_hash
+    except Exception as e:
+        print(f"Could not hash {key}: {e}")
+        return False
+
+
+def save_extraction(table, s3_client, bucket, filename, key, extracted_text, all_lines, words, avg_confidence, content_hash=None):
+    """Write the result body to S3 and the metadata record to DynamoDB; returns (item_id, timestamp)."""
+    item = build_extraction_item(s3_client, bucket, filename, key, extracted_text, all_lines, words, avg_confidence, content_hash)
+    table.put_item(Item=item)
+    print(f"Successfully saved to DynamoDB: {item['id']}")
+    index_extraction(item, extracted_text)
+    # Only once the postings exist: a /search ETag on the new version must not cache results without it
+    bump_version('extractions')
+    return item['id'], item['timestamp']
+
+
+def build_extraction_item(s3_client, bucket, filename, key, extracted_text, all_lines, words, avg_confidence, content_hash=None):
+    """Write the result body to S3 and return the DynamoDB item for it (not yet written, nor indexed)."""
+    item_id = str(uuid.uuid4())
+    timestamp = datetime.now(timezone.utc).isoformat()
+    # text/lines/words go to a gzip object so the item stays small whatever the menu size
+    result_key, result_bytes = put_result(s3_client, bucket, item_id, {
+        'text': extracted_text,
+        'lines': all_lines,
+        'words': words
+    })
+    item = {
+        'id': item_id,
+        'filename': filename,
+        's3_key': key,
+        'result_key': result_key,
+        'result_bytes': result_bytes,
+        'line_count': len(all_lines),
+        'avg_confidence': Decimal(str(avg_confidence)),
+        'timestamp': timestamp,
+        # Partition of timestamp-index, which the history list queries newest-first
+        'list_pk': LIST_PARTITION,
+        # The upload was just read; S3 events keep this current from now on (file_status.py)
+        **upload_fields(s3_client, bucket, key)
+    }
+    if content_hash:
+        item['hash'] = content_hash
+    link_near_duplicate(item, extracted_text)
+    # The thumbnail Lambda may have finished first; otherwise it sets thumbnail_key when it does
+    if content_hash:
+        try:
+            s3_client.head_object(Bucket=bucket, Key=thumbnail_key(key, content_hash))
+            item['thumbnail_key'] = thumbnail_key(key, content_hash)
+        except Exception:
+            pass
+    return item
+
+
+def upload_fields(s3_client, bucket, key):
+    """file_exists, object_size and etag of the upload for a new item. Its ObjectCreated event
+    usually arrives before the item exists and updates nothing, so they are read here."""
+    try:
+        head = s3_client.head_object(Bucket=bucket, Key=key)
+    except Exception as e:
+        # A later S3 event or `python audit_extractions.py reconcile` fills them in
+        print(f"Could not read size and ETag of {key}: {e}")
+        return {'file_exists': True}
+    return {'file_exists': True, 'object_size': head['ContentLength'], 'etag': head['ETag'].strip('"')}
+
+
+def link_near_duplicate(item, extracted_text):
+    """Tag the item with its text signature and, if it is a re-upload of a known menu, duplicate_of.
+    The item is only filed in the buckets by index_extraction, once it is saved."""
+    signature = simhash(extracted_text)
+    if signature is None or not SIMHASH_TABLE:
+        return
+    item['simhash'] = to_hex(signature)
+    try:
+        table = boto3.resource('dynamodb', region_name='eu-west-2').Table(SIMHASH_TABLE)
+        match = find_near_duplicate(table, signature)
+        if match:
+            item['duplicate_of'] = match['canonical_id']
+            item['duplicate_distance'] = match['distance']
+            print(f"{item['id']} is a near-duplicate of {match['canonical_id']} ({match['distance']} bits apart)")
+    except Exception as e:
+        # Duplicate detection is a convenience; never fail the extraction over it
+        print(f"Near-duplicate check error: {e}")
+
+
+def index_extraction(item, extracted_text):
+    """File a saved item in the near-duplicate buckets and the search index. Only called after the
+    write succeeds: entries for an item that was never saved would point later uploads and
+    searches at nothing."""
+    if item.get('simhash') and SIMHASH_TABLE:
+        try:
+            table = boto3.resource('dynamodb', region_name='eu-west-2').Table(SIMHASH_TABLE)
+            index_signature(table, item['id'], int(item['simhash'], 16), item.get('duplicate_of'))
+        except Exception as e:
+            print(f"Near-duplicate index error for {item['id']}: {e}")
+    index_text(item['id'], extracted_text)
+
+
+def index_text(item_id, extracted_text):
+    """Add the extraction's terms to the search index, so /search finds it without reading its body."""
+    if not SEARCH_TABLE:
+        return
+    try:
+        table = boto3.resource('dynamodb', region_name='eu-west-2').Table(SEARCH_TABLE)
+        index_document(table, item_id, extracted_text)
+    except Exception as e:
+        # `python audit_extractions.py search-index` backfills anything missed here
+        print(f"Search index error for {item_id}: {e}")
+
+
+def lookup_cache(table, s3_client, bucket, content_hash):
+    try:
+        item = find_cached_extraction(table, content_hash)
+        return load_result(s3_client, bucket, item) if item else None
+    except Exception as e:
+        # A broken cache must never block extraction
+        print(f"Cache lookup error: {e}")
+        return None
+
+
+def job_status_handler(event):
+    """GET /ocr/status?job_id=... - progress of an asynchronous Textract job, or its final result."""
+    params = event.get('queryStringParameters') or {}
+    job_id = params.get('job_id')
+    if not job_id and params.get('batch_id'):
+        return batch_status_handler(params)
+    if not job_id and (params.get('s3_key') or is_sha256((params.get('hash') or '').lower())):
+        return upload_status_handler(params)
+    if not job_id:
+        return {
+            'statusCode': 400,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'Missing job_id, batch_id, s3_key or hash parameter'})
+        }
+    dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
+    table = dynamodb.Table(os.environ['TABLE_NAME'])
+    jobs_table = dynamodb.Table(os.environ['JOBS_TABLE'])
+    textract = rate_limited(boto3.client('textract', region_name='eu-west-2'), TEXTRACT_OPERATIONS)
+    s3_client = boto3.client('s3', region_name='eu-west-2')
+
+    job = get_job(jobs_table, job_id)
+    if not job:
+        return {
+            'statusCode': 404,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'Unknown job_id'})
+        }
+
+    # Already finished: answer from DynamoDB without calling Textract again
+    saved = saved_job_response(job, table, s3_client, params)
+    if saved:
+        return saved
+    if job.get('status') == 'FAILED':
+        return {
+            'statusCode': 200,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'job_id': job_id, 'status': 'FAILED', 'error': job.get('message', 'Textract job failed')})
+        }
+
+    try:
+        status, blocks, pages, message = poll_job(textract, job_id)
+    except RateLimitExceeded as e:
+        return busy_response(e)
+    except Exception as e:
+        print(f"Textract status error: {e}")
+        return {
+            'statusCode': 500,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'Textract status check failed: {str(e)}'})
+        }
+    print(f"Job {job_id}: {status}, {pages} page(s), {len(blocks)} block(s)")
+
+    if status == 'IN_PROGRESS':
+        return {
+            'statusCode': 200,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'job_id': job_id, 'status': status, 'key': job['s3_key']})
+        }
+    if status == 'FAILED':
+        finish_job(jobs_table, job_id, status, message=message)
+        return {
+            'statusCode': 200,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'job_id': job_id, 'status': status, 'error': message or 'Textract job failed'})
+        }
+
+    # SUCCEEDED, or PARTIAL_SUCCESS when some pages could not be read. Every poll in flight sees
+    # this; only the one that claims the job saves it, the others answer from its extraction.
+    if not claim_job(jobs_table, job_id):
+        job = get_job(jobs_table, job_id) or job
+        saved = saved_job_response(job, table, s3_client, params)
+        if saved:
+            return saved
+        # Still being saved by another poll
+        return {
+            'statusCode': 200,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'job_id': job_id, 'status': 'IN_PROGRESS', 'key': job['s3_key']})
+        }
+    extracted_text, all_lines, words, avg_confidence = parse_textract_blocks(blocks)
+    try:
+        item_id, timestamp = save_extraction(
+            table, s3_client, os.environ['BUCKET'], job['filename'], job['s3_key'],
+            extracted_text, all_lines, words, avg_confidence, job.get('hash')
+        )
+        finish_job(jobs_table, job_id, status, extraction_id=item_id, message=message)
+    except Exception as e:
+        print(f"Result save error: {e}")
+        try:
+            release_job(jobs_table, job_id)
+        except Exception as release_error:
+            print(f"Could not release job {job_id}: {release_error}")
+        return {
+            'statusCode': 500,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'Failed to save results: {str(e)}'})
+        }
+    return job_result_response({**job, 'status': status, 'message': message}, {
+        'id': item_id,
+        'text': extracted_text,
+        'lines': all_lines,
+        'words': words,
+        'avg_confidence': avg_confidence,
+        'timestamp': timestamp,
+        's3_key': job['s3_key']
+    }, params)
+
+
+def saved_job_response(job, table, s3_client, params):
+    """The result of a job whose extraction is saved, or None."""
+    if not job.get('extraction_id'):
+        return None
+    item = table.get_item(Key={'id': job['extraction_id']}).get('Item')
+    if not item:
+        return None
+    return job_result_response(job, load_result(s3_client, os.environ['BUCKET'], from_dynamo(item)), params)
+
+
+def upload_status_handler(params):
+    """GET /ocr/status?s3_key=... - what the upload worker has done with the current object at s3_key:
+    QUEUED, IN_PROGRESS, FAILED with an error, or SUCCEEDED with the extraction. Only reads.
+
+    Without s3_key, ?hash=... answers SUCCEEDED once an extraction of that content exists.
+    """
+    dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
+    table = dynamodb.Table(os.environ['TABLE_NAME'])
+    s3_client = boto3.client('s3', region_name='eu-west-2')
+    bucket = os.environ['BUCKET']
+    key = params.get('s3_key')
+    if key and upload_status.UPLOAD_STATUS_TABLE:
+        try:
+            etag = upload_status.object_etag(s3_client, bucket, key)
+            if etag is None:
+                return {
+                    'statusCode': 404,
+                    'headers': {'Access-Control-Allow-Origin': '*'},
+                    'body': json.dumps({'error': f'No upload at {key}'})
+                }
+            record = upload_status.get_status(key, etag) or {}
+            status = record.get('status', upload_status.QUEUED)
+            item = None
+            if status == upload_status.SUCCEEDED and record.get('extraction_id'):
+                item = table.get_item(Key={'id': record['extraction_id']}).get('Item')
+        except Exception as e:
+            print(f"Upload status error for {key}: {e}")
+            return {
+                'statusCode': 500,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': f'Upload status check failed: {str(e)}'})
+            }
+        if status == upload_status.FAILED:
+            return {
+                'statusCode': 200,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'status': status, 'key': key, 'error': record.get('error', 'Extraction failed')})
+            }
+        if not item:
+            return {
+                'statusCode': 200,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'status': status if status != upload_status.SUCCEEDED else upload_status.IN_PROGRESS, 'key': key})
+            }
+        item = load_result(s3_client, bucket, from_dynamo(item))
+    else:
+        if not is_sha256((params.get('hash') or '').lower()):
+            return {
+                'statusCode': 400,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': 'Missing s3_key or hash parameter'})
+            }
+        item = lookup_cache(table, s3_client, bucket, params['hash'].lower())
+        if not item:
+            # Still queued or being extracted
+            return {
+                'statusCode': 200,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'status': 'IN_PROGRESS', 'key': params.get('s3_key')})
+            }
+    return {
+        'statusCode': 200,
+        'headers': {'Access-Control-Allow-Origin': '*'},
+        'body': json.dumps(succeeded_body(item, params))
+    }
+
+
+def succeeded_body(item, params):
+    """Status body of a finished upload: the /ocr result of its extraction (loaded with its result)."""
+    return {
+        'status': upload_status.SUCCEEDED,
+        'text': item.get('text', ''),
+        'key': item.get('s3_key'),
+        'id': item['id'],
+        'timestamp': item.get('timestamp'),
+        'avg_confidence': item.get('avg_confidence', 0.0),
+        **result_fields(item.get('lines', []), item.get('words', []), params)
+    }
+
+
+def batch_status_handler(params):
+    """GET /ocr/status?batch_id=... - each key of a POST /ocr/batch, in request order, with its
+    upload status: the /ocr body once SUCCEEDED, the error once FAILED. The batch is COMPLETED
+    when every key is one or the other."""
+    dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
+    table = dynamodb.Table(os.environ['TABLE_NAME'])
+    s3_client = boto3.client('s3', region_name='eu-west-2')
+    bucket = os.environ['BUCKET']
+    batch_id = params['batch_id']
+    try:
+        batch = upload_status.get_batch(batch_id)
+        if batch is None:
+            return {
+                'statusCode': 404,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': f'No batch {batch_id}'})
+            }
+        results = []
+        for entry in batch['items']:
+            key, etag = entry['s3_key'], entry.get('etag')
+            if not etag:
+                results.append({'s3_key': key, 'status': upload_status.FAILED, 'error': f'No upload at {key}'})
+                continue
+            record = upload_status.get_status(key, etag) or {}
+            status = record.get('status', upload_status.QUEUED)
+            if status == upload_status.FAILED:
+                results.append({'s3_key': key, 'status': status, 'error': record.get('error', 'Extraction failed')})
+                continue
+            item = None
+            if status == upload_status.SUCCEEDED and record.get('extraction_id'):
+                item = table.get_item(Key={'id': record['extraction_id']}).get('Item')
+            if item:
+                results.append({'s3_key': key, **succeeded_body(load_result(s3_client, bucket, from_dynamo(item)), params)})
+            else:
+                # SUCCEEDED without a readable extraction is still being written
+                status = status if status != upload_status.SUCCEEDED else upload_status.IN_PROGRESS
+                results.append({'s3_key': key, 'status': status})
+    except Exception as e:
+        print(f"Batch status error for {batch_id}: {e}")
+        return {
+            'statusCode': 500,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'Batch status check failed: {str(e)}'})
+        }
+    done = all(r['status'] in (upload_status.SUCCEEDED, upload_status.FAILED) for r in results)
+    return {
+        'statusCode': 200,
+        'headers': {'Access-Control-Allow-Origin': '*'},
+        'body': json.dumps({'batch_id': batch_id, 'status': 'COMPLETED' if done else 'IN_PROGRESS', 'results': results})
+    }
+
+
+def wait_for_job(job_id, context):
+    """Background worker only: poll an async Textract job until it has a result, then return it."""
+    status_event = {'queryStringParameters': {'job_id': job_id}}
+    while context is None or context.get_remaining_time_in_millis() > WORKER_MIN_REMAINING_MS:
+        response = job_status_handler(status_event)
+        if response['statusCode'] != 200 or json.loads(response['body']).get('status') != 'IN_PROGRESS':
+            return response
+        time.sleep(WORKER_JOB_POLL_SECONDS)
+    # Out of time: fail the message so SQS redelivers it
+    return {
+        'statusCode': 504,
+        'headers': {'Access-Control-Allow-Origin': '*'},
+        'body': json.dumps({'error': f'Textract job {job_id} still running'})
+    }
+
+
+def job_result_response(job, item, params):
+    body = {
+        'job_id': job['job_id'],
+        'status': job.get('status', 'SUCCEEDED'),
+        'text': item.get('text', ''),
+        'key': item.get('s3_key', job['s3_key']),
+        'id': item['id'],
+        'timestamp': item.get('timestamp'),
+        'avg_confidence': item.get('avg_confidence', 0.0),
+        **result_fields(item.get('lines', []), item.get('words', []), params)
+    }
+    if job.get('message'):
+        body['message'] = job['message']
+    return {
+        'statusCode': 200,
+        'headers': {'Access-Control-Allow-Origin': '*'},
+        'body': json.dumps(body)
+    }
+
 
 def lambda_handler(event, context):
     print("=== OCR Lambda v2.0 with pypdf support ===")
+    path = event.get('rawPath') or event.get('requestContext', {}).get('http', {}).get('path', '')
+    if path.endswith('/ocr/status'):
+        return job_status_handler(event)
+    if path.endswith('/ocr/batch'):
+        return batch_handler(event, context)
+
+    # One EMF record per extraction: where the time went, by document type
+    metrics = StageMetrics(DocumentType='unknown')
+    response = None
+    try:
+        response = extract_handler(event, context, metrics)
+        return response
+    finally:
+        metrics.property('status_code', response['statusCode'] if response else 500)
+        metrics.emit()
+
+
+def document_type(filename):
+    name = filename.lower()
+    if name.endswith('.pdf'):
+        return 'pdf'
+    if name.endswith(('.tif', '.tiff')):
+        return 'tiff'
+    return 'image'
+
+
+def extract_handler(event, context, metrics):
+    """GET /ocr - extract one upload; lambda_handler routes requests and emits the metrics."""
     bucket = os.environ['BUCKET']
     table_name = os.environ['TABLE_NAME']
+    params = event.get('queryStringParameters') or {}
     
     # Get s3_key from query parameters
     s3_key = event.get('queryStringParameters', {}).get('s3_key')
@@ -37,8 +549,72 @@ def lambda_handler(event, context):
             # Fall back to old location
             key = f"uploads/{filename}"
 
-    textract = boto3.client('textract', region_name='eu-west-2')
+    textract = rate_limited(boto3.client('textract', region_name='eu-west-2'), TEXTRACT_OPERATIONS)
     s3_client = boto3.client('s3', region_name='eu-west-2')
+    dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
+    table = dynamodb.Table(table_name)
+    metrics.dimension('DocumentType', document_type(filename))
+    metrics.property('s3_key', key)
+
+    # Content-addressed cache: the browser sends the SHA-256 it already computed for /presign
+    client_hash = (event.get('queryStringParameters', {}).get('hash') or '').lower()
+    if params.get('pages'):
+        return page_range_handler(params, key, filename, client_hash, s3_client, textract, dynamodb, bucket, metrics)
+    if is_sha256(client_hash):
+        with metrics.stage('cache_lookup'):
+            cached = lookup_cache(table, s3_client, bucket, client_hash)
+        if cached:
+            # The browser's hash only picks the candidate; the object itself must hash the same,
+            # or any caller could fetch another menu's result by naming its hash
+            with metrics.stage('hash'):
+                verified = object_matches_hash(s3_client, bucket, key, client_hash)
+            if verified:
+                metrics.property('cached', True)
+                return cached_response(cached, key, params)
+            print(f"Client hash {client_hash} does not match {key}; extracting it")
+            client_hash = ''
+    content_hash = None
+
+    # Asynchronous Textract: return a job id straight away and let the browser poll /ocr/status
+    wants_async = (event.get('queryStringParameters', {}).get('async') or '').lower() in ('1', 'true')
+    lower_name = filename.lower()
+    if lower_name.endswith(ALWAYS_ASYNC_EXTENSIONS) or (wants_async and lower_name.endswith(ASYNC_EXTENSIONS)):
+        jobs_table = dynamodb.Table(os.environ['JOBS_TABLE'])
+        job_hash = None
+        # Hash before paying for a job: a cache hit skips Textract, and the job carries the hash.
+        # Always our own hash: the job's hash ends up on the extraction, where hash-index serves it.
+        try:
+            job_hash = sha256_s3_object(s3_client, bucket, key)
+            if job_hash != client_hash:
+                with metrics.stage('cache_lookup'):
+                    cached = lookup_cache(table, s3_client, bucket, job_hash)
+                if cached:
+                    metrics.property('cached', True)
+                    return cached_response(cached, key, params)
+        except Exception as e:
+            print(f"Could not hash {key}: {e}")
+        try:
+            with metrics.stage('textract_start'):
+                job_id = start_job(textract, jobs_table, bucket, key, filename, job_hash)
+        except RateLimitExceeded as e:
+            return busy_response(e)
+        except Exception as e:
+            print(f"Textract start error: {e}")
+            return {
+                'statusCode': 500,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': f'Could not start Textract job: {str(e)}'})
+            }
+        print(f"Started async Textract job {job_id} for {key}")
+        if event.get('worker'):
+            # Nobody polls for the upload worker, so it waits on the job itself
+            return wait_for_job(job_id, context)
+        return {
+            'statusCode': 202,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'job_id': job_id, 'status': 'IN_PROGRESS', 'key': key})
+        }
+
     print(f"About to check file type for: '{filename}'")
     
     # Initialize variables
@@ -50,36 +626,65 @@ def lambda_handler(event, context):
     
     # Check file type and process accordingly
     if filename.lower().endswith('.pdf'):
-        print("DETECTED PDF FILE - Processing with pypdf")
+        print("DETECTED PDF FILE - Processing locally")
+        pdf_path = None
         try:
-            # Get PDF from S3
-            pdf_obj = s3_client.get_object(Bucket=bucket, Key=key)
-            pdf_content = pdf_obj['Body'].read()
-            print(f"Downloaded PDF, size: {len(pdf_content)} bytes")
-            
-            # Extract text using pypdf
-            pdf_reader = PdfReader(io.BytesIO(pdf_content))
-            print(f"PDF has {len(pdf_reader.pages)} pages")
-            
-            for page_num, page in enumerate(pdf_reader.pages):
-                page_text = page.extract_text()
-                extracted_text += page_text + "\n\n"
-                
-                # Split into lines (approximate)
-                lines = page_text.split('\n')
-                for line_num, line in enumerate(lines):
-                    line = line.strip()
-                    if line:
-                        all_lines.append({
-                            'text': line,
-                            'words': [{'text': word, 'confidence': 100.0} for word in line.split()],
-                            'indent': 0
-                        })
-                        words.extend([{'text': word, 'confidence': 100.0, 'top': page_num * 100 + line_num * 20, 'left': 0} for word in line.split()])
-            
-            avg_confidence = 100.0  # PDFs don't have confidence scores
+            # Spool the PDF to /tmp so the whole file never sits in memory
+            with metrics.stage('download'):
+                pdf_path = spool_s3_object(s3_client, bucket, key, suffix='.pdf')
+            metrics.count('source_bytes', os.path.getsize(pdf_path))
+            print(f"Spooled PDF to {pdf_path}, size: {os.path.getsize(pdf_path)} bytes")
+
+            # Only trust a hash we computed ourselves; re-check the cache if the client's was missing or wrong
+            with metrics.stage('hash'):
+                content_hash = sha256_file(pdf_path)
+            if content_hash != client_hash:
+                with metrics.stage('cache_lookup'):
+                    cached = lookup_cache(table, s3_client, bucket, content_hash)
+                if cached:
+                    metrics.property('cached', True)
+                    return cached_response(cached, key, params)
+
+            # Extract text one page at a time, or page ranges in parallel when workers > 1
+            workers = pdf_worker_count(event.get('queryStringParameters', {}).get('workers'))
+            engine = get_engine(event.get('queryStringParameters', {}).get('engine'))
+            pages = []
+            scanned = []
+            ocr_pages = {}
+            with metrics.stage('pdf_parse'):
+                for page_num, page_text in iter_pdf_pages(pdf_path, workers, engine):
+                    if OCR_SCANNED_PAGES and not has_text_layer(page_text):
+                        scanned.append(page_num)
+                    # Scanned pages keep their (thin) text layer unless Textract returns something better
+                    pages.append((page_text,) + page_lines_and_words(page_num, page_text))
+            metrics.count('pages', len(pages))
+            metrics.count('scanned_pages', len(scanned))
+            print(f"PDF has {len(pages)} pages, extracted with {engine.name}, {workers} worker(s)")
+
+            # Hybrid pipeline: only pages without a usable text layer are rasterized and sent to Textract
+            if scanned:
+                print(f"{len(scanned)} page(s) without a text layer, sending to Textract: {[p + 1 for p in scanned]}")
+                with metrics.stage('textract'):
+                    ocr_pages = ocr_scanned_pages(textract, pdf_path, scanned)
+                for page_num, result in ocr_pages.items():
+                    pages[page_num] = result
+                metrics.count('ocr_failed_pages', len(scanned) - len(ocr_pages))
+
+            text_parts = []
+            for page_text, page_lines, page_words in pages:
+                text_parts.append(page_text + "\n\n")
+                all_lines.extend(page_lines)
+                words.extend(page_words)
+            extracted_text = ''.join(text_parts)
+
+            # Text-layer words count as 100; OCR'd words bring their real confidence
+            avg_confidence = 100.0
+            if ocr_pages and words:
+                avg_confidence = round(sum(w['confidence'] for w in words) / len(words), 1)
             response = {'Blocks': []}  # Dummy response for compatibility
                 
+        except RateLimitExceeded as e:
+            return busy_response(e)
         except Exception as e:
             error_str = str(e)
             print(f"PDF processing error: {error_str}")
@@ -103,20 +708,83 @@ def lambda_handler(event, context):
                     'headers': {'Access-Control-Allow-Origin': '*'},
                     'body': json.dumps({'error': f'PDF processing failed: {error_str}'})
                 }
+        finally:
+            if pdf_path and os.path.exists(pdf_path):
+                os.remove(pdf_path)
                 
     elif filename.lower().endswith(('.png', '.jpg', '.jpeg', '.tiff', '.tif')):
         print("DETECTED IMAGE FILE - Processing with Textract")
+        wants_tiles = (params.get('tiles') or '').lower() in ('1', 'true')
+        image_data = None
         try:
-            # Use detect_document_text for images
-            response = textract.detect_document_text(
-                Document={
-                    'S3Object': {
-                        'Bucket': bucket,
-                        'Name': key
-                    }
-                }
-            )
-            print(f"Textract response received, blocks: {len(response.get('Blocks', []))}")
+            # Hashing reads the object once, which is far cheaper than a repeat Textract call
+            if PREPROCESS_IMAGES or TILE_IMAGES or wants_tiles:
+                # Keep the bytes: the same download feeds tiling or preprocessing
+                with metrics.stage('download'):
+                    image_data = s3_client.get_object(Bucket=bucket, Key=key)['Body'].read()
+                metrics.count('source_bytes', len(image_data))
+                with metrics.stage('hash'):
+                    content_hash = sha256_bytes(image_data)
+            else:
+                # Streams the object: download and hashing in one stage
+                with metrics.stage('hash'):
+                    content_hash = sha256_s3_object(s3_client, bucket, key)
+            if content_hash != client_hash:
+                with metrics.stage('cache_lookup'):
+                    cached = lookup_cache(table, s3_client, bucket, content_hash)
+                if cached:
+                    metrics.property('cached', True)
+                    return cached_response(cached, key, params)
+        except Exception as e:
+            print(f"Could not hash {key}: {e}")
+
+        # Wall-sized photos: OCR overlapping full-resolution tiles instead of shrinking the whole image
+        tile_blocks = None
+        if image_data is not None:
+            try:
+                if should_tile(image_data, wants_tiles):
+                    with metrics.stage('textract'):
+                        tile_blocks, tile_stats = ocr_tiled_image(textract, image_data)
+                    metrics.count('tiles', tile_stats['tiles'])
+                    print(f"Tiled OCR stats: {tile_stats}")
+            except Exception as e:
+                print(f"Tiled OCR failed, falling back to a single Textract call: {e}")
+
+        # Grayscale, upright, size-capped copy when it's smaller or the original exceeds Textract limits
+        textract_key = key
+        derived_key = None
+        if image_data is not None and tile_blocks is None and PREPROCESS_IMAGES:
+            try:
+                with metrics.stage('preprocess'):
+                    textract_key, derived_key, preprocess_stats = prepare_textract_input(s3_client, bucket, key, image_data)
+                metrics.count('saved_bytes', preprocess_stats['saved_bytes'])
+                print(f"Preprocess stats: {preprocess_stats}")
+            except Exception as e:
+                print(f"Image preprocessing failed, sending the original: {e}")
+            image_data = None
+
+        try:
+            if tile_blocks is not None:
+                response = {'Blocks': tile_blocks}
+            else:
+                # Use detect_document_text for images
+                with metrics.stage('textract'):
+                    response = textract.detect_document_text(
+                        Document={
+                            'S3Object': {
+                                'Bucket': bucket,
+                                'Name': textract_key
+                            }
+                        }
+                    )
+                print(f"Textract response received, blocks: {len(response.get('Blocks', []))} for {textract_key}")
+            with metrics.stage('parse'):
+                document = Document.from_textract_blocks(response.get('Blocks', []))
+            print(f"Confidence stats: {document.confidence_stats()}")
+            result = document.to_json()
+            extracted_text, all_lines, words, avg_confidence = result['text'], result['lines'], result['words'], result['avg_confidence']
+        except RateLimitExceeded as e:
+            return busy_response(e)
         except Exception as e:
             error_str = str(e)
             print(f"Textract error: {error_str}")
@@ -140,6 +808,13 @@ def lambda_handler(event, context):
                     'headers': {'Access-Control-Allow-Origin': '*'},
                     'body': json.dumps({'error': f'Textract processing failed: {error_str}'})
                 }
+        finally:
+            # The derived image is only needed for this Textract call
+            if derived_key:
+                try:
+                    s3_client.delete_object(Bucket=bucket, Key=derived_key)
+                except Exception as e:
+                    print(f"Could not delete {derived_key}: {e}")
     else:
         print(f"UNSUPPORTED FILE TYPE: {filename}")
         return {
@@ -148,42 +823,26 @@ def lambda_handler(event, context):
             'body': json.dumps({'error': f'Unsupported file type: {filename}. Supported formats: PDF, PNG, JPG, JPEG, TIFF'})
         }
 
-    # Check for duplicate by s3_key instead of hash
-    dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
-    table = dynamodb.Table(table_name)
-    try:
-        # Check if s3_key already exists
-        check_response = table.scan(
-            FilterExpression=boto3.dynamodb.conditions.Attr('s3_key').eq(key)
-        )
-        if check_response['Items']:
-            # Already processed this exact file
-            return {
-                'statusCode': 409,
-                'headers': {'Access-Control-Allow-Origin': '*'},
-                'body': json.dumps({'error': 'File has already been processed'})
-            }
-    except Exception as e:
-        # If check fails, log but proceed
-        print(f"Duplicate check error: {e}")
+    metrics.count('lines', len(all_lines))
+    metrics.count('words', len(words))
 
     # Save to DynamoDB
-    item_id = str(uuid.uuid4())
-    timestamp = datetime.now(timezone.utc).isoformat()
-    item = {
-        'id': item_id,
-        'filename': filename,
-        's3_key': key,
-        'text': extracted_text,
-        'line_count': len(all_lines),
-        'avg_confidence': Decimal(str(avg_confidence)),
-        'timestamp': timestamp
-    }
     try:
-        table.put_item(Item=item)
-        print(f"Successfully saved to DynamoDB: {item_id}")
+        with metrics.stage('save'):
+            batch_items = event.get('batch_items')
+            if batch_items is None:
+                item_id, timestamp = save_extraction(
+                    table, s3_client, bucket, filename, key, extracted_text, all_lines, words, avg_confidence, content_hash
+                )
+            else:
+                # The upload worker writes its items in one BatchWriteItem once all messages are done
+                item = build_extraction_item(
+                    s3_client, bucket, filename, key, extracted_text, all_lines, words, avg_confidence, content_hash
+                )
+                batch_items.append((item, extracted_text))
+                item_id, timestamp = item['id'], item['timestamp']
     except Exception as e:
-        print(f"DynamoDB write error: {e}")
+        print(f"Result save error: {e}")
         return {
             'statusCode': 500,
             'headers': {'Access-Control-Allow-Origin': '*'},
@@ -195,11 +854,329 @@ def lambda_handler(event, context):
         'headers': {'Access-Control-Allow-Origin': '*'},
         'body': json.dumps({
             'text': extracted_text,
-            'lines': all_lines,
             'key': key,
             'id': item_id,
             'timestamp': timestamp,
             'avg_confidence': avg_confidence,
-            'words': words
+            **result_fields(all_lines, words, params)
         })
-    }
\ No newline at end of file
+    }
+
+
+def page_range_handler(params, key, filename, client_hash, s3_client, textract, dynamodb, bucket, metrics):
+    """GET /ocr?pages=1-3,7 - extract only the selected PDF pages, reusing pages stored by earlier requests.
+
+    Results are kept per page in PAGES_TABLE, never as an extractions record: a partial document
+    must not answer the whole-file hash cache.
+    """
+    if not filename.lower().endswith('.pdf'):
+        return {
+            'statusCode': 400,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 'pages is only supported for PDF files'})
+        }
+    pages_table = dynamodb.Table(os.environ['PAGES_TABLE'])
+    spec = params['pages']
+
+    # With the browser's hash and every requested page stored, the PDF is only streamed to check that hash
+    cached = {}
+    page_nums = None
+    if is_sha256(client_hash):
+        with metrics.stage('cache_lookup'):
+            page_count = stored_page_count(pages_table, client_hash)
+            if page_count:
+                try:
+                    page_nums = parse_page_ranges(spec, page_count)
+                except ValueError as e:
+                    return {
+                        'statusCode': 400,
+                        'headers': {'Access-Control-Allow-Origin': '*'},
+                        'body': json.dumps({'error': str(e)})
+                    }
+                cached = load_pages(pages_table, s3_client, bucket, client_hash, page_nums)
+        if page_nums and len(cached) == len(page_nums):
+            with metrics.stage('hash'):
+                verified = object_matches_hash(s3_client, bucket, key, client_hash)
+            if not verified:
+                print(f"Client hash {client_hash} does not match {key}; extracting it")
+                client_hash = ''
+                cached = {}
+        if page_nums and len(cached) == len(page_nums):
+            metrics.property('cached', True)
+            metrics.count('pages_cached', len(cached))
+            return page_range_response(key, page_nums, page_count, cached, len(cached), params)
+
+    pdf_path = None
+    try:
+        with metrics.stage('download'):
+            pdf_path = spool_s3_object(s3_client, bucket, key, suffix='.pdf')
+        metrics.count('source_bytes', os.path.getsize(pdf_path))
+        with metrics.stage('hash'):
+            content_hash = sha256_file(pdf_path)
+        engine = get_engine(params.get('engine'))
+        page_count = engine.page_count(pdf_path)
+        try:
+            page_nums = parse_page_ranges(spec, page_count)
+        except ValueError as e:
+            return {
+                'statusCode': 400,
+                'headers': {'Access-Control-Allow-Origin': '*'},
+                'body': json.dumps({'error': str(e)})
+            }
+        if content_hash != client_hash:
+            with metrics.stage('cache_lookup'):
+                cached = load_pages(pages_table, s3_client, bucket, content_hash, page_nums)
+        metrics.count('pages_cached', len(cached))
+
+        # Only the pages nobody has asked for yet are parsed, and only scanned ones go to Textract
+        missing = [page_num for page_num in page_nums if page_num not in cached]
+        extracted = {}
+        scanned = []
+        scanned_text = {}
+        with metrics.stage('pdf_parse'):
+            for page_num, page_text in iter_selected_pages(pdf_path, missing, engine):
+                if OCR_SCANNED_PAGES and not has_text_layer(page_text):
+                    scanned.append(page_num)
+                    scanned_text[page_num] = page_text
+                else:
+                    extracted[page_num] = (page_text,) + page_lines_and_words(page_num, page_text)
+        if scanned:
+            print(f"{len(scanned)} selected page(s) without a text layer, sending to Textract: {[p + 1 for p in scanned]}")
+            with metrics.stage('textract'):
+                extracted.update(ocr_scanned_pages(textract, pdf_path, scanned))
+        # Pages Textract failed on are returned with their text layer but not stored, so a later
+        # request tries them again
+        fallback = {}
+        for page_num, page_text in scanned_text.items():
+            if page_num not in extracted:
+                fallback[page_num] = (page_text,) + page_lines_and_words(page_num, page_text)
+        metrics.count('pages', len(extracted))
+        metrics.count('scanned_pages', len(scanned))
+        print(f"Pages {spec} of {page_count}: {len(cached)} stored, {len(extracted)} extracted with {engine.name}")
+
+        if extracted:
+            with metrics.stage('save'):
+                save_pages(pages_table, s3_client, bucket, content_hash, extracted, page_count, engine.name)
+    except RateLimitExceeded as e:
+        return busy_response(e)
+    except Exception as e:
+        print(f"PDF page extraction error: {e}")
+        return {
+            'statusCode': 500,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'PDF processing failed: {str(e)}'})
+        }
+    finally:
+        if pdf_path and os.path.exists(pdf_path):
+            os.remove(pdf_path)
+
+    return page_range_response(key, page_nums, page_count, {**cached, **fallback, **extracted}, len(cached), params)
+
+
+def page_range_response(key, page_nums, page_count, pages, pages_cached, params):
+    text_parts = []
+    all_lines = []
+    words = []
+    for page_num in page_nums:
+        page_text, page_lines, page_words = pages[page_num]
+        text_parts.append(page_text + "\n\n")
+        all_lines.extend(page_lines)
+        words.extend(page_words)
+    # Text-layer words count as 100; OCR'd words bring their real confidence
+    avg_confidence = round(sum(w['confidence'] for w in words) / len(words), 1) if words else 100.0
+    return {
+        'statusCode': 200,
+        'headers': {'Access-Control-Allow-Origin': '*'},
+        'body': json.dumps({
+            'text': ''.join(text_parts),
+            **result_fields(all_lines, words, params),
+            'avg_confidence': avg_confidence,
+            'key': key,
+            'pages': [page_num + 1 for page_num in page_nums],
+            'page_count': page_count,
+            'pages_cached': pages_cached
+        })
+    }
+
+
+def batch_handler(event, context):
+    """POST /ocr/batch {"s3_keys": [...]} - queue several uploads for the upload worker.
+
+    Answers 202 with a batch_id at once; GET /ocr/status?batch_id=... then reports each key.
+    Keys with an extraction, or already waiting on the worker, aren't queued a second time.
+    """
+    body = json.loads(event.get('body') or '{}')
+    params = event.get('queryStringParameters') or {}
+    keys = body.get('s3_keys') or []
+    if not isinstance(keys, list) or not keys or not all(isinstance(k, str) and k for k in keys):
+        return {
+            'statusCode': 400,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': 's3_keys must be a non-empty list of keys'})
+        }
+    if len(keys) > OCR_BATCH_MAX_KEYS:
+        return {
+            'statusCode': 400,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'At most {OCR_BATCH_MAX_KEYS} keys per batch'})
+        }
+
+    # Options that apply to every file (engine, tiles, ...), from the body or the query string
+    options = {k: str(v) for k, v in {**params, **body}.items() if k not in ('s3_keys', 's3_key', 'key', 'hash', 'hashes')}
+    s3_client = boto3.client('s3', region_name='eu-west-2')
+    sqs = boto3.client('sqs', region_name='eu-west-2')
+    bucket = os.environ['BUCKET']
+    batch_id = str(uuid.uuid4())
+    items = []
+    messages = []
+    # Messages SQS accepted; the others must not be left QUEUED, or later batches would skip them
+    sent = set()
+    try:
+        for key in keys:
+            # The ETag pins the version queued now; a missing key is reported FAILED by the status
+            etag = upload_status.object_etag(s3_client, bucket, key)
+            items.append({'s3_key': key, 'etag': etag})
+            if etag is None or any(m['s3_key'] == key for m in messages):
+                continue
+            record = upload_status.get_status(key, etag) or {}
+            if record.get('status') in (upload_status.QUEUED, upload_status.IN_PROGRESS, upload_status.SUCCEEDED):
+                continue
+            upload_status.set_status(key, etag, upload_status.QUEUED, error=None)
+            messages.append({'s3_key': key, 'etag': etag, 'batch_id': batch_id, 'options': options})
+        upload_status.save_batch(batch_id, items)
+        for start in range(0, len(messages), SQS_BATCH_SIZE):
+            chunk = messages[start:start + SQS_BATCH_SIZE]
+            response = sqs.send_message_batch(
+                QueueUrl=os.environ['OCR_UPLOADS_QUEUE_URL'],
+                Entries=[{'Id': str(i), 'MessageBody': json.dumps(m)} for i, m in enumerate(chunk)]
+            )
+            for entry in response.get('Successful', []):
+                sent.add(start + int(entry['Id']))
+            for failed in response.get('Failed', []):
+                message = chunk[int(failed['Id'])]
+                upload_status.set_status(
+                    message['s3_key'], message['etag'], upload_status.FAILED,
+                    error=f"Could not queue: {failed.get('Message', failed.get('Code'))}"
+                )
+    except Exception as e:
+        print(f"Batch OCR error: {e}")
+        for i, message in enumerate(messages):
+            if i not in sent:
+                upload_status.set_status(
+                    message['s3_key'], message['etag'], upload_status.FAILED, error=f'Could not queue: {str(e)}'
+                )
+        return {
+            'statusCode': 500,
+            'headers': {'Access-Control-Allow-Origin': '*'},
+            'body': json.dumps({'error': f'Failed to queue batch: {str(e)}'})
+        }
+    print(f"Batch OCR {batch_id}: {len(keys)} key(s), {len(messages)} queued")
+
+    return {
+        'statusCode': 202,
+        'headers': {'Access-Control-Allow-Origin': '*'},
+        'body': json.dumps({'batch_id': batch_id, 'status': 'IN_PROGRESS', 'keys': len(keys), 'queued': len(messages)})
+    }
+
+
+def worker_requests(message):
+    """(s3_key, etag, options) for each object one ocr-uploads message asks for: the uploads under
+    r/ in an S3 event, or the one key a POST /ocr/batch queued."""
+    body = json.loads(message['body'])
+    if 'batch_id' in body:
+        return [(body['s3_key'], body['etag'], body.get('options') or {})]
+    requests = []
+    for record in sqs_message_records(message):
+        key = object_key(record)
+        if record['eventName'].startswith('ObjectCreated') and key.startswith('r/'):
+            requests.append((key, (record['s3']['object'].get('eTag') or '').strip('"'), {}))
+    return requests
+
+
+def write_extractions(entries):
+    """Write new extraction records, given as (item, text), with BatchWriteItem and index them;
+    returns the ids left unsaved (all on error)."""
+    if not entries:
+        return set()
+    table = boto3.resource('dynamodb', region_name='eu-west-2').Table(os.environ['TABLE_NAME'])
+    try:
+        # batch_writer sends BatchWriteItem requests of up to 25 items and resends unprocessed ones
+        with table.batch_writer() as writer:
+            for item, _ in entries:
+                writer.put_item(Item=item)
+    except Exception as e:
+        print(f"Batch save error: {e}")
+        return {item['id'] for item, _ in entries}
+    for item, text in entries:
+        index_extraction(item, text)
+    bump_version('extractions')
+    return set()
+
+
+def sqs_handler(event, context):
+    """Upload worker: OCR new objects, and keys queued by POST /ocr/batch, from the ocr-uploads queue.
+
+    New extraction records are written together with BatchWriteItem after the last message.
+    Failed messages are reported in batchItemFailures so only they are retried (and moved to
+    the dead-letter queue after repeated failures); the rest of the batch is deleted.
+    """
+    failures = []
+    # (item, text) of each new extraction, written and indexed after the last message
+    batch_items = []
+    # (message id, key, etag, extraction id, last attempt), marked SUCCEEDED once the write succeeds
+    extracted = []
+    for message in event['Records']:
+        # Leave the rest of the batch for redelivery rather than being cut off mid-extraction
+        if context is not None and context.get_remaining_time_in_millis() < WORKER_MIN_REMAINING_MS:
+            failures.append({'itemIdentifier': message['messageId']})
+            continue
+        last_attempt = int(message.get('attributes', {}).get('ApproximateReceiveCount', 1)) >= WORKER_MAX_RECEIVES
+        try:
+            for key, etag, options in worker_requests(message):
+                # A batch may queue a key whose upload event is also on the queue; extract it once
+                if upload_status.succeeded(key, etag):
+                    print(f"Upload worker: {key} already extracted")
+                    continue
+                # The browser polls /ocr/status?s3_key= for this record (upload_status.py)
+                print(f"Upload worker: extracting {key}")
+                upload_status.set_status(key, etag, upload_status.IN_PROGRESS, error=None)
+                try:
+                    response = lambda_handler({
+                        'rawPath': '/ocr',
+                        'queryStringParameters': {**options, 's3_key': key},
+                        'worker': True,
+                        'batch_items': batch_items
+                    }, context)
+                    body = json.loads(response['body'])
+                except Exception as e:
+                    response, body = {'statusCode': 500}, {'error': str(e)}
+                if response['statusCode'] >= 500 or response['statusCode'] == 429:
+                    error = body.get('error', 'extraction failed')
+                    # Redelivered unless this was the last attempt
+                    upload_status.set_status(
+                        key, etag, upload_status.FAILED if last_attempt else upload_status.QUEUED, error=error
+                    )
+                    raise RuntimeError(error)
+                if response['statusCode'] >= 400:
+                    # Unsupported or corrupt file: retrying won't help
+                    print(f"Upload worker: giving up on {key}: {response['body']}")
+                    upload_status.set_status(key, etag, upload_status.FAILED, error=body.get('error', 'Extraction failed'))
+                else:
+                    extracted.append((message['messageId'], key, etag, body.get('id'), last_attempt))
+        except Exception as e:
+            print(f"Upload worker error for message {message['messageId']}: {e}")
+            failures.append({'itemIdentifier': message['messageId']})
+
+    unsaved = write_extractions(batch_items)
+    failed = {f['itemIdentifier'] for f in failures}
+    for message_id, key, etag, item_id, last_attempt in extracted:
+        if item_id in unsaved:
+            upload_status.set_status(
+                key, etag, upload_status.FAILED if last_attempt else upload_status.QUEUED, error='Failed to save results'
+            )
+            if message_id not in failed:
+                failed.add(message_id)
+                failures.append({'itemIdentifier': message_id})
+        else:
+            upload_status.set_status(key, etag, upload_status.SUCCEEDED, extraction_id=item_id, error=None)
+    return {'batchItemFailures': failures}
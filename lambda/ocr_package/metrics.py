@@ -0,0 +1,95 @@
+import os
+import json
+import time
+from contextlib import contextmanager
+
+# Per-stage timings and sizes for one extraction, printed as a CloudWatch Embedded Metric Format
+# line: CloudWatch turns it into metrics without any PutMetricData calls, and locally it is just JSON.
+METRICS_NAMESPACE = os.environ.get('METRICS_NAMESPACE', 'OcrPipeline')
+EMIT_METRICS = os.environ.get('EMIT_METRICS', 'true').lower() == 'true'
+
+UNITS = {'ms': 'Milliseconds', 'bytes': 'Bytes'}
+
+
+def unit_for(name):
+    """Unit from the metric name's suffix: download_ms -> Milliseconds, source_bytes -> Bytes."""
+    return UNITS.get(name.rsplit('_', 1)[-1], 'Count')
+
+
+class StageMetrics:
+    """Collects metrics for one request and emits them as a single EMF record.
+
+        metrics = StageMetrics(DocumentType='pdf')
+        with metrics.stage('download'):
+            ...
+        metrics.count('pages', 12)
+        metrics.emit()
+
+    Repeated stages and counts accumulate, so a stage timed once per page reports the total.
+    """
+
+    def __init__(self, namespace=METRICS_NAMESPACE, **dimensions):
+        self.namespace = namespace
+        self.dimensions = dimensions
+        self.values = {}
+        self.properties = {}
+        self.started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.count(f'{name}_ms', (time.perf_counter() - start) * 1000)
+
+    def count(self, name, value):
+        self.values[name] = self.values.get(name, 0) + value
+
+    def dimension(self, name, value):
+        self.dimensions[name] = str(value)
+
+    def property(self, name, value):
+        """Logged with the record (searchable in Logs Insights) but not turned into a metric."""
+        self.properties[name] = value
+
+    def record(self):
+        """The EMF document as a dict; `total_ms` covers everything since the object was created."""
+        values = dict(self.values)
+        values['total_ms'] = (time.perf_counter() - self.started) * 1000
+        values = {name: round(value, 1) if isinstance(value, float) else value for name, value in values.items()}
+        return {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': self.namespace,
+                    'Dimensions': [sorted(self.dimensions)],
+                    'Metrics': [{'Name': name, 'Unit': unit_for(name)} for name in sorted(values)]
+                }]
+            },
+            **self.properties,
+            **self.dimensions,
+            **values
+        }
+
+    def emit(self):
+        record = self.record()
+        if EMIT_METRICS:
+            print(json.dumps(record, default=str))
+        return record
+
+
+def stage_summary(records, dimension='DocumentType'):
+    """Mean of every *_ms stage per dimension value, slowest first: where time goes, by document type."""
+    totals = {}
+    for record in records:
+        group = totals.setdefault(record.get(dimension, 'unknown'), {'count': 0, 'stages': {}})
+        group['count'] += 1
+        for name, value in record.items():
+            if name.endswith('_ms') and name != 'total_ms':
+                group['stages'][name] = group['stages'].get(name, 0) + value
+    return {
+        key: sorted(((name, total / group['count']) for name, total in group['stages'].items()),
+                    key=lambda item: -item[1])
+        for key, group in totals.items()
+    }
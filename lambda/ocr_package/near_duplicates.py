@@ -0,0 +1,97 @@
+import os
+import re
+import hashlib
+
+from boto3.dynamodb.conditions import Key
+
+# Near-duplicate menus: a re-photographed or re-scanned menu has new bytes (so a new SHA-256) but
+# almost the same text. A 64-bit SimHash of the text differs in only a few bits between such copies.
+# The signature is split into BANDS bands of 16 bits and each extraction is filed under all of them
+# in SIMHASH_TABLE; two signatures within MAX_DISTANCE bits (< BANDS) always share at least one
+# band exactly, so finding candidates is BANDS key lookups instead of a scan of ocr-extractions.
+# A 16-bit band has 65536 buckets, so a lookup reads about 4N/65536 unrelated items; 8-bit bands
+# (256 buckets) read N/32 and grew with the table.
+SIMHASH_BITS = 64
+BANDS = 4
+BAND_BITS = SIMHASH_BITS // BANDS
+MAX_DISTANCE = min(int(os.environ.get('NEAR_DUP_DISTANCE', '3')), BANDS - 1)
+# Too little text (a photo of a sign, a blank page) gives meaningless signatures
+MIN_TOKENS = 20
+
+_TOKEN_RE = re.compile(r'\w+', re.UNICODE)
+
+
+def text_features(text):
+    """Words and word pairs of the normalized text, with their counts."""
+    tokens = _TOKEN_RE.findall(text.lower())
+    features = {}
+    for i, token in enumerate(tokens):
+        features[token] = features.get(token, 0) + 1
+        if i:
+            pair = f'{tokens[i - 1]} {token}'
+            features[pair] = features.get(pair, 0) + 1
+    return len(tokens), features
+
+
+def simhash(text):
+    """64-bit SimHash of the text, or None when it has fewer than MIN_TOKENS words."""
+    token_count, features = text_features(text or '')
+    if token_count < MIN_TOKENS:
+        return None
+    weights = [0] * SIMHASH_BITS
+    for feature, count in features.items():
+        h = int.from_bytes(hashlib.blake2b(feature.encode('utf-8'), digest_size=8).digest(), 'big')
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if h >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming(a, b):
+    return bin(a ^ b).count('1')
+
+
+def to_hex(signature):
+    return f'{signature:016x}'
+
+
+def band_keys(signature):
+    """Bucket keys for a signature: '0#3f1c', '1#a204', ..."""
+    mask = (1 << BAND_BITS) - 1
+    return [f'{band}#{signature >> (band * BAND_BITS) & mask:04x}' for band in range(BANDS)]
+
+
+def find_near_duplicate(table, signature):
+    """Closest indexed extraction within MAX_DISTANCE bits: {'id', 'canonical_id', 'distance'}, or None."""
+    best = None
+    for band in band_keys(signature):
+        query = {'KeyConditionExpression': Key('band').eq(band)}
+        items = []
+        response = table.query(**query)
+        items.extend(response.get('Items', []))
+        while 'LastEvaluatedKey' in response:
+            response = table.query(ExclusiveStartKey=response['LastEvaluatedKey'], **query)
+            items.extend(response.get('Items', []))
+        for item in items:
+            distance = hamming(signature, int(item['simhash'], 16))
+            if distance <= MAX_DISTANCE and (best is None or distance < best['distance']):
+                best = {'id': item['id'], 'canonical_id': item.get('canonical_id', item['id']), 'distance': distance}
+    return best
+
+
+def index_signature(table, item_id, signature, canonical_id=None):
+    """File an extraction under each of its bands; canonical_id is the first copy of the menu."""
+    with table.batch_writer() as writer:
+        for band in band_keys(signature):
+            writer.put_item(Item={
+                'band': band,
+                'id': item_id,
+                'simhash': to_hex(signature),
+                'canonical_id': canonical_id or item_id
+            })
+
+
+def remove_signature(table, item_id, signature_hex):
+    """Drop a deleted extraction from its buckets."""
+    with table.batch_writer() as writer:
+        for band in band_keys(int(signature_hex, 16)):
+            writer.delete_item(Key={'band': band, 'id': item_id})
@@ -0,0 +1,185 @@
+"""Compact in-memory model of an OCR result.
+
+Textract responses for a dense menu run to tens of thousands of blocks, so words and lines
+are `__slots__` objects rather than dicts, and the parser makes a single pass over `Blocks`.
+The model serializes to the `text`/`lines`/`words` JSON that /ocr has always returned.
+"""
+
+# Words below this confidence are counted as suspicious in the stats
+LOW_CONFIDENCE = 80.0
+# Lines whose vertical centres are within this fraction of a line height share a row
+ROW_TOLERANCE = 0.5
+
+
+class Word:
+    __slots__ = ('text', 'confidence', 'page', 'top', 'left', 'width', 'height')
+
+    def __init__(self, text, confidence, page=1, top=0.0, left=0.0, width=0.0, height=0.0):
+        self.text = text
+        self.confidence = confidence
+        self.page = page
+        self.top = top
+        self.left = left
+        self.width = width
+        self.height = height
+
+    def to_json(self):
+        return {
+            'text': self.text,
+            'confidence': round(self.confidence, 1),
+            # Pages are stacked 100 units apart so `top` orders words across the whole document
+            'top': (self.page - 1) * 100 + self.top,
+            'left': self.left
+        }
+
+
+class Line:
+    __slots__ = ('text', 'page', 'top', 'left', 'height', 'words', 'child_ids')
+
+    def __init__(self, text, page=1, top=0.0, left=0.0, height=0.0, child_ids=()):
+        self.text = text
+        self.page = page
+        self.top = top
+        self.left = left
+        self.height = height
+        self.words = []
+        self.child_ids = child_ids
+
+    @property
+    def indent(self):
+        return int(self.left * 80)
+
+    def to_json(self):
+        return {
+            'text': self.text,
+            'words': [{'text': w.text, 'confidence': round(w.confidence, 1)} for w in self.words],
+            'indent': self.indent
+        }
+
+
+class Page:
+    __slots__ = ('number', 'lines')
+
+    def __init__(self, number):
+        self.number = number
+        self.lines = []
+
+
+class Document:
+    __slots__ = ('pages', 'orphan_words')
+
+    def __init__(self):
+        self.pages = {}
+        # Words Textract returned without a parent LINE; kept so no text is lost
+        self.orphan_words = []
+
+    def page(self, number):
+        page = self.pages.get(number)
+        if page is None:
+            page = self.pages[number] = Page(number)
+        return page
+
+    @classmethod
+    def from_textract_blocks(cls, blocks):
+        """Build a document from Textract `Blocks` in one pass, then link lines to their words."""
+        doc = cls()
+        words_by_id = {}
+        lines = []
+        for b in blocks:
+            block_type = b['BlockType']
+            if block_type != 'WORD' and block_type != 'LINE':
+                continue
+            box = b.get('Geometry', {}).get('BoundingBox', {})
+            page = b.get('Page', 1)
+            if block_type == 'WORD':
+                words_by_id[b['Id']] = Word(
+                    b.get('Text', ''), b.get('Confidence', 0.0), page,
+                    box.get('Top', 0.0), box.get('Left', 0.0), box.get('Width', 0.0), box.get('Height', 0.0)
+                )
+            else:
+                child_ids = ()
+                for rel in b.get('Relationships', ()):
+                    if rel['Type'] == 'CHILD':
+                        child_ids = rel['Ids']
+                        break
+                lines.append(Line(b.get('Text', ''), page, box.get('Top', 0.0), box.get('Left', 0.0),
+                                  box.get('Height', 0.0), child_ids))
+
+        # Each child id is visited once: O(blocks) overall
+        for line in lines:
+            for word_id in line.child_ids:
+                word = words_by_id.pop(word_id, None)
+                if word is not None:
+                    line.words.append(word)
+            line.child_ids = ()
+            doc.page(line.page).lines.append(line)
+        doc.orphan_words = list(words_by_id.values())
+        doc.sort_reading_order()
+        return doc
+
+    def sort_reading_order(self):
+        """Order lines top-to-bottom by row, and left-to-right within a row (e.g. dish, then price)."""
+        for page in self.pages.values():
+            by_top = sorted(page.lines, key=lambda l: l.top)
+            ordered = []
+            row = []
+            row_centre = row_height = 0.0
+            for line in by_top:
+                centre = line.top + line.height / 2
+                if row and abs(centre - row_centre) > max(row_height, line.height) * ROW_TOLERANCE:
+                    ordered.extend(sorted(row, key=lambda l: l.left))
+                    row = []
+                if not row:
+                    row_centre, row_height = centre, line.height
+                row.append(line)
+            ordered.extend(sorted(row, key=lambda l: l.left))
+            page.lines = ordered
+
+    def iter_lines(self):
+        for number in sorted(self.pages):
+            yield from self.pages[number].lines
+
+    def iter_words(self):
+        for line in self.iter_lines():
+            yield from line.words
+        yield from self.orphan_words
+
+    def confidence_stats(self):
+        """Mean/min/max word confidence and how many words fall below LOW_CONFIDENCE."""
+        count = 0
+        total = 0.0
+        low = 0
+        lowest = highest = None
+        for word in self.iter_words():
+            c = word.confidence
+            count += 1
+            total += c
+            if c < LOW_CONFIDENCE:
+                low += 1
+            if lowest is None or c < lowest:
+                lowest = c
+            if highest is None or c > highest:
+                highest = c
+        return {
+            'words': count,
+            'mean': round(total / count, 1) if count else 0.0,
+            'min': round(lowest, 1) if count else 0.0,
+            'max': round(highest, 1) if count else 0.0,
+            'low_confidence': low
+        }
+
+    def to_json(self):
+        """The /ocr response fields: text, lines, words, avg_confidence."""
+        lines = list(self.iter_lines())
+        return {
+            'text': '\n'.join(' ' * line.indent + line.text for line in lines),
+            'lines': [line.to_json() for line in lines],
+            'words': [word.to_json() for word in self.iter_words()],
+            'avg_confidence': self.confidence_stats()['mean']
+        }
+
+
+def parse_textract_blocks(blocks):
+    """Turn Textract Blocks into (text, lines, words, avg_confidence) in the /ocr response format."""
+    result = Document.from_textract_blocks(blocks).to_json()
+    return result['text'], result['lines'], result['words'], result['avg_confidence']
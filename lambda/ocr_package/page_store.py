@@ -0,0 +1,86 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from boto3.dynamodb.conditions import Key
+
+from result_store import get_result, write_result
+
+# Per-page results for /ocr?pages=..., keyed by content hash and 1-based page number: a later
+# request for other pages of the same PDF only extracts the pages nobody has asked for yet
+PAGE_PREFIX = 'pages/'
+
+
+def parse_page_ranges(spec, page_count):
+    """'1-3,7' -> [0, 1, 2, 6]: sorted 0-based pages. '5-' runs to the end; pages past it are dropped.
+
+    Raises ValueError for malformed ranges or when nothing is left.
+    """
+    pages = set()
+    for part in spec.replace(' ', '').split(','):
+        if not part:
+            continue
+        first, dash, last = part.partition('-')
+        try:
+            start = int(first)
+            stop = (int(last) if last else page_count) if dash else start
+        except ValueError:
+            raise ValueError(f'Invalid page range "{part}"')
+        if start < 1 or stop < start:
+            raise ValueError(f'Invalid page range "{part}"')
+        pages.update(range(start - 1, min(stop, page_count)))
+    if not pages:
+        raise ValueError(f'No pages selected by "{spec}" (the document has {page_count})')
+    return sorted(pages)
+
+
+def page_key(content_hash, page_num):
+    return f'{PAGE_PREFIX}{content_hash}/{page_num + 1}.json.gz'
+
+
+def stored_page_count(table, content_hash):
+    """Page count recorded with any stored page of this content, or None if none is stored."""
+    response = table.query(KeyConditionExpression=Key('hash').eq(content_hash), Limit=1)
+    items = response.get('Items', [])
+    return int(items[0]['page_count']) if items else None
+
+
+def load_pages(table, s3_client, bucket, content_hash, page_nums):
+    """{page_num: (text, lines, words)} for the requested pages that were extracted before."""
+    if not page_nums:
+        return {}
+    wanted = set(page_nums)
+    condition = Key('hash').eq(content_hash) & Key('page').between(min(wanted) + 1, max(wanted) + 1)
+    response = table.query(KeyConditionExpression=condition)
+    items = response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = table.query(KeyConditionExpression=condition, ExclusiveStartKey=response['LastEvaluatedKey'])
+        items.extend(response.get('Items', []))
+
+    pages = {}
+    for item in items:
+        page_num = int(item['page']) - 1
+        if page_num in wanted:
+            body = get_result(s3_client, bucket, item['result_key'])
+            pages[page_num] = (body.get('text', ''), body.get('lines', []), body.get('words', []))
+    return pages
+
+
+def save_pages(table, s3_client, bucket, content_hash, pages, page_count, engine_name):
+    """Store newly extracted pages: a gzip body per page in S3, and the records in one batch write."""
+    timestamp = datetime.now(timezone.utc).isoformat()
+    with table.batch_writer() as writer:
+        for page_num, (text, lines, words) in pages.items():
+            key = page_key(content_hash, page_num)
+            size = write_result(s3_client, bucket, key, {'text': text, 'lines': lines, 'words': words})
+            confidence = round(sum(w['confidence'] for w in words) / len(words), 1) if words else 100.0
+            writer.put_item(Item={
+                'hash': content_hash,
+                'page': page_num + 1,
+                'page_count': page_count,
+                'result_key': key,
+                'result_bytes': size,
+                'line_count': len(lines),
+                'avg_confidence': Decimal(str(confidence)),
+                'engine': engine_name,
+                'timestamp': timestamp
+            })
@@ -0,0 +1,237 @@
+import os
+import tempfile
+
+# pypdf, PyMuPDF, pdf2image and multiprocessing are imported where they're used: image requests
+# never need them, and importing pypdf alone adds ~90 ms to every cold start
+
+# Lambda only allows writes under /tmp; locally fall back to the system temp dir
+TMP_DIR = '/tmp' if os.path.isdir('/tmp') else tempfile.gettempdir()
+CHUNK_SIZE = 1024 * 1024
+# Below this many pages per worker, process start-up costs more than it saves
+MIN_PAGES_PER_WORKER = 4
+# A page with less text than this, or mostly unprintable glyphs, is treated as scanned
+MIN_TEXT_CHARS = 20
+MIN_PRINTABLE_RATIO = 0.8
+
+
+def spool_s3_object(s3_client, bucket, key, suffix=''):
+    """Stream an S3 object to a temp file in fixed-size chunks and return its path."""
+    obj = s3_client.get_object(Bucket=bucket, Key=key)
+    fd, path = tempfile.mkstemp(suffix=suffix, dir=TMP_DIR)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in obj['Body'].iter_chunks(CHUNK_SIZE):
+                f.write(chunk)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+def pdf_worker_count(requested=None):
+    """Resolve the worker count from the request or PDF_WORKERS ('auto' = one per vCPU)."""
+    value = requested or os.environ.get('PDF_WORKERS', '1')
+    cpus = os.cpu_count() or 1
+    if str(value).lower() == 'auto':
+        return cpus
+    try:
+        return max(1, min(int(value), cpus))
+    except ValueError:
+        return 1
+
+
+class PypdfEngine:
+    """Pure-Python extraction with pypdf; always available, so it's the fallback."""
+    name = 'pypdf'
+
+    def page_count(self, path):
+        from pypdf import PdfReader
+        with open(path, 'rb') as f:
+            return len(PdfReader(f).pages)
+
+    def iter_pages(self, path, start=0, stop=None):
+        from pypdf import PdfReader
+        with open(path, 'rb') as f:
+            reader = PdfReader(f)
+            stop = len(reader.pages) if stop is None else stop
+            for page_num in range(start, stop):
+                page_text = reader.pages[page_num].extract_text() or ''
+                # pypdf caches every resolved object; drop them so memory doesn't grow with page count
+                reader.resolved_objects.clear()
+                yield page_num, page_text
+
+
+class PyMuPDFEngine:
+    """MuPDF's C text extractor via pymupdf (installed into the package by build_ocr_package.py)."""
+    name = 'pymupdf'
+
+    def page_count(self, path):
+        import fitz
+        with fitz.open(path) as doc:
+            return doc.page_count
+
+    def iter_pages(self, path, start=0, stop=None):
+        import fitz
+        with fitz.open(path) as doc:
+            stop = doc.page_count if stop is None else stop
+            for page_num in range(start, stop):
+                yield page_num, doc[page_num].get_text()
+
+
+ENGINES = {
+    PypdfEngine.name: PypdfEngine,
+    PyMuPDFEngine.name: PyMuPDFEngine,
+}
+DEFAULT_ENGINE = PypdfEngine.name
+
+
+def get_engine(name=None):
+    """Engine for the request's `engine` parameter, else PDF_ENGINE; unknown names get the default."""
+    name = (name or os.environ.get('PDF_ENGINE') or DEFAULT_ENGINE).lower()
+    return ENGINES.get(name, ENGINES[DEFAULT_ENGINE])()
+
+
+def iter_pdf_pages(path, workers=1, engine=None):
+    """Yield (page_num, text) for each page, parsing one page at a time from disk.
+
+    If a non-default engine fails, extraction continues with pypdf from the first page
+    that wasn't yielded yet.
+    """
+    engine = engine or get_engine()
+    next_page = 0
+    try:
+        for page_num, page_text in _iter_engine_pages(path, workers, engine, next_page):
+            next_page = page_num + 1
+            yield page_num, page_text
+    except Exception as e:
+        if engine.name == PypdfEngine.name:
+            raise
+        print(f"{engine.name} failed at page {next_page}: {e} - falling back to pypdf")
+        yield from _iter_engine_pages(path, workers, PypdfEngine(), next_page)
+
+
+def iter_selected_pages(path, page_nums, engine=None):
+    """Yield (page_num, text) for only the given 0-based pages, in order, opening the PDF once per run
+    of consecutive pages. Falls back to pypdf like iter_pdf_pages."""
+    engine = engine or get_engine()
+    for start, stop in page_runs(page_nums):
+        next_page = start
+        try:
+            for page_num, page_text in engine.iter_pages(path, start, stop):
+                next_page = page_num + 1
+                yield page_num, page_text
+        except Exception as e:
+            if engine.name == PypdfEngine.name:
+                raise
+            print(f"{engine.name} failed at page {next_page}: {e} - falling back to pypdf")
+            engine = PypdfEngine()
+            yield from engine.iter_pages(path, next_page, stop)
+
+
+def page_runs(page_nums):
+    """[1, 2, 3, 7] -> [(1, 4), (7, 8)]: half-open ranges of consecutive pages."""
+    runs = []
+    for page_num in sorted(set(page_nums)):
+        if runs and runs[-1][1] == page_num:
+            runs[-1][1] = page_num + 1
+        else:
+            runs.append([page_num, page_num + 1])
+    return [tuple(run) for run in runs]
+
+
+def _iter_engine_pages(path, workers, engine, start):
+    if workers > 1:
+        yield from _iter_pdf_pages_parallel(path, workers, engine, start)
+    else:
+        yield from engine.iter_pages(path, start)
+
+
+def _extract_page_range(engine_name, path, start, stop, conn):
+    # Runs in a child process: send back the whole range, or the error message
+    try:
+        conn.send(('ok', list(ENGINES[engine_name]().iter_pages(path, start, stop))))
+    except Exception as e:
+        conn.send(('error', str(e)))
+    finally:
+        conn.close()
+
+
+def _iter_pdf_pages_parallel(path, workers, engine, start):
+    # Lambda has no /dev/shm, so multiprocessing.Pool and Queue are unavailable; use Process + Pipe
+    from multiprocessing import Pipe, Process
+
+    page_count = engine.page_count(path)
+    workers = max(1, min(workers, (page_count - start) // MIN_PAGES_PER_WORKER))
+    if workers == 1:
+        yield from engine.iter_pages(path, start, page_count)
+        return
+
+    # Contiguous ranges, so reading the workers back in order keeps page order
+    bounds = [start + (page_count - start) * i // workers for i in range(workers + 1)]
+    jobs = []
+    for range_start, range_stop in zip(bounds, bounds[1:]):
+        parent_conn, child_conn = Pipe(duplex=False)
+        process = Process(target=_extract_page_range, args=(engine.name, path, range_start, range_stop, child_conn))
+        process.start()
+        child_conn.close()
+        jobs.append((process, parent_conn))
+
+    try:
+        for process, conn in jobs:
+            status, payload = conn.recv()
+            if status == 'error':
+                raise RuntimeError(payload)
+            yield from payload
+    finally:
+        for process, conn in jobs:
+            conn.close()
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+
+
+def page_lines_and_words(page_num, page_text):
+    """Split a page of text into the `lines`/`words` structures returned by /ocr."""
+    lines = []
+    words = []
+    for line_num, line in enumerate(page_text.split('\n')):
+        line = line.strip()
+        if not line:
+            continue
+        line_words = line.split()
+        lines.append({
+            'text': line,
+            'words': [{'text': word, 'confidence': 100.0} for word in line_words],
+            'indent': 0
+        })
+        words.extend({'text': word, 'confidence': 100.0, 'top': page_num * 100 + line_num * 20, 'left': 0} for word in line_words)
+    return lines, words
+
+
+def has_text_layer(page_text):
+    """False for pages with no text or with garbage from a broken font encoding."""
+    stripped = ''.join(page_text.split())
+    if len(stripped) < MIN_TEXT_CHARS:
+        return False
+    # Unmapped glyphs come out as control chars, U+FFFD or private-use code points
+    printable = sum(1 for c in stripped if c.isprintable() and c != '\ufffd' and not '\ue000' <= c <= '\uf8ff')
+    return printable / len(stripped) >= MIN_PRINTABLE_RATIO
+
+
+def render_page_png(path, page_num, dpi, grayscale=True):
+    """Rasterize one page to a PNG, with PyMuPDF or (if poppler is installed) pdf2image."""
+    try:
+        import fitz
+    except ImportError:
+        fitz = None
+    if fitz is not None:
+        with fitz.open(path) as doc:
+            pixmap = doc[page_num].get_pixmap(dpi=dpi, colorspace=fitz.csGRAY if grayscale else fitz.csRGB)
+            return pixmap.tobytes('png')
+
+    import io
+    from pdf2image import convert_from_path
+    image = convert_from_path(path, dpi=dpi, first_page=page_num + 1, last_page=page_num + 1, grayscale=grayscale)[0]
+    buffer = io.BytesIO()
+    image.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
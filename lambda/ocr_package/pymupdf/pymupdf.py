@@ -1,2 +0,0 @@
-# pylint: disable=wildcard-import,unused-import
-from . import *
@@ -0,0 +1,52 @@
+import gzip
+import json
+
+import compact_format
+
+# Full extraction bodies live in S3; the DynamoDB item only keeps metadata and this key
+RESULT_PREFIX = 'extractions/'
+RESULT_FIELDS = ('text', 'lines', 'words')
+
+
+def result_key(item_id):
+    return f'{RESULT_PREFIX}{item_id}.json.gz'
+
+
+def put_result(s3_client, bucket, item_id, result):
+    """Write text/lines/words as gzip JSON and return (key, compressed size)."""
+    key = result_key(item_id)
+    return key, write_result(s3_client, bucket, key, result)
+
+
+def write_result(s3_client, bucket, key, result):
+    # Stored columnar (compact_format) rather than as a list of word objects
+    body = {'text': result['text'], 'compact': compact_format.encode(result['lines'], result['words'])}
+    data = gzip.compress(json.dumps(body, separators=(',', ':')).encode('utf-8'))
+    s3_client.put_object(
+        Bucket=bucket,
+        Key=key,
+        Body=data,
+        ContentType='application/json',
+        ContentEncoding='gzip'
+    )
+    return len(data)
+
+
+def get_result(s3_client, bucket, key):
+    """Read a result body back as text/lines/words, whichever layout it was stored in."""
+    obj = s3_client.get_object(Bucket=bucket, Key=key)
+    body = json.loads(gzip.decompress(obj['Body'].read()))
+    if 'compact' in body:
+        lines, words = compact_format.decode(body.pop('compact'))
+        body['lines'] = lines
+        body['words'] = words
+    return body
+
+
+def load_result(s3_client, bucket, item):
+    """Fill an item's text/lines/words from its S3 body; items saved before offloading are returned as-is."""
+    if item.get('result_key'):
+        result = get_result(s3_client, bucket, item['result_key'])
+        for field in RESULT_FIELDS:
+            item[field] = result.get(field, [] if field != 'text' else '')
+    return item
@@ -0,0 +1,28 @@
+import json
+from urllib.parse import unquote_plus
+
+
+def iter_s3_records(event):
+    """Yield the S3 event records in a Lambda event, unwrapping SNS envelopes.
+
+    The bucket notifies one SNS topic that fans out to every consumer, so records may arrive
+    directly from S3 or inside an SNS message.
+    """
+    for record in event.get('Records', []):
+        if 'Sns' in record:
+            yield from iter_s3_records(json.loads(record['Sns']['Message']))
+        elif 's3' in record:
+            yield record
+
+
+def object_key(record):
+    # Keys in S3 notifications are URL-encoded, with spaces as '+'
+    return unquote_plus(record['s3']['object']['key'])
+
+
+def sqs_message_records(message):
+    """S3 records in one SQS message from the SNS subscription (raw delivery or SNS envelope)."""
+    body = json.loads(message['body'])
+    if body.get('Type') == 'Notification':
+        body = json.loads(body['Message'])
+    return list(iter_s3_records(body))
@@ -0,0 +1,45 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from ocr_document import parse_textract_blocks
+from pdf_extract import render_page_png
+from rate_limiter import RateLimitExceeded
+
+# 200 DPI keeps menu body text legible for Textract while a grayscale A4 page stays ~1-2 MB as PNG
+OCR_DPI = int(os.environ.get('OCR_DPI', '200'))
+OCR_CONCURRENCY = int(os.environ.get('OCR_CONCURRENCY', '4'))
+
+
+def _ocr_page(textract, path, page_num, dpi):
+    png = render_page_png(path, page_num, dpi)
+    response = textract.detect_document_text(Document={'Bytes': png})
+    return page_num, response.get('Blocks', []), len(png)
+
+
+def ocr_scanned_pages(textract, path, page_nums, dpi=OCR_DPI, concurrency=OCR_CONCURRENCY):
+    """Rasterize the given pages and run Textract on them concurrently.
+
+    Returns {page_num: (text, lines, words)} with word positions offset by page, the same
+    layout page_lines_and_words uses, so results can be merged back in page order. A page that
+    can't be rasterized or OCR'd is left out, so the caller keeps its text-layer result.
+    """
+    results = {}
+    if not page_nums:
+        return results
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(page_nums)))) as pool:
+        futures = {page_num: pool.submit(_ocr_page, textract, path, page_num, dpi) for page_num in page_nums}
+        for page_num, future in futures.items():
+            try:
+                page_num, blocks, png_size = future.result()
+            except RateLimitExceeded:
+                # Throttling is the caller's to report (429 with Retry-After), not a page failure
+                raise
+            except Exception as e:
+                print(f"OCR page {page_num + 1} failed, keeping its text layer: {e}")
+                continue
+            text, lines, words, _ = parse_textract_blocks(blocks)
+            for word in words:
+                word['top'] += page_num * 100
+            results[page_num] = (text, lines, words)
+            print(f"OCR page {page_num + 1}: {png_size} byte PNG, {len(blocks)} blocks")
+    return results
@@ -0,0 +1,135 @@
+import math
+import os
+import re
+import unicodedata
+
+from boto3.dynamodb.conditions import Key
+
+# Inverted index over extraction text in SEARCH_TABLE: one posting item per (term, extraction id)
+# holding the term's count in that text, so a query reads the postings of its few terms and never
+# an extraction body. Per extraction, a '#doc' item keeps its term list (to drop stale postings when
+# the text is corrected or deleted), and the '#stats' item counts indexed extractions for the idf.
+SEARCH_TABLE = os.environ.get('SEARCH_TABLE')
+DOC_TERM = '#doc'
+STATS_KEY = {'term': '#stats', 'id': '#stats'}
+# Menus are short; the cap only guards against runaway OCR output
+MAX_TERMS_PER_DOCUMENT = 2000
+MAX_QUERY_TERMS = 8
+# BM25 term-frequency saturation
+K1 = 1.2
+
+STOPWORDS = {
+    # Italian
+    'di', 'da', 'in', 'con', 'su', 'per', 'tra', 'fra', 'il', 'lo', 'la', 'gli', 'le', 'un', 'una', 'uno',
+    'del', 'della', 'dei', 'delle', 'degli', 'al', 'alla', 'ai', 'alle', 'agli', 'dal', 'dalla', 'nel',
+    'nella', 'sul', 'sulla', 'ed', 'che', 'non',
+    # English
+    'the', 'and', 'of', 'with', 'to', 'on', 'an', 'or', 'for',
+}
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+
+def fold(text):
+    """Lowercase without accents: 'Caffè Ristretto' -> 'caffe ristretto'."""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+def tokenize(text):
+    """Index terms of a text. Words of 4 letters or more lose their final vowel, so Italian singular
+    and plural forms meet: pizza/pizze -> pizz, tagliatella/tagliatelle -> tagliatell, vino/vini -> vin."""
+    terms = []
+    for word in _WORD_RE.findall(fold(text or '')):
+        if len(word) < 2 or word in STOPWORDS:
+            continue
+        if len(word) >= 4 and word[-1] in 'aeiou':
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def term_counts(text):
+    counts = {}
+    for term in tokenize(text):
+        counts[term] = counts.get(term, 0) + 1
+    if len(counts) > MAX_TERMS_PER_DOCUMENT:
+        counts = dict(sorted(counts.items(), key=lambda item: -item[1])[:MAX_TERMS_PER_DOCUMENT])
+    return counts
+
+
+def index_document(table, item_id, text):
+    """(Re)index one extraction's text: new postings written, postings of vanished terms deleted."""
+    counts = term_counts(text)
+    doc = table.get_item(Key={'term': DOC_TERM, 'id': item_id}).get('Item')
+    old_terms = set(doc['terms']) if doc and doc.get('terms') else set()
+    with table.batch_writer() as writer:
+        for term in old_terms - set(counts):
+            writer.delete_item(Key={'term': term, 'id': item_id})
+        for term, count in counts.items():
+            writer.put_item(Item={'term': term, 'id': item_id, 'tf': count})
+        # DynamoDB sets can't be empty; an extraction without terms keeps an empty list
+        writer.put_item(Item={'term': DOC_TERM, 'id': item_id, 'terms': sorted(counts)})
+    if doc is None:
+        _count_documents(table, 1)
+    return len(counts)
+
+
+def remove_document(table, item_id):
+    doc = table.get_item(Key={'term': DOC_TERM, 'id': item_id}).get('Item')
+    if doc is None:
+        return
+    with table.batch_writer() as writer:
+        for term in doc.get('terms', []):
+            writer.delete_item(Key={'term': term, 'id': item_id})
+        writer.delete_item(Key={'term': DOC_TERM, 'id': item_id})
+    _count_documents(table, -1)
+
+
+def _count_documents(table, delta):
+    table.update_item(Key=STATS_KEY, UpdateExpression='ADD documents :d', ExpressionAttributeValues={':d': delta})
+
+
+def postings(table, term):
+    response = table.query(KeyConditionExpression=Key('term').eq(term))
+    items = response.get('Items', [])
+    while 'LastEvaluatedKey' in response:
+        response = table.query(KeyConditionExpression=Key('term').eq(term), ExclusiveStartKey=response['LastEvaluatedKey'])
+        items.extend(response.get('Items', []))
+    return items
+
+
+def search(table, query, limit=20):
+    """[(id, score, matched terms)] best first: extractions matching more query terms rank above
+    ones matching fewer, then by BM25-style tf-idf (without length normalization)."""
+    terms = list(dict.fromkeys(tokenize(query)))[:MAX_QUERY_TERMS]
+    if not terms:
+        return []
+    stats = table.get_item(Key=STATS_KEY).get('Item') or {}
+    documents = max(int(stats.get('documents', 0)), 1)
+    scores = {}
+    matched = {}
+    for term in terms:
+        items = postings(table, term)
+        if not items:
+            continue
+        idf = math.log(1 + (documents - len(items) + 0.5) / (len(items) + 0.5))
+        for item in items:
+            tf = int(item['tf'])
+            scores[item['id']] = scores.get(item['id'], 0.0) + idf * tf * (K1 + 1) / (tf + K1)
+            matched.setdefault(item['id'], []).append(term)
+    ranked = sorted(scores, key=lambda item_id: (-len(matched[item_id]), -scores[item_id]))
+    return [(item_id, round(scores[item_id], 3), matched[item_id]) for item_id in ranked[:limit]]
+
+
+def load_items(dynamodb, table_name, ids, **kwargs):
+    """The extractions with these ids (BatchGetItem, kwargs e.g. a projection), in the order given;
+    ids whose extraction is gone are left out."""
+    found = {}
+    for start in range(0, len(ids), 100):
+        request = {table_name: {'Keys': [{'id': item_id} for item_id in ids[start:start + 100]], **kwargs}}
+        while request:
+            response = dynamodb.batch_get_item(RequestItems=request)
+            for item in response.get('Responses', {}).get(table_name, []):
+                found[item['id']] = item
+            request = response.get('UnprocessedKeys')
+    return [found[item_id] for item_id in ids if item_id in found]
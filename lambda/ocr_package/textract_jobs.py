@@ -0,0 +1,104 @@
+import time
+from datetime import datetime, timezone
+
+# Job records are only needed while the browser polls; let DynamoDB TTL remove them after a week
+JOB_TTL_SECONDS = 7 * 24 * 3600
+# Textract returns at most 1000 blocks per GetDocumentTextDetection page
+MAX_RESULTS = 1000
+# Concurrent polls can all see a job finish; the one holding the claim saves it. A claim older than
+# this belongs to a poll that died mid-save and may be taken over.
+CLAIM_TIMEOUT_SECONDS = 120
+
+# File types that go through StartDocumentTextDetection even without ?async=1:
+# multi-page TIFFs are rejected by the synchronous API
+ALWAYS_ASYNC_EXTENSIONS = ('.tif', '.tiff')
+ASYNC_EXTENSIONS = ('.pdf', '.png', '.jpg', '.jpeg', '.tif', '.tiff')
+
+
+def start_job(textract, jobs_table, bucket, key, filename, content_hash=None):
+    """Start an asynchronous text detection job and record it; returns the job id."""
+    job_id = textract.start_document_text_detection(
+        DocumentLocation={'S3Object': {'Bucket': bucket, 'Name': key}}
+    )['JobId']
+
+    now = datetime.now(timezone.utc)
+    item = {
+        'job_id': job_id,
+        's3_key': key,
+        'filename': filename,
+        'status': 'IN_PROGRESS',
+        'created': now.isoformat(),
+        'expires_at': int(now.timestamp()) + JOB_TTL_SECONDS
+    }
+    if content_hash:
+        # Carried to the extraction so the result is found by hash-index
+        item['hash'] = content_hash
+    jobs_table.put_item(Item=item)
+    return job_id
+
+
+def get_job(jobs_table, job_id):
+    return jobs_table.get_item(Key={'job_id': job_id}).get('Item')
+
+
+def finish_job(jobs_table, job_id, status, extraction_id=None, message=None):
+    """Record the final state so later polls are answered from DynamoDB, not Textract."""
+    expression = 'SET #s = :s, finished = :f'
+    values = {':s': status, ':f': datetime.now(timezone.utc).isoformat()}
+    names = {'#s': 'status'}
+    if extraction_id:
+        expression += ', extraction_id = :e'
+        values[':e'] = extraction_id
+    if message:
+        expression += ', #m = :m'
+        names['#m'] = 'message'
+        values[':m'] = message
+    jobs_table.update_item(
+        Key={'job_id': job_id},
+        UpdateExpression=expression,
+        ExpressionAttributeNames=names,
+        ExpressionAttributeValues=values
+    )
+
+
+def claim_job(jobs_table, job_id):
+    """Take the right to save a finished job's result; False if it is saved or another poll has it."""
+    now = int(time.time())
+    try:
+        jobs_table.update_item(
+            Key={'job_id': job_id},
+            UpdateExpression='SET claimed_at = :now',
+            ConditionExpression='attribute_not_exists(extraction_id) AND '
+                                '(attribute_not_exists(claimed_at) OR claimed_at < :stale)',
+            ExpressionAttributeValues={':now': now, ':stale': now - CLAIM_TIMEOUT_SECONDS}
+        )
+        return True
+    except jobs_table.meta.client.exceptions.ConditionalCheckFailedException:
+        return False
+
+
+def release_job(jobs_table, job_id):
+    """Give the claim back after a failed save, so the next poll retries at once."""
+    jobs_table.update_item(Key={'job_id': job_id}, UpdateExpression='REMOVE claimed_at')
+
+
+def poll_job(textract, job_id):
+    """Fetch a job's state from Textract.
+
+    Returns (status, blocks, pages, message). Blocks are only collected once the job has
+    finished (SUCCEEDED or PARTIAL_SUCCESS), following NextToken across result pages.
+    """
+    response = textract.get_document_text_detection(JobId=job_id, MaxResults=MAX_RESULTS)
+    status = response['JobStatus']
+    pages = response.get('DocumentMetadata', {}).get('Pages', 0)
+    message = response.get('StatusMessage')
+    if status not in ('SUCCEEDED', 'PARTIAL_SUCCESS'):
+        return status, [], pages, message
+
+    blocks = list(response.get('Blocks', []))
+    while response.get('NextToken'):
+        response = textract.get_document_text_detection(
+            JobId=job_id, MaxResults=MAX_RESULTS, NextToken=response['NextToken']
+        )
+        blocks.extend(response.get('Blocks', []))
+    return status, blocks, pages, message
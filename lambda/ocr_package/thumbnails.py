@@ -0,0 +1,137 @@
+import io
+import os
+import json
+import time
+import boto3
+from boto3.dynamodb.conditions import Key
+from extraction_cache import HASH_INDEX, sha256_file
+from pdf_extract import spool_s3_object, render_page_png
+from s3_events import iter_s3_records, object_key
+from collection_version import bump_version
+
+# Small previews of page 1 for the history list, at keys derived from the upload key and its content
+THUMBNAIL_PREFIX = 'thumbnails/'
+# Hex digits of the content hash in the key: enough that a re-upload under the same name never collides
+THUMBNAIL_HASH_CHARS = 16
+THUMBNAIL_WIDTH = int(os.environ.get('THUMBNAIL_WIDTH', '320'))
+THUMBNAIL_QUALITY = 75
+# A4 at 40 dpi is ~330 px wide: render just above the target width, then downscale
+THUMBNAIL_DPI = 40
+# Upload keys are r/{restaurant}/{file name} and get reused, but the content hash in the thumbnail key
+# changes whenever the upload does, so browsers and CloudFront can keep a thumbnail forever
+CACHE_CONTROL = 'public, max-age=31536000, immutable'
+SOURCE_EXTENSIONS = ('.pdf', '.png', '.jpg', '.jpeg')
+
+
+def thumbnail_prefix(s3_key):
+    """Every thumbnail ever made for this upload key is under this prefix."""
+    return f'{THUMBNAIL_PREFIX}{s3_key}/'
+
+
+def thumbnail_key(s3_key, content_hash):
+    return f'{thumbnail_prefix(s3_key)}{content_hash[:THUMBNAIL_HASH_CHARS]}.webp'
+
+
+def delete_thumbnails(s3_client, bucket, s3_key, keep=None):
+    """Delete the upload's thumbnails (but keep), e.g. those of content it was overwritten with."""
+    paginator = s3_client.get_paginator('list_objects_v2')
+    deleted = 0
+    for page in paginator.paginate(Bucket=bucket, Prefix=thumbnail_prefix(s3_key)):
+        for obj in page.get('Contents', []):
+            if obj['Key'] != keep:
+                s3_client.delete_object(Bucket=bucket, Key=obj['Key'])
+                deleted += 1
+    return deleted
+
+
+def render_thumbnail(path, is_pdf):
+    """Page 1 (or the photo), upright and at most THUMBNAIL_WIDTH wide, as WebP bytes."""
+    from PIL import Image, ImageOps
+
+    if is_pdf:
+        image = Image.open(io.BytesIO(render_page_png(path, 0, THUMBNAIL_DPI, grayscale=False)))
+    else:
+        image = Image.open(path)
+        if image.format == 'JPEG':
+            # Decode at 1/2..1/8 scale: a 12 MP photo never needs full size for a 320 px preview
+            image.draft('RGB', (THUMBNAIL_WIDTH * 2, THUMBNAIL_WIDTH * 2))
+        image = ImageOps.exif_transpose(image)
+    image = image.convert('RGB')
+    image.thumbnail((THUMBNAIL_WIDTH, THUMBNAIL_WIDTH * 2), Image.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, format='WEBP', quality=THUMBNAIL_QUALITY, method=4)
+    return buffer.getvalue()
+
+
+def record_thumbnail(table, content_hash, s3_key, thumb_key):
+    """Set thumbnail_key on extractions of this upload; returns how many were updated.
+
+    Extractions are found through hash-index. When OCR finishes after the thumbnail,
+    save_extraction sets thumbnail_key itself.
+    """
+    updated = 0
+    response = table.query(IndexName=HASH_INDEX, KeyConditionExpression=Key('hash').eq(content_hash))
+    for item in response.get('Items', []):
+        try:
+            table.update_item(
+                Key={'id': item['id']},
+                UpdateExpression='SET thumbnail_key = :t',
+                ConditionExpression='s3_key = :k',
+                ExpressionAttributeValues={':t': thumb_key, ':k': s3_key}
+            )
+            updated += 1
+        except table.meta.client.exceptions.ConditionalCheckFailedException:
+            pass
+    if updated:
+        bump_version('extractions')
+    return updated
+
+
+def create_thumbnail(s3_client, table, bucket, key):
+    start = time.perf_counter()
+    path = spool_s3_object(s3_client, bucket, key, suffix=os.path.splitext(key)[1])
+    try:
+        source_bytes = os.path.getsize(path)
+        content_hash = sha256_file(path)
+        data = render_thumbnail(path, key.lower().endswith('.pdf'))
+    finally:
+        os.remove(path)
+
+    thumb_key = thumbnail_key(key, content_hash)
+    s3_client.put_object(
+        Bucket=bucket,
+        Key=thumb_key,
+        Body=data,
+        ContentType='image/webp',
+        CacheControl=CACHE_CONTROL
+    )
+    updated = record_thumbnail(table, content_hash, key, thumb_key)
+    # The upload was overwritten: the previous content's thumbnail is no longer referenced
+    delete_thumbnails(s3_client, bucket, key, keep=thumb_key)
+    print(f"Thumbnail {thumb_key}: {source_bytes} -> {len(data)} bytes in "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms, {updated} extraction(s) updated")
+
+
+def lambda_handler(event, context):
+    s3_client = boto3.client('s3', region_name='eu-west-2')
+    dynamodb = boto3.resource('dynamodb', region_name='eu-west-2')
+    table = dynamodb.Table(os.environ['TABLE_NAME'])
+
+    for record in iter_s3_records(event):
+        bucket = record['s3']['bucket']['name']
+        key = object_key(record)
+        if not key.startswith('r/') or not key.lower().endswith(SOURCE_EXTENSIONS):
+            continue
+        try:
+            if record['eventName'].startswith('ObjectRemoved'):
+                deleted = delete_thumbnails(s3_client, bucket, key)
+                print(f"Deleted {deleted} thumbnail(s) for {key}")
+            else:
+                create_thumbnail(s3_client, table, bucket, key)
+        except Exception as e:
+            print(f"Thumbnail error for {key}: {e}")
+
+    return {
+        'statusCode': 200,
+        'body': json.dumps('Thumbnail processing completed')
+    }
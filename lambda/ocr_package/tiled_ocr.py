@@ -0,0 +1,168 @@
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Very large photos (wall menus) are OCR'd as overlapping full-resolution tiles instead of being shrunk
+TILE_IMAGES = os.environ.get('TILE_IMAGES', 'true').lower() == 'true'
+# Longest side above which tiling kicks in automatically (?tiles=1 forces it)
+TILE_THRESHOLD = int(os.environ.get('TILE_THRESHOLD', '6000'))
+TILE_SIZE = int(os.environ.get('TILE_SIZE', '2500'))
+# Must exceed the widest word so every word lies wholly inside at least one tile
+TILE_OVERLAP = int(os.environ.get('TILE_OVERLAP', '300'))
+TILE_CONCURRENCY = int(os.environ.get('TILE_CONCURRENCY', '4'))
+TILE_JPEG_QUALITY = 90
+
+
+def should_tile(data, forced=False):
+    """True if this image should go through tiled OCR; only reads the header, not the pixels."""
+    if forced:
+        return True
+    if not TILE_IMAGES:
+        return False
+    from PIL import Image
+    with Image.open(io.BytesIO(data)) as image:
+        return max(image.size) > TILE_THRESHOLD
+
+
+def _axis_tiles(length, size, overlap):
+    """(start, end, core_start, core_end) along one axis.
+
+    Cores split each overlap down the middle, so together they cover the axis exactly once.
+    """
+    if length <= size:
+        return [(0, length, 0, length)]
+    starts = list(range(0, length - size, size - overlap)) + [length - size]
+    spans = [(s, s + size) for s in starts]
+    tiles = []
+    for i, (start, end) in enumerate(spans):
+        core_start = 0 if i == 0 else (start + spans[i - 1][1]) / 2
+        core_end = length if i == len(spans) - 1 else (spans[i + 1][0] + end) / 2
+        tiles.append((start, end, core_start, core_end))
+    return tiles
+
+
+def plan_tiles(width, height, size=TILE_SIZE, overlap=TILE_OVERLAP):
+    """Tiles as (crop box, core region), both (x0, y0, x1, y1) in pixels, in row-major order."""
+    return [
+        ((x[0], y[0], x[1], y[1]), (x[2], y[2], x[3], y[3]))
+        for y in _axis_tiles(height, size, overlap)
+        for x in _axis_tiles(width, size, overlap)
+    ]
+
+
+def merge_tile_blocks(tile_results, width, height):
+    """Map each tile's Textract blocks into page coordinates and drop overlap duplicates.
+
+    tile_results is a list of ((crop box, core region), blocks). A word is kept only by the tile
+    whose core region contains its centre; a LINE keeps just those words, so a line cut by a tile
+    boundary comes back as fragments that the reading-order sort puts side by side.
+    """
+    merged = []
+    dropped = 0
+    for index, (tile, blocks) in enumerate(tile_results):
+        (x0, y0, x1, y1), (cx0, cy0, cx1, cy1) = tile
+        tile_w, tile_h = x1 - x0, y1 - y0
+        kept_words = {}
+        lines = []
+        for b in blocks:
+            if b['BlockType'] not in ('WORD', 'LINE'):
+                continue
+            box = b.get('Geometry', {}).get('BoundingBox', {})
+            left = x0 + box.get('Left', 0.0) * tile_w
+            top = y0 + box.get('Top', 0.0) * tile_h
+            w = box.get('Width', 0.0) * tile_w
+            h = box.get('Height', 0.0) * tile_h
+            if b['BlockType'] == 'LINE':
+                lines.append(b)
+                continue
+            centre_x, centre_y = left + w / 2, top + h / 2
+            if not (cx0 <= centre_x < cx1 and cy0 <= centre_y < cy1):
+                dropped += 1
+                continue
+            kept_words[b['Id']] = {
+                'BlockType': 'WORD',
+                'Id': f"t{index}-{b['Id']}",
+                'Page': 1,
+                'Text': b.get('Text', ''),
+                'Confidence': b.get('Confidence', 0.0),
+                'Geometry': {'BoundingBox': {'Left': left / width, 'Top': top / height, 'Width': w / width, 'Height': h / height}}
+            }
+
+        in_line = set()
+        for line in lines:
+            child_ids = [i for rel in line.get('Relationships', []) if rel['Type'] == 'CHILD' for i in rel['Ids']]
+            words = [kept_words[i] for i in child_ids if i in kept_words]
+            if not words:
+                continue
+            in_line.update(i for i in child_ids if i in kept_words)
+            boxes = [w['Geometry']['BoundingBox'] for w in words]
+            left = min(bx['Left'] for bx in boxes)
+            top = min(bx['Top'] for bx in boxes)
+            merged.append({
+                'BlockType': 'LINE',
+                'Id': f"t{index}-{line['Id']}",
+                'Page': 1,
+                'Text': ' '.join(w['Text'] for w in words),
+                'Confidence': line.get('Confidence', 0.0),
+                'Geometry': {'BoundingBox': {
+                    'Left': left,
+                    'Top': top,
+                    'Width': max(bx['Left'] + bx['Width'] for bx in boxes) - left,
+                    'Height': max(bx['Top'] + bx['Height'] for bx in boxes) - top
+                }},
+                'Relationships': [{'Type': 'CHILD', 'Ids': [w['Id'] for w in words]}]
+            })
+        merged.extend(kept_words.values())
+    return merged, dropped
+
+
+def _open_upright(data):
+    from PIL import Image, ImageOps
+
+    image = Image.open(io.BytesIO(data))
+    if image.format == 'JPEG':
+        # Grayscale decode at full scale: a third of the memory of RGB
+        image.draft('L', image.size)
+    if image.getexif().get(0x0112, 1) not in (0, 1):
+        image = ImageOps.exif_transpose(image)
+    if image.mode != 'L':
+        image = image.convert('L')
+    return image
+
+
+def _ocr_tile(textract, image, crop_box):
+    start = time.perf_counter()
+    buffer = io.BytesIO()
+    image.crop(crop_box).save(buffer, format='JPEG', quality=TILE_JPEG_QUALITY)
+    response = textract.detect_document_text(Document={'Bytes': buffer.getvalue()})
+    return response.get('Blocks', []), (time.perf_counter() - start) * 1000
+
+
+def ocr_tiled_image(textract, data, concurrency=TILE_CONCURRENCY):
+    """OCR an image as overlapping tiles through a bounded thread pool.
+
+    Returns (blocks in page coordinates, stats). Latency is roughly ceil(tiles / concurrency)
+    Textract calls rather than growing with image area.
+    """
+    image = _open_upright(data)
+    image.load()
+    width, height = image.size
+    tiles = plan_tiles(width, height)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(tiles)))) as pool:
+        results = list(pool.map(lambda tile: _ocr_tile(textract, image, tile[0]), tiles))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    blocks, dropped = merge_tile_blocks([(tile, r[0]) for tile, r in zip(tiles, results)], width, height)
+    stats = {
+        'width': width,
+        'height': height,
+        'tiles': len(tiles),
+        'concurrency': concurrency,
+        'tiles_ms': round(elapsed_ms, 1),
+        'slowest_tile_ms': round(max(r[1] for r in results), 1),
+        'overlap_words_dropped': dropped
+    }
+    return blocks, stats
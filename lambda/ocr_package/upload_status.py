@@ -0,0 +1,107 @@
+import os
+from datetime import datetime, timezone
+
+# What the upload worker has done with each uploaded object, in UPLOAD_STATUS_TABLE. Records are
+# keyed by s3_key and the object's ETag: upload keys are r/{restaurant}/{file name} and get reused,
+# so the browser, polling by s3_key, is matched to the version it uploaded through a HEAD, never to
+# the result or failure of an earlier file with the same name.
+UPLOAD_STATUS_TABLE = os.environ.get('UPLOAD_STATUS_TABLE')
+# Only needed while someone polls; DynamoDB TTL removes them after a week
+STATUS_TTL_SECONDS = 7 * 24 * 3600
+
+QUEUED = 'QUEUED'
+IN_PROGRESS = 'IN_PROGRESS'
+SUCCEEDED = 'SUCCEEDED'
+FAILED = 'FAILED'
+
+_table = None
+
+
+def status_table():
+    global _table
+    if _table is None and UPLOAD_STATUS_TABLE:
+        import boto3
+        _table = boto3.resource('dynamodb', region_name='eu-west-2').Table(UPLOAD_STATUS_TABLE)
+    return _table
+
+
+def object_etag(s3_client, bucket, key):
+    """The current ETag of an upload (unquoted), or None if there is no such object."""
+    try:
+        return s3_client.head_object(Bucket=bucket, Key=key)['ETag'].strip('"')
+    except s3_client.exceptions.ClientError as e:
+        if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+            return None
+        raise
+
+
+def set_status(s3_key, etag, status, table=None, **fields):
+    """Record the worker's progress on one object version; fields such as extraction_id or error
+    are set alongside (None removes them). Never raises: polling is a convenience, the extraction
+    itself must not fail over it."""
+    table = table or status_table()
+    if table is None or not etag:
+        return
+    now = datetime.now(timezone.utc)
+    sets = ['#s = :s', 'updated = :u', 'expires_at = :x']
+    removes = []
+    names = {'#s': 'status'}
+    values = {':s': status, ':u': now.isoformat(), ':x': int(now.timestamp()) + STATUS_TTL_SECONDS}
+    # Placeholders for every field: DynamoDB reserves many plain words
+    for i, (name, value) in enumerate(fields.items()):
+        names[f'#f{i}'] = name
+        if value is None:
+            removes.append(f'#f{i}')
+        else:
+            sets.append(f'#f{i} = :f{i}')
+            values[f':f{i}'] = value
+    expression = 'SET ' + ', '.join(sets) + (' REMOVE ' + ', '.join(removes) if removes else '')
+    try:
+        table.update_item(
+            Key={'s3_key': s3_key, 'etag': etag},
+            UpdateExpression=expression,
+            ExpressionAttributeNames=names,
+            ExpressionAttributeValues=values
+        )
+    except Exception as e:
+        print(f"Upload status error for {s3_key}: {e}")
+
+
+def get_status(s3_key, etag, table=None):
+    table = table or status_table()
+    if table is None or not etag:
+        return None
+    return table.get_item(Key={'s3_key': s3_key, 'etag': etag}).get('Item')
+
+
+def succeeded(s3_key, etag, table=None):
+    """Whether this object version already has its extraction; False when the table can't tell."""
+    try:
+        record = get_status(s3_key, etag, table)
+    except Exception as e:
+        print(f"Upload status error for {s3_key}: {e}")
+        return False
+    return bool(record) and record.get('status') == SUCCEEDED
+
+
+# A POST /ocr/batch is one more record in the same table, under a key no upload can have
+def batch_key(batch_id):
+    return {'s3_key': f'batch#{batch_id}', 'etag': '#'}
+
+
+def save_batch(batch_id, items, table=None):
+    """Record the keys of a batch, in request order, each with the ETag it was queued under
+    (None for a key with no object)."""
+    table = table or status_table()
+    now = int(datetime.now(timezone.utc).timestamp())
+    table.put_item(Item={
+        **batch_key(batch_id),
+        'items': [{'s3_key': item['s3_key'], 'etag': item['etag'] or ''} for item in items],
+        'created': now,
+        'expires_at': now + STATUS_TTL_SECONDS
+    })
+
+
+def get_batch(batch_id, table=None):
+    table = table or status_table()
+    return table.get_item(Key=batch_key(batch_id)).get('Item')
@@ -0,0 +1,176 @@
+import os
+import time
+import random
+
+# Client-side throttling for Textract, Comprehend and Bedrock shared by every Lambda container.
+# Each service gets one-second windows in the RATE_LIMIT_TABLE; a call takes a slot with an atomic,
+# conditional ADD, so concurrent containers together stay under the service quota.
+# The only copy: build_ocr_package.py and the terraform zips of the other Lambdas bundle this file.
+RATE_LIMIT_TABLE = os.environ.get('RATE_LIMIT_TABLE')
+
+# Calls per second per service, across all containers. Fractional rates widen the window
+# (0.2 = one call per 5 seconds).
+DEFAULT_RATES = {
+    'textract': float(os.environ.get('TEXTRACT_TPS', '5')),
+    'textract-get': float(os.environ.get('TEXTRACT_GET_TPS', '5')),
+    'comprehend': float(os.environ.get('COMPREHEND_TPS', '20')),
+    'bedrock': float(os.environ.get('BEDROCK_TPS', '0.5')),
+}
+# Longest a caller waits for a slot before giving up with RateLimitExceeded
+MAX_WAIT_SECONDS = float(os.environ.get('RATE_LIMIT_MAX_WAIT', '20'))
+MAX_RETRIES = 5
+BACKOFF_BASE = 0.25
+BACKOFF_CAP = 8.0
+# Adaptive limit: halve this container's share after a throttle, win it back 5% per success
+MIN_SCALE = 0.1
+RECOVERY_STEP = 0.05
+WINDOW_TTL_SECONDS = 300
+
+THROTTLE_CODES = {
+    'ThrottlingException',
+    'ProvisionedThroughputExceededException',
+    'TooManyRequestsException',
+    'LimitExceededException',
+    'RequestLimitExceeded',
+}
+
+
+class RateLimitExceeded(Exception):
+    """The service stayed throttled past MAX_WAIT_SECONDS or MAX_RETRIES; safe to retry later."""
+
+    def __init__(self, service, retry_after):
+        super().__init__(f'{service} is busy, retry in {retry_after:.0f}s')
+        self.service = service
+        self.retry_after = retry_after
+
+
+def is_throttle(error):
+    code = getattr(error, 'response', {}).get('Error', {}).get('Code', '')
+    return code in THROTTLE_CODES or type(error).__name__ in THROTTLE_CODES
+
+
+class RateLimiter:
+    """Token bucket for one service, refilled every window, with adaptive backoff on throttles.
+
+    Without a table only the backoff runs, so the limiter never blocks a Lambda that lacks one.
+    A DynamoDB error also lets the call through: throttling is a guard, not a dependency.
+    """
+
+    def __init__(self, service, rate=None, table=None, clock=time.time, sleep=time.sleep):
+        self.service = service
+        self.rate = rate if rate is not None else DEFAULT_RATES[service]
+        self.window = 1.0 if self.rate >= 1 else 1.0 / self.rate
+        self.table = table
+        self.scale = 1.0
+        self.clock = clock
+        self.sleep = sleep
+
+    def limit(self):
+        """Calls allowed per window for this container right now."""
+        return max(1, int(self.rate * self.window * self.scale))
+
+    def _take_slot(self):
+        """Seconds to wait before trying again, or 0 if a slot was taken."""
+        now = self.clock()
+        index = int(now // self.window)
+        try:
+            self.table.update_item(
+                Key={'pk': f'{self.service}#{index}'},
+                UpdateExpression='ADD calls :one SET expires_at = if_not_exists(expires_at, :ttl)',
+                ConditionExpression='attribute_not_exists(calls) OR calls < :limit',
+                ExpressionAttributeValues={':one': 1, ':limit': self.limit(), ':ttl': int(now) + WINDOW_TTL_SECONDS}
+            )
+            return 0
+        except self.table.meta.client.exceptions.ConditionalCheckFailedException:
+            # Window full: try again at the start of the next one, spread out so callers don't stampede
+            return (index + 1) * self.window - now + random.uniform(0, self.window / 10)
+        except Exception as e:
+            print(f"Rate limiter table error for {self.service}, not limiting: {e}")
+            return 0
+
+    def acquire(self):
+        if self.table is None:
+            return
+        deadline = self.clock() + MAX_WAIT_SECONDS
+        while True:
+            wait = self._take_slot()
+            if not wait:
+                return
+            if self.clock() + wait > deadline:
+                raise RateLimitExceeded(self.service, wait)
+            self.sleep(wait)
+
+    def call(self, fn, *args, **kwargs):
+        """fn(*args, **kwargs) once a slot is free, retried with full-jitter backoff on throttles."""
+        for attempt in range(MAX_RETRIES + 1):
+            self.acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                if not is_throttle(e):
+                    raise
+                self.scale = max(MIN_SCALE, self.scale / 2)
+                delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+                print(f"{self.service} throttled (attempt {attempt + 1}), backing off {delay:.2f}s, "
+                      f"limit now {self.limit()}/window")
+                if attempt == MAX_RETRIES:
+                    raise RateLimitExceeded(self.service, BACKOFF_CAP) from e
+                self.sleep(delay)
+                continue
+            self.scale = min(1.0, self.scale + RECOVERY_STEP)
+            return result
+
+
+class RateLimitedClient:
+    """Wrap a boto3 client so the listed operations go through a RateLimiter.
+
+    operations maps method name to service key, e.g. {'detect_document_text': 'textract'};
+    every other method is passed straight through.
+    """
+
+    def __init__(self, client, operations, table=None):
+        self._client = client
+        self._operations = operations
+        self._limiters = {service: get_limiter(service, table) for service in set(operations.values())}
+
+    def __getattr__(self, name):
+        method = getattr(self._client, name)
+        service = self._operations.get(name)
+        if service is None:
+            return method
+        limiter = self._limiters[service]
+        return lambda *args, **kwargs: limiter.call(method, *args, **kwargs)
+
+
+TEXTRACT_OPERATIONS = {
+    'detect_document_text': 'textract',
+    'start_document_text_detection': 'textract',
+    'get_document_text_detection': 'textract-get',
+}
+COMPREHEND_OPERATIONS = {
+    'detect_dominant_language': 'comprehend',
+    'detect_entities': 'comprehend',
+    'detect_key_phrases': 'comprehend',
+    'detect_sentiment': 'comprehend',
+    'detect_syntax': 'comprehend',
+}
+BEDROCK_OPERATIONS = {
+    'invoke_model': 'bedrock',
+}
+
+# One limiter per service per container, so the adaptive scale survives between invocations
+_limiters = {}
+
+
+def get_limiter(service, table=None):
+    if service not in _limiters:
+        if table is None and RATE_LIMIT_TABLE:
+            import boto3
+            table = boto3.resource('dynamodb', region_name='eu-west-2').Table(RATE_LIMIT_TABLE)
+        _limiters[service] = RateLimiter(service, table=table)
+    return _limiters[service]
+
+
+def rate_limited(client, operations):
+    """`rate_limited(boto3.client('textract', ...), TEXTRACT_OPERATIONS)`"""
+    return RateLimitedClient(client, operations)
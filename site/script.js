@@ -18,6 +18,25 @@ let selectedFile = null;
 const MAX_FILE_SIZE = 10 * 1024 * 1024; // 10MB
 const ALLOWED_TYPES = ['image/png', 'image/jpeg', 'image/jpg', 'application/pdf'];
 
+// Last body and ETag per URL: reads send If-None-Match and reuse the body when the API answers 304
+const etagCache = new Map();
+
+async function fetchJsonCached(url) {
+  const cached = etagCache.get(url);
+  // no-store keeps the browser's own HTTP cache out of the way, so the 304 reaches this code
+  const res = await fetch(url, { cache: 'no-store', headers: cached ? { 'If-None-Match': cached.etag } : {} });
+  if (res.status === 304 && cached) return cached.data;
+  if (!res.ok) throw new Error(`HTTP ${res.status}: ${res.statusText}`);
+  const data = await res.json();
+  const etag = res.headers.get('ETag');
+  if (etag) {
+    etagCache.set(url, { etag, data });
+  } else {
+    etagCache.delete(url);
+  }
+  return data;
+}
+
 // File validation
 function validateFile(file) {
   if (!file) return 'Please select a file.';
@@ -148,6 +167,84 @@ async function computeSHA256(file) {
   return hashArray.map(b => b.toString(16).padStart(2, '0')).join('');
 }
 
+// Columnar ?format=compact results (see lambda/ocr_package/compact_format.py)
+const COMPACT_PACKED = { word_conf: 'H', word_top: 'i', word_left: 'i', line_indent: 'H', line_words: 'I', line_word_conf: 'H' };
+
+function unpackColumn(b64, type) {
+  const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+  const view = new DataView(bytes.buffer);
+  const size = type === 'H' ? 2 : 4;
+  const out = new Array(bytes.length / size);
+  for (let i = 0; i < out.length; i++) {
+    const off = i * size;
+    out[i] = type === 'H' ? view.getUint16(off, true) : type === 'i' ? view.getInt32(off, true) : view.getUint32(off, true);
+  }
+  return out;
+}
+
+function decodeCompact(c) {
+  const col = name => (c.packed && COMPACT_PACKED[name] && c[name] !== undefined) ? unpackColumn(c[name], COMPACT_PACKED[name]) : (c[name] || []);
+  const wordText = c.word_text, wordConf = col('word_conf'), wordTop = col('word_top'), wordLeft = col('word_left');
+  const words = wordText.map((text, i) => ({ text, confidence: wordConf[i] / 10, top: wordTop[i] / 10000, left: wordLeft[i] / 10000 }));
+  const srcText = c.line_word_text || wordText;
+  const srcConf = c.line_word_text ? col('line_word_conf') : wordConf;
+  const indents = col('line_indent'), counts = col('line_words');
+  let pos = 0;
+  const lines = c.line_text.map((text, i) => {
+    const lineWords = [];
+    for (let j = pos; j < pos + counts[i]; j++) lineWords.push({ text: srcText[j], confidence: srcConf[j] / 10 });
+    pos += counts[i];
+    return { text: text !== null ? text : lineWords.map(w => w.text).join(' '), words: lineWords, indent: indents[i] };
+  });
+  return { lines, words };
+}
+
+function expandCompact(data) {
+  if (data && data.compact) {
+    const { lines, words } = decodeCompact(data.compact);
+    data.lines = lines;
+    data.words = words;
+    delete data.compact;
+  }
+  return data;
+}
+
+// Large documents are extracted by an async Textract job; poll until it has a result
+async function pollOcrJob(jobId) {
+  const started = Date.now();
+  while (true) {
+    await new Promise(resolve => setTimeout(resolve, 2000));
+    const res = await fetch(`${apiUrl}/ocr/status?job_id=${encodeURIComponent(jobId)}&format=compact&pack=1`);
+    if (!res.ok) throw new Error(`OCR status check failed: ${res.status} ${await res.text()}`);
+    const data = await res.json();
+    if (data.status === 'FAILED') throw new Error(data.error || 'OCR job failed');
+    if (data.status !== 'IN_PROGRESS') return expandCompact(data);
+    const seconds = Math.round((Date.now() - started) / 1000);
+    setProgress(Math.min(95, 70 + seconds), `Extracting text from document... (${seconds}s)`);
+  }
+}
+
+// Uploads are OCR'd by the background worker (S3 -> SNS -> SQS), which records its progress per
+// upload; poll it by s3_key. Never runs /ocr itself, which would extract the file a second time.
+// Returns null if the worker hasn't finished in time; the result then appears in the history.
+async function pollUploadResult(s3Key, timeoutMs = 180000) {
+  const started = Date.now();
+  while (Date.now() - started < timeoutMs) {
+    await new Promise(resolve => setTimeout(resolve, 2000));
+    const res = await fetch(`${apiUrl}/ocr/status?s3_key=${encodeURIComponent(s3Key)}&format=compact&pack=1`);
+    // Throttled or a transient error: keep polling
+    if (res.status === 429 || res.status >= 500) continue;
+    if (!res.ok) throw new Error(`OCR status check failed: ${res.status} ${await res.text()}`);
+    const data = await res.json();
+    if (data.status === 'FAILED') throw new Error(data.error || 'OCR failed');
+    if (data.status === 'SUCCEEDED') return expandCompact(data);
+    const seconds = Math.round((Date.now() - started) / 1000);
+    const stage = data.status === 'QUEUED' ? 'Waiting for the OCR worker...' : 'Extracting text from document...';
+    setProgress(Math.min(95, 70 + Math.round(seconds / 8)), `${stage} (${seconds}s)`);
+  }
+  return null;
+}
+
 function switchTab(tab) {
   document.querySelectorAll('.overlay-tab').forEach(t => t.classList.remove('active'));
   document.querySelectorAll('.tab-panel').forEach(p => p.classList.remove('active'));
@@ -219,39 +316,68 @@ function formatDate(iso) {
   } catch(e) { return iso; }
 }
 
-async function loadHistory() {
-  historyList.innerHTML = '<li class="history-loading">Loading...</li>';
+// Menus (near-duplicate groups) already listed, so a later page doesn't repeat one
+let historyGroups = new Set();
+
+// First page of the history, or the page after `cursor` appended by the "Load more" button
+async function loadHistory(cursor) {
+  const moreBtn = historyList.querySelector('.history-more');
+  if (cursor) {
+    if (moreBtn) moreBtn.remove();
+  } else {
+    historyGroups = new Set();
+    historyList.innerHTML = '<li class="history-loading">Loading...</li>';
+  }
   try {
-    const res = await fetch(`${apiUrl}/extractions`);
-    if (!res.ok) throw new Error('Failed to load');
-    const data = await res.json();
-    const items = data.extractions || [];
-    if (items.length === 0) {
+    // Re-uploads of the same menu come back as one entry with a `duplicates` count
+    const next = cursor ? `&next=${encodeURIComponent(cursor)}` : '';
+    const data = await fetchJsonCached(`${apiUrl}/extractions?collapse=1&limit=20${next}`);
+    const items = (data.extractions || []).filter(item => {
+      const group = item.duplicate_of || item.id;
+      if (historyGroups.has(group)) return false;
+      historyGroups.add(group);
+      return true;
+    });
+    if (!cursor) historyList.innerHTML = '';
+    if (items.length === 0 && !cursor && !data.next) {
       historyList.innerHTML = '<li class="history-empty">No extractions yet. Upload an image to get started!</li>';
       return;
     }
-    historyList.innerHTML = '';
     items.forEach(item => {
       const li = document.createElement('li');
       const lines = item.line_count || 0;
       const conf = item.avg_confidence !== undefined ? ` &bull; ${item.avg_confidence}%` : '';
       const corrected = item.corrected ? '<span class="badge-corrected">Corrected</span>' : '';
+      const copies = item.duplicates ? `<span class="badge-duplicates" title="Near-identical uploads of this menu">+${item.duplicates} similar</span>` : '';
       const fileWarning = item.file_exists === false ? '<span class="file-warning" title="Original file not found in S3">⚠️ File Missing</span>' : '';
+      // Thumbnails are a few KB and cached forever; never load the original here
+      const thumb = item.thumbnail_key ? `<img class="history-item-thumb" src="${imageBaseUrl}/${encodeURI(item.thumbnail_key)}" alt="" loading="lazy" width="48">` : '';
       li.innerHTML = `
+        ${thumb}
         <div class="history-item-info">
-          <div class="history-item-name">${escapeHtml(item.filename)}${corrected}${fileWarning}</div>
+          <div class="history-item-name">${escapeHtml(item.filename)}${corrected}${copies}${fileWarning}</div>
           <div class="history-item-meta">${formatDate(item.timestamp)} &mdash; ${lines} line${lines !== 1 ? 's' : ''}${conf}</div>
         </div>
         <div class="history-item-actions">
-          <button class="history-item-btn" onclick="viewExtraction(this)" data-text="${escapeAttr(item.text)}" data-filename="${escapeAttr(item.filename)}" data-s3-key="${escapeAttr(item.s3_key)}" data-timestamp="${escapeAttr(item.timestamp)}" data-id="${escapeAttr(item.id)}" data-conf="${item.avg_confidence || ''}">View</button>
+          <button class="history-item-btn" onclick="viewExtraction(this)" data-filename="${escapeAttr(item.filename)}" data-s3-key="${escapeAttr(item.s3_key)}" data-timestamp="${escapeAttr(item.timestamp)}" data-id="${escapeAttr(item.id)}" data-conf="${item.avg_confidence || ''}">View</button>
           <button class="history-item-download" onclick="downloadExtraction(this)" data-s3-key="${escapeAttr(item.s3_key)}" data-filename="${escapeAttr(item.filename)}" title="Download Original File">📥</button>
         </div>
         <button class="history-item-delete" onclick="deleteExtraction(this)" data-id="${escapeAttr(item.id)}" title="Delete">&times;</button>
       `;
       historyList.appendChild(li);
     });
+    if (data.next) {
+      const li = document.createElement('li');
+      li.className = 'history-more';
+      li.innerHTML = `<button class="history-item-btn" data-next="${escapeAttr(data.next)}" onclick="loadHistory(this.getAttribute('data-next'))">Load more</button>`;
+      historyList.appendChild(li);
+    }
   } catch (err) {
-    historyList.innerHTML = '<li class="history-empty">Failed to load history.</li>';
+    if (cursor) {
+      alert('Failed to load more history.');
+    } else {
+      historyList.innerHTML = '<li class="history-empty">Failed to load history.</li>';
+    }
     console.error(err);
   }
 }
@@ -265,8 +391,8 @@ function escapeAttr(s) {
   return (s || '').replace(/&/g,'&amp;').replace(/"/g,'&quot;').replace(/</g,'&lt;').replace(/>/g,'&gt;');
 }
 
-function viewExtraction(btn) {
-  const text = btn.getAttribute('data-text');
+async function viewExtraction(btn) {
+  let text = '';
   const filename = btn.getAttribute('data-filename');
   const s3Key = btn.getAttribute('data-s3-key');
   const timestamp = btn.getAttribute('data-timestamp');
@@ -277,6 +403,17 @@ function viewExtraction(btn) {
     avg_confidence: conf ? parseFloat(conf) : undefined,
     lines: null
   };
+  // The list only carries metadata; fetch the full text and lines on demand
+  try {
+    const data = await fetchJsonCached(`${apiUrl}/extractions/${encodeURIComponent(id)}?format=compact&pack=1`);
+    expandCompact(data.extraction);
+    text = data.extraction.text || '';
+    // Corrected text no longer matches the OCR lines, so show it plain
+    ocrData.lines = data.extraction.corrected ? null : (data.extraction.lines || null);
+  } catch (err) {
+    text = 'Could not load this extraction.';
+    console.error(err);
+  }
   showOverlay(text, filename + ' \u2014 ' + formatDate(timestamp), s3Key, ocrData);
 }
 
@@ -414,35 +551,30 @@ async function loadMenu() {
   const list = document.getElementById('menuList');
   list.innerHTML = 'Loading menu items...';
   try {
-    const res = await fetch(`${apiUrl}/menu?extraction_id=${currentExtractionId}`);
-    if (res.ok) {
-      const data = await res.json();
-      currentMenuItems = data.menu_items;
-      if (data.menu_items.length === 0) {
-        list.innerHTML = '<p style="color:#888">No menu items yet. Add one below.</p>';
-      } else {
-        list.innerHTML = '';
-        data.menu_items.forEach(item => {
-          const div = document.createElement('div');
-          div.className = 'menu-item';
-          div.innerHTML = `
-            <img src="${siteBaseUrl}/${encodeURIComponent(item.image_key)}" alt="${escapeHtml(item.dish_name)}">
-            <div class="menu-item-details">
-              <div class="menu-item-name">${escapeHtml(item.dish_name)}</div>
-              <div class="menu-item-desc">${escapeHtml(item.description)}</div>
-              <div class="menu-item-ingredients">Ingredients: ${item.ingredients.map(i => `${i.quantity} ${i.name}`).join(', ')}</div>
-              <div class="menu-item-meta">TTS: ${escapeHtml(item.tts)} | Price: $${item.ptb}</div>
-            </div>
-            <div class="menu-item-actions">
-              <button onclick="editMenuItem('${item.id}')">Edit</button>
-              <button onclick="deleteMenuItem('${item.id}')" class="btn-danger">Delete</button>
-            </div>
-          `;
-          list.appendChild(div);
-        });
-      }
+    const data = await fetchJsonCached(`${apiUrl}/menu?extraction_id=${currentExtractionId}`);
+    currentMenuItems = data.menu_items;
+    if (data.menu_items.length === 0) {
+      list.innerHTML = '<p style="color:#888">No menu items yet. Add one below.</p>';
     } else {
-      list.innerHTML = '<p style="color:#ef4444">Failed to load menu items.</p>';
+      list.innerHTML = '';
+      data.menu_items.forEach(item => {
+        const div = document.createElement('div');
+        div.className = 'menu-item';
+        div.innerHTML = `
+          <img src="${siteBaseUrl}/${encodeURIComponent(item.image_key)}" alt="${escapeHtml(item.dish_name)}">
+          <div class="menu-item-details">
+            <div class="menu-item-name">${escapeHtml(item.dish_name)}</div>
+            <div class="menu-item-desc">${escapeHtml(item.description)}</div>
+            <div class="menu-item-ingredients">Ingredients: ${item.ingredients.map(i => `${i.quantity} ${i.name}`).join(', ')}</div>
+            <div class="menu-item-meta">TTS: ${escapeHtml(item.tts)} | Price: $${item.ptb}</div>
+          </div>
+          <div class="menu-item-actions">
+            <button onclick="editMenuItem('${item.id}')">Edit</button>
+            <button onclick="deleteMenuItem('${item.id}')" class="btn-danger">Delete</button>
+          </div>
+        `;
+        list.appendChild(div);
+      });
     }
   } catch (err) {
     list.innerHTML = '<p style="color:#ef4444">Error loading menu: ' + escapeHtml(err.message) + '</p>';
@@ -685,35 +817,56 @@ document.addEventListener('DOMContentLoaded', function() {
         resetUI();
         return;
       }
-      const { url, s3_key } = await presignRes.json();
+      const { url, s3_key, duplicate } = await presignRes.json();
 
-      setProgress(30, 'Uploading file...');
-      const uploadRes = await fetch(url, {
-        method: 'PUT',
-        headers: { 'Content-Type': 'application/octet-stream' },
-        body: file
-      });
-      if (!uploadRes.ok) {
-        const errText = await uploadRes.text();
-        statusEl.innerText = `❌ Upload failed: ${errText}`;
-        setProgress(0, '');
-        resetUI();
-        return;
+      if (duplicate) {
+        // Same content was already extracted: skip the upload, /ocr answers from its cache
+        setProgress(60, 'Already processed, loading saved result...');
+      } else {
+        setProgress(30, 'Uploading file...');
+        const uploadRes = await fetch(url, {
+          method: 'PUT',
+          headers: { 'Content-Type': 'application/octet-stream' },
+          body: file
+        });
+        if (!uploadRes.ok) {
+          const errText = await uploadRes.text();
+          statusEl.innerText = `❌ Upload failed: ${errText}`;
+          setProgress(0, '');
+          resetUI();
+          return;
+        }
+
+        setProgress(60, 'File uploaded successfully. Starting OCR...');
       }
-      
-      setProgress(60, 'File uploaded successfully. Starting OCR...');
 
       setProgress(70, 'Extracting text from document...');
-      const ocrRes = await fetch(`${apiUrl}/ocr?s3_key=${encodeURIComponent(s3_key)}`);
-      setProgress(85, 'Processing OCR results...');
-      if (!ocrRes.ok) {
-        const errBody = await ocrRes.text();
-        statusEl.innerText = `❌ OCR failed: ${ocrRes.status} ${errBody}`;
-        setProgress(0, '');
-        resetUI();
-        return;
+      let ocrData = null;
+      if (!duplicate) {
+        ocrData = await pollUploadResult(s3_key);
+        if (!ocrData) {
+          statusEl.innerText = '⏳ Still processing — the result will appear in the history when it is ready.';
+          setProgress(0, '');
+          resetUI();
+          loadHistory();
+          return;
+        }
+      } else {
+        // Nothing was uploaded: /ocr answers from the extraction of the same content
+        const ocrRes = await fetch(`${apiUrl}/ocr?s3_key=${encodeURIComponent(s3_key)}&hash=${hash}&format=compact&pack=1`);
+        setProgress(85, 'Processing OCR results...');
+        if (!ocrRes.ok) {
+          const errBody = await ocrRes.text();
+          statusEl.innerText = `❌ OCR failed: ${ocrRes.status} ${errBody}`;
+          setProgress(0, '');
+          resetUI();
+          return;
+        }
+        ocrData = expandCompact(await ocrRes.json());
+        if (ocrRes.status === 202 && ocrData.job_id) {
+          ocrData = await pollOcrJob(ocrData.job_id);
+        }
       }
-      const ocrData = await ocrRes.json();
       
       setProgress(100, '✅ Processing complete!');
 
@@ -905,18 +1058,8 @@ async function loadTodos() {
       return;
     }
     console.log('Fetching todos from:', `${apiUrl}/todos`);
-    const response = await fetch(`${apiUrl}/todos`, {
-      method: 'GET',
-      headers: {
-        'Content-Type': 'application/json'
-      }
-      // Remove mode: 'cors' for local development to avoid mixed content issues
-    });
-    console.log('Response status:', response.status);
-    if (!response.ok) {
-      throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-    }
-    const data = await response.json();
+    // Unchanged todos come back as 304 and are served from the last response
+    const data = await fetchJsonCached(`${apiUrl}/todos`);
     console.log('Received data:', data);
     ul.innerHTML = '';
     if (data.todos) {
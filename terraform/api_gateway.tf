@@ -7,6 +7,8 @@ resource "aws_apigatewayv2_api" "presign_api" {
     allow_headers  = ["*", "Content-Type"]
     allow_methods  = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
     allow_origins  = ["*"]
+    # Read by the browser for conditional GETs and 429 retries
+    expose_headers = ["ETag", "Retry-After"]
     max_age        = 600
   }
 }
@@ -61,6 +63,22 @@ resource "aws_apigatewayv2_integration" "stats_lambda" {
   payload_format_version = "2.0"
 }
 
+resource "aws_apigatewayv2_integration" "menu_lambda" {
+  api_id                 = aws_apigatewayv2_api.presign_api.id
+  integration_type       = "AWS_PROXY"
+  integration_uri        = aws_lambda_function.menu.arn
+  integration_method     = "POST"
+  payload_format_version = "2.0"
+}
+
+resource "aws_apigatewayv2_integration" "todo_lambda" {
+  api_id                 = aws_apigatewayv2_api.presign_api.id
+  integration_type       = "AWS_PROXY"
+  integration_uri        = aws_lambda_function.todo.arn
+  integration_method     = "POST"
+  payload_format_version = "2.0"
+}
+
 # Add more integrations as needed...
 
 # --- Routes ---
@@ -77,12 +95,38 @@ resource "aws_apigatewayv2_route" "ocr_route" {
   target    = "integrations/${aws_apigatewayv2_integration.ocr_lambda.id}"
 }
 
+resource "aws_apigatewayv2_route" "ocr_status_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "GET /ocr/status"
+  target    = "integrations/${aws_apigatewayv2_integration.ocr_lambda.id}"
+}
+
+resource "aws_apigatewayv2_route" "ocr_batch_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "POST /ocr/batch"
+  target    = "integrations/${aws_apigatewayv2_integration.ocr_lambda.id}"
+}
+
 resource "aws_apigatewayv2_route" "list_route" {
   api_id    = aws_apigatewayv2_api.presign_api.id
   route_key = "GET /extractions"
   target    = "integrations/${aws_apigatewayv2_integration.list_lambda.id}"
 }
 
+# One extraction with its text, lines and words, fetched when a history entry is opened
+resource "aws_apigatewayv2_route" "extraction_detail_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "GET /extractions/{id}"
+  target    = "integrations/${aws_apigatewayv2_integration.list_lambda.id}"
+}
+
+# Ranked full-text search over extraction text, answered from the search index
+resource "aws_apigatewayv2_route" "search_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "GET /search"
+  target    = "integrations/${aws_apigatewayv2_integration.list_lambda.id}"
+}
+
 resource "aws_apigatewayv2_route" "delete_route" {
   api_id    = aws_apigatewayv2_api.presign_api.id
   route_key = "DELETE /extractions"
@@ -121,6 +165,55 @@ resource "aws_apigatewayv2_stage" "presign_stage" {
   auto_deploy = true
 }
 
+# Both Lambdas dispatch on the HTTP method
+resource "aws_apigatewayv2_route" "menu_get_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "GET /menu"
+  target    = "integrations/${aws_apigatewayv2_integration.menu_lambda.id}"
+}
+
+resource "aws_apigatewayv2_route" "menu_post_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "POST /menu"
+  target    = "integrations/${aws_apigatewayv2_integration.menu_lambda.id}"
+}
+
+resource "aws_apigatewayv2_route" "menu_put_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "PUT /menu"
+  target    = "integrations/${aws_apigatewayv2_integration.menu_lambda.id}"
+}
+
+resource "aws_apigatewayv2_route" "menu_delete_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "DELETE /menu"
+  target    = "integrations/${aws_apigatewayv2_integration.menu_lambda.id}"
+}
+
+resource "aws_apigatewayv2_route" "todo_get_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "GET /todos"
+  target    = "integrations/${aws_apigatewayv2_integration.todo_lambda.id}"
+}
+
+resource "aws_apigatewayv2_route" "todo_post_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "POST /todos"
+  target    = "integrations/${aws_apigatewayv2_integration.todo_lambda.id}"
+}
+
+resource "aws_apigatewayv2_route" "todo_put_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "PUT /todos"
+  target    = "integrations/${aws_apigatewayv2_integration.todo_lambda.id}"
+}
+
+resource "aws_apigatewayv2_route" "todo_delete_route" {
+  api_id    = aws_apigatewayv2_api.presign_api.id
+  route_key = "DELETE /todos"
+  target    = "integrations/${aws_apigatewayv2_integration.todo_lambda.id}"
+}
+
 # --- Lambda Permissions ---
 
 resource "aws_lambda_permission" "apigw_presign" {
@@ -171,6 +264,22 @@ resource "aws_lambda_permission" "apigw_stats" {
   source_arn    = "${aws_apigatewayv2_api.presign_api.execution_arn}/*/*"
 }
 
+resource "aws_lambda_permission" "apigw_menu" {
+  statement_id  = "AllowAPIGatewayInvokeMenu"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.menu.function_name
+  principal     = "apigateway.amazonaws.com"
+  source_arn    = "${aws_apigatewayv2_api.presign_api.execution_arn}/*/*"
+}
+
+resource "aws_lambda_permission" "apigw_todo" {
+  statement_id  = "AllowAPIGatewayInvokeTodo"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.todo.function_name
+  principal     = "apigateway.amazonaws.com"
+  source_arn    = "${aws_apigatewayv2_api.presign_api.execution_arn}/*/*"
+}
+
 # --- Outputs ---
 
 output "presign_api_url" {
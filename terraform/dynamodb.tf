@@ -10,11 +10,206 @@ resource "aws_dynamodb_table" "extractions" {
     type = "S"
   }
 
+  attribute {
+    name = "hash"
+    type = "S"
+  }
+
+  attribute {
+    name = "list_pk"
+    type = "S"
+  }
+
+  attribute {
+    name = "s3_key"
+    type = "S"
+  }
+
+  attribute {
+    name = "timestamp"
+    type = "S"
+  }
+
+  # Content-addressed cache lookups by SHA-256 of the uploaded file
+  global_secondary_index {
+    name            = "hash-index"
+    hash_key        = "hash"
+    projection_type = "KEYS_ONLY"
+  }
+
+  # Extractions of an upload, for the S3 events that keep file_exists current
+  global_secondary_index {
+    name            = "s3_key-index"
+    hash_key        = "s3_key"
+    projection_type = "KEYS_ONLY"
+  }
+
+  # History list: one constant partition sorted by timestamp, queried newest-first a page at a time.
+  # Only the list columns are copied (extraction_list.SUMMARY_FIELDS); details come from the table.
+  global_secondary_index {
+    name               = "timestamp-index"
+    hash_key           = "list_pk"
+    range_key          = "timestamp"
+    projection_type    = "INCLUDE"
+    non_key_attributes = ["filename", "s3_key", "line_count", "avg_confidence", "corrected", "thumbnail_key", "duplicate_of", "file_exists"]
+  }
+
   tags = merge(local.dynamodb_tags, {
     Name = "ocr-extractions"
   })
 }
 
+resource "aws_dynamodb_table" "ocr_jobs" {
+  name         = "ocr-jobs"
+  billing_mode = var.dynamodb_billing_mode
+  hash_key     = "job_id"
+
+  attribute {
+    name = "job_id"
+    type = "S"
+  }
+
+  # Async Textract job records are only needed while the browser polls
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+
+  tags = merge(local.dynamodb_tags, {
+    Name = "ocr-jobs"
+  })
+}
+
+resource "aws_dynamodb_table" "upload_status" {
+  name         = "ocr-upload-status"
+  billing_mode = var.dynamodb_billing_mode
+  hash_key     = "s3_key"
+  range_key    = "etag"
+
+  # Upload worker progress per object version, polled by the browser through /ocr/status?s3_key=
+  attribute {
+    name = "s3_key"
+    type = "S"
+  }
+
+  attribute {
+    name = "etag"
+    type = "S"
+  }
+
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+
+  tags = merge(local.dynamodb_tags, {
+    Name = "ocr-upload-status"
+  })
+}
+
+resource "aws_dynamodb_table" "ocr_pages" {
+  name         = "ocr-pages"
+  billing_mode = var.dynamodb_billing_mode
+  hash_key     = "hash"
+  range_key    = "page"
+
+  # Per-page results of /ocr?pages=..., by content hash and 1-based page number
+  attribute {
+    name = "hash"
+    type = "S"
+  }
+
+  attribute {
+    name = "page"
+    type = "N"
+  }
+
+  tags = merge(local.dynamodb_tags, {
+    Name = "ocr-pages"
+  })
+}
+
+resource "aws_dynamodb_table" "simhash_buckets" {
+  name         = "ocr-simhash-buckets"
+  billing_mode = var.dynamodb_billing_mode
+  hash_key     = "band"
+  range_key    = "id"
+
+  # LSH buckets of extraction text signatures ("3#a2" = band 3 has bits a2), for near-duplicate menus
+  attribute {
+    name = "band"
+    type = "S"
+  }
+
+  attribute {
+    name = "id"
+    type = "S"
+  }
+
+  tags = merge(local.dynamodb_tags, {
+    Name = "ocr-simhash-buckets"
+  })
+}
+
+resource "aws_dynamodb_table" "search_index" {
+  name         = "ocr-search-index"
+  billing_mode = var.dynamodb_billing_mode
+  hash_key     = "term"
+  range_key    = "id"
+
+  # Inverted index of extraction text: one posting per (term, extraction id), see search_index.py
+  attribute {
+    name = "term"
+    type = "S"
+  }
+
+  attribute {
+    name = "id"
+    type = "S"
+  }
+
+  tags = merge(local.dynamodb_tags, {
+    Name = "ocr-search-index"
+  })
+}
+
+resource "aws_dynamodb_table" "collection_versions" {
+  name         = "ocr-collection-versions"
+  billing_mode = var.dynamodb_billing_mode
+  hash_key     = "collection"
+
+  # One atomic counter per collection (extractions, menu, todos), returned as the ETag of its reads
+  attribute {
+    name = "collection"
+    type = "S"
+  }
+
+  tags = merge(local.dynamodb_tags, {
+    Name = "ocr-collection-versions"
+  })
+}
+
+resource "aws_dynamodb_table" "rate_limits" {
+  name         = "ocr-rate-limits"
+  billing_mode = var.dynamodb_billing_mode
+  hash_key     = "pk"
+
+  # One item per service per window ("textract#1760000000"), holding an atomic call counter
+  attribute {
+    name = "pk"
+    type = "S"
+  }
+
+  ttl {
+    attribute_name = "expires_at"
+    enabled        = true
+  }
+
+  tags = merge(local.dynamodb_tags, {
+    Name = "ocr-rate-limits"
+  })
+}
+
 resource "aws_dynamodb_table" "visitors" {
   name         = "ocr-visitors"
   billing_mode = var.dynamodb_billing_mode
@@ -0,0 +1,150 @@
+# --- S3 Upload Events ---
+
+# One topic receives every upload/delete under r/ and fans out to the consumers.
+# S3 allows only one notification per prefix and event type, so consumers subscribe here.
+resource "aws_sns_topic" "s3_events" {
+  name = "ocr-s3-events"
+  tags = merge(local.common_tags, {
+    Name = "ocr-s3-events"
+  })
+}
+
+resource "aws_sns_topic_policy" "s3_events" {
+  arn = aws_sns_topic.s3_events.arn
+  policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [{
+      Effect    = "Allow",
+      Principal = { Service = "s3.amazonaws.com" },
+      Action    = "sns:Publish",
+      Resource  = aws_sns_topic.s3_events.arn,
+      Condition = {
+        ArnLike = { "aws:SourceArn" = aws_s3_bucket.site.arn }
+      }
+    }]
+  })
+}
+
+resource "aws_s3_bucket_notification" "uploads" {
+  bucket = aws_s3_bucket.site.id
+
+  topic {
+    topic_arn     = aws_sns_topic.s3_events.arn
+    events        = ["s3:ObjectCreated:*", "s3:ObjectRemoved:*"]
+    filter_prefix = "r/"
+  }
+
+  depends_on = [aws_sns_topic_policy.s3_events]
+}
+
+# --- Thumbnail subscription ---
+
+resource "aws_sns_topic_subscription" "thumbnails" {
+  topic_arn = aws_sns_topic.s3_events.arn
+  protocol  = "lambda"
+  endpoint  = aws_lambda_function.thumbnails.arn
+}
+
+resource "aws_lambda_permission" "sns_thumbnails" {
+  statement_id  = "AllowSNSInvoke"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.thumbnails.function_name
+  principal     = "sns.amazonaws.com"
+  source_arn    = aws_sns_topic.s3_events.arn
+}
+
+# --- File status subscription ---
+
+resource "aws_sns_topic_subscription" "file_status" {
+  topic_arn = aws_sns_topic.s3_events.arn
+  protocol  = "lambda"
+  endpoint  = aws_lambda_function.file_status.arn
+}
+
+resource "aws_lambda_permission" "sns_file_status" {
+  statement_id  = "AllowSNSInvoke"
+  action        = "lambda:InvokeFunction"
+  function_name = aws_lambda_function.file_status.function_name
+  principal     = "sns.amazonaws.com"
+  source_arn    = aws_sns_topic.s3_events.arn
+}
+
+# --- S3 cleanup subscription ---
+
+# s3-cleanup keeps tblUploads in step with r/. It was deployed from the old single-file config
+# (main.tf.backup) and isn't managed here, and aws_s3_bucket_notification above replaced its direct
+# bucket trigger, so it is looked up by name and subscribed to the topic like the other consumers.
+# Terraform doesn't update its code: redeploy lambda/lambda_s3_cleanup.py (which unwraps SNS messages)
+# BEFORE applying this, or the deployed build fails on every envelope and tblUploads stops tracking r/.
+# See "Deployment" in docs/lambda_s3_cleanup.md.
+data "aws_lambda_function" "s3_cleanup" {
+  function_name = "s3-cleanup"
+}
+
+resource "aws_sns_topic_subscription" "s3_cleanup" {
+  topic_arn = aws_sns_topic.s3_events.arn
+  protocol  = "lambda"
+  endpoint  = data.aws_lambda_function.s3_cleanup.arn
+}
+
+resource "aws_lambda_permission" "sns_s3_cleanup" {
+  statement_id  = "AllowSNSInvoke"
+  action        = "lambda:InvokeFunction"
+  function_name = data.aws_lambda_function.s3_cleanup.function_name
+  principal     = "sns.amazonaws.com"
+  source_arn    = aws_sns_topic.s3_events.arn
+}
+
+# --- Upload OCR queue ---
+
+# Uploads are OCR'd in the background by the ocr-worker Lambda; the browser just polls for the result.
+# SQS buffers bursts and retries failures; messages that fail three times land in the dead-letter queue.
+resource "aws_sqs_queue" "ocr_uploads_dlq" {
+  name                      = "ocr-uploads-dlq"
+  message_retention_seconds = 1209600
+  tags = merge(local.common_tags, {
+    Name = "ocr-uploads-dlq"
+  })
+}
+
+resource "aws_sqs_queue" "ocr_uploads" {
+  name = "ocr-uploads"
+  # Six times the worker timeout, as Lambda recommends for SQS sources
+  visibility_timeout_seconds = 1800
+  redrive_policy = jsonencode({
+    deadLetterTargetArn = aws_sqs_queue.ocr_uploads_dlq.arn
+    # lambda_ocr.WORKER_MAX_RECEIVES marks the upload FAILED on the last attempt
+    maxReceiveCount     = 3
+  })
+  tags = merge(local.common_tags, {
+    Name = "ocr-uploads"
+  })
+}
+
+resource "aws_sqs_queue_policy" "ocr_uploads" {
+  queue_url = aws_sqs_queue.ocr_uploads.id
+  policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [{
+      Effect    = "Allow",
+      Principal = { Service = "sns.amazonaws.com" },
+      Action    = "sqs:SendMessage",
+      Resource  = aws_sqs_queue.ocr_uploads.arn,
+      Condition = {
+        ArnEquals = { "aws:SourceArn" = aws_sns_topic.s3_events.arn }
+      }
+    }]
+  })
+}
+
+resource "aws_sns_topic_subscription" "ocr_uploads" {
+  topic_arn            = aws_sns_topic.s3_events.arn
+  protocol             = "sqs"
+  endpoint             = aws_sqs_queue.ocr_uploads.arn
+  raw_message_delivery = true
+  # Deletes only matter to the thumbnail and cleanup consumers
+  filter_policy_scope = "MessageBody"
+  filter_policy = jsonencode({
+    Records = { eventName = [{ prefix = "ObjectCreated:" }] }
+  })
+}
@@ -93,9 +93,10 @@ resource "aws_iam_role_policy_attachment" "ocr_lambda_dynamodb" {
   policy_arn = "arn:aws:iam::aws:policy/AmazonDynamoDBFullAccess"
 }
 
+# Built by `python build_ocr_package.py` (slimmed copy of lambda/ocr_package with precompiled bytecode)
 data "archive_file" "ocr_lambda_zip" {
   type        = "zip"
-  source_dir  = "${path.module}/../lambda/ocr_package"
+  source_dir  = "${path.module}/../lambda/build/ocr_package"
   output_path = "${path.module}/../lambda/lambda_ocr.zip"
 }
 
@@ -110,10 +111,132 @@ resource "aws_lambda_function" "ocr" {
     variables = {
       BUCKET = aws_s3_bucket.site.bucket
       TABLE_NAME = aws_dynamodb_table.extractions.name
+      JOBS_TABLE = aws_dynamodb_table.ocr_jobs.name
+      PAGES_TABLE = aws_dynamodb_table.ocr_pages.name
+      # Upload worker progress per object, read by /ocr/status?s3_key= (see upload_status.py)
+      UPLOAD_STATUS_TABLE = aws_dynamodb_table.upload_status.name
+      # Bumped on every write so the history list can answer 304 (see collection_version.py)
+      VERSIONS_TABLE = aws_dynamodb_table.collection_versions.name
+      # Near-duplicate menus: LSH buckets and max SimHash distance in bits (see near_duplicates.py)
+      SIMHASH_TABLE     = aws_dynamodb_table.simhash_buckets.name
+      NEAR_DUP_DISTANCE = "3"
+      # Full-text search postings, updated as extractions are written (see search_index.py)
+      SEARCH_TABLE = aws_dynamodb_table.search_index.name
       DB_HOST = split(":", aws_db_instance.hey_postgres.endpoint)[0]
+      # PDF extraction processes; "auto" = one per vCPU (only >1 above ~1769 MB memory)
+      PDF_WORKERS = "1"
+      # pypdf or pymupdf; pymupdf falls back to pypdf on error
+      PDF_ENGINE = "pypdf"
+      # Rasterize PDF pages with no text layer and OCR them with Textract
+      OCR_SCANNED_PAGES = "true"
+      OCR_DPI           = "200"
+      OCR_CONCURRENCY   = "4"
+      # Upright, grayscale, size-capped copy of photos for Textract (see image_preprocess.py)
+      PREPROCESS_IMAGES = "true"
+      MAX_IMAGE_SIDE    = "3000"
+      # Photos longer than TILE_THRESHOLD px are OCR'd as overlapping tiles (see tiled_ocr.py)
+      TILE_IMAGES      = "true"
+      TILE_THRESHOLD   = "6000"
+      TILE_CONCURRENCY = "4"
+      # POST /ocr/batch queues its keys here for the upload worker
+      OCR_UPLOADS_QUEUE_URL = aws_sqs_queue.ocr_uploads.url
+      # Textract calls per second across all OCR containers (see rate_limiter.py)
+      RATE_LIMIT_TABLE = aws_dynamodb_table.rate_limits.name
+      TEXTRACT_TPS     = "5"
     }
   }
-  timeout     = 120
+  timeout = 120
+  # Full-resolution photo decodes, tiles and rasterized PDF pages don't fit in 128 MB (see
+  # `python benchmark_ocr.py tiles`, which reports the peak per tile concurrency)
+  memory_size = var.ocr_memory_size
+}
+
+# --- Upload worker Lambda ---
+
+# Same package, role and settings as the OCR Lambda; OCRs uploads from the ocr-uploads queue
+resource "aws_lambda_function" "ocr_worker" {
+  filename         = data.archive_file.ocr_lambda_zip.output_path
+  function_name    = "ocr-worker"
+  role             = aws_iam_role.ocr_lambda.arn
+  handler          = "lambda_ocr.sqs_handler"
+  runtime          = "python3.11"
+  source_code_hash = data.archive_file.ocr_lambda_zip.output_base64sha256
+  environment {
+    variables = aws_lambda_function.ocr.environment[0].variables
+  }
+  # Long enough to wait for an async Textract job; the queue's visibility timeout must exceed it
+  timeout     = 300
+  memory_size = var.ocr_memory_size
+}
+
+resource "aws_iam_role_policy_attachment" "ocr_lambda_sqs" {
+  role       = aws_iam_role.ocr_lambda.name
+  policy_arn = "arn:aws:iam::aws:policy/service-role/AWSLambdaSQSQueueExecutionRole"
+}
+
+# POST /ocr/batch sends its keys to the worker's queue
+resource "aws_iam_role_policy" "ocr_lambda_queue_send" {
+  name = "ocr-uploads-send"
+  role = aws_iam_role.ocr_lambda.id
+  policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [{
+      Effect   = "Allow",
+      Action   = "sqs:SendMessage",
+      Resource = aws_sqs_queue.ocr_uploads.arn
+    }]
+  })
+}
+
+resource "aws_lambda_event_source_mapping" "ocr_uploads" {
+  event_source_arn        = aws_sqs_queue.ocr_uploads.arn
+  function_name           = aws_lambda_function.ocr_worker.arn
+  batch_size              = 5
+  function_response_types = ["ReportBatchItemFailures"]
+  # Cap on concurrent worker invocations: each one runs Textract and holds a decoded file in memory
+  scaling_config {
+    maximum_concurrency = var.ocr_worker_concurrency
+  }
+}
+
+# --- Thumbnail Lambda ---
+
+# Same package and role as the OCR Lambda (PyMuPDF + Pillow), different handler
+resource "aws_lambda_function" "thumbnails" {
+  filename         = data.archive_file.ocr_lambda_zip.output_path
+  function_name    = "ocr-thumbnails"
+  role             = aws_iam_role.ocr_lambda.arn
+  handler          = "thumbnails.lambda_handler"
+  runtime          = "python3.11"
+  source_code_hash = data.archive_file.ocr_lambda_zip.output_base64sha256
+  environment {
+    variables = {
+      TABLE_NAME      = aws_dynamodb_table.extractions.name
+      VERSIONS_TABLE  = aws_dynamodb_table.collection_versions.name
+      THUMBNAIL_WIDTH = "320"
+    }
+  }
+  timeout     = 60
+  memory_size = 512
+}
+
+# --- File Status Lambda ---
+
+# Same package and role again: keeps file_exists/object_size/etag on extractions in step with S3 events
+resource "aws_lambda_function" "file_status" {
+  filename         = data.archive_file.ocr_lambda_zip.output_path
+  function_name    = "ocr-file-status"
+  role             = aws_iam_role.ocr_lambda.arn
+  handler          = "file_status.lambda_handler"
+  runtime          = "python3.11"
+  source_code_hash = data.archive_file.ocr_lambda_zip.output_base64sha256
+  environment {
+    variables = {
+      TABLE_NAME     = aws_dynamodb_table.extractions.name
+      VERSIONS_TABLE = aws_dynamodb_table.collection_versions.name
+    }
+  }
+  timeout     = 30
   memory_size = 128
 }
 
@@ -143,13 +266,45 @@ resource "aws_iam_role_policy_attachment" "list_lambda_dynamodb" {
 
 resource "aws_iam_role_policy_attachment" "list_lambda_s3" {
   role       = aws_iam_role.list_lambda.name
-  policy_arn = "arn:aws:iam::aws:policy/AmazonS3ReadOnlyAccess"
+  policy_arn = "arn:aws:iam::aws:policy/AmazonS3FullAccess"
 }
 
 data "archive_file" "list_lambda_zip" {
   type        = "zip"
-  source_file = "${path.module}/../lambda/lambda_list.py"
   output_path = "${path.module}/../lambda/lambda_list.zip"
+  source {
+    content  = file("${path.module}/../lambda/lambda_list.py")
+    filename = "lambda_list.py"
+  }
+  # Shared with the OCR Lambda: reads/writes the S3 result bodies it stores
+  source {
+    content  = file("${path.module}/../lambda/ocr_package/result_store.py")
+    filename = "result_store.py"
+  }
+  source {
+    content  = file("${path.module}/../lambda/ocr_package/compact_format.py")
+    filename = "compact_format.py"
+  }
+  # Cursor pagination over timestamp-index, shared with the OCR Lambda that sets list_pk
+  source {
+    content  = file("${path.module}/../lambda/ocr_package/extraction_list.py")
+    filename = "extraction_list.py"
+  }
+  # Version counter behind the ETag / 304 responses
+  source {
+    content  = file("${path.module}/../lambda/collection_version.py")
+    filename = "collection_version.py"
+  }
+  # Removes deleted extractions from the near-duplicate buckets
+  source {
+    content  = file("${path.module}/../lambda/ocr_package/near_duplicates.py")
+    filename = "near_duplicates.py"
+  }
+  # Serves /search and keeps the index in step with corrections and deletes
+  source {
+    content  = file("${path.module}/../lambda/ocr_package/search_index.py")
+    filename = "search_index.py"
+  }
 }
 
 resource "aws_lambda_function" "list_extractions" {
@@ -161,8 +316,11 @@ resource "aws_lambda_function" "list_extractions" {
   source_code_hash = data.archive_file.list_lambda_zip.output_base64sha256
   environment {
     variables = {
-      TABLE_NAME = aws_dynamodb_table.extractions.name
-      BUCKET     = aws_s3_bucket.site.bucket
+      TABLE_NAME     = aws_dynamodb_table.extractions.name
+      BUCKET         = aws_s3_bucket.site.bucket
+      SIMHASH_TABLE  = aws_dynamodb_table.simhash_buckets.name
+      VERSIONS_TABLE = aws_dynamodb_table.collection_versions.name
+      SEARCH_TABLE   = aws_dynamodb_table.search_index.name
     }
   }
   timeout     = 10
@@ -193,10 +351,23 @@ resource "aws_iam_role_policy_attachment" "validate_lambda_comprehend" {
   policy_arn = "arn:aws:iam::aws:policy/ComprehendFullAccess"
 }
 
+# Shared rate-limit counters (ocr-rate-limits)
+resource "aws_iam_role_policy_attachment" "validate_lambda_dynamodb" {
+  role       = aws_iam_role.validate_lambda.name
+  policy_arn = "arn:aws:iam::aws:policy/AmazonDynamoDBFullAccess"
+}
+
 data "archive_file" "validate_lambda_zip" {
   type        = "zip"
-  source_file = "${path.module}/../lambda/lambda_validate.py"
   output_path = "${path.module}/../lambda/lambda_validate.zip"
+  source {
+    content  = file("${path.module}/../lambda/lambda_validate.py")
+    filename = "lambda_validate.py"
+  }
+  source {
+    content  = file("${path.module}/../lambda/rate_limiter.py")
+    filename = "rate_limiter.py"
+  }
 }
 
 resource "aws_lambda_function" "validate" {
@@ -206,10 +377,174 @@ resource "aws_lambda_function" "validate" {
   handler          = "lambda_validate.lambda_handler"
   runtime          = "python3.11"
   source_code_hash = data.archive_file.validate_lambda_zip.output_base64sha256
+  environment {
+    variables = {
+      RATE_LIMIT_TABLE = aws_dynamodb_table.rate_limits.name
+      COMPREHEND_TPS   = "20"
+    }
+  }
   timeout     = 15
   memory_size = 128
 }
 
+# --- Menu Lambda ---
+
+resource "aws_iam_role" "menu_lambda" {
+  name = "menu-lambda-role"
+  assume_role_policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [{
+      Action = "sts:AssumeRole",
+      Effect = "Allow",
+      Principal = { Service = "lambda.amazonaws.com" }
+    }]
+  })
+}
+
+resource "aws_iam_role_policy" "menu_lambda_policy" {
+  name = "menu-lambda-policy"
+  role = aws_iam_role.menu_lambda.id
+  policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [
+      {
+        Effect = "Allow",
+        Action = ["bedrock:InvokeModel"],
+        Resource = "arn:aws:bedrock:eu-west-2::foundation-model/amazon.titan-image-generator-v1"
+      },
+      {
+        Effect = "Allow",
+        Action = ["s3:PutObject", "s3:DeleteObject"],
+        Resource = "${aws_s3_bucket.site.arn}/*"
+      },
+      {
+        Effect = "Allow",
+        Action = ["dynamodb:GetItem", "dynamodb:PutItem", "dynamodb:UpdateItem", "dynamodb:DeleteItem", "dynamodb:Scan"],
+        Resource = aws_dynamodb_table.menu_items.arn
+      },
+      # Shared Bedrock rate limit and the menu version counter
+      {
+        Effect = "Allow",
+        Action = ["dynamodb:GetItem", "dynamodb:UpdateItem"],
+        Resource = [aws_dynamodb_table.rate_limits.arn, aws_dynamodb_table.collection_versions.arn]
+      },
+      {
+        Effect = "Allow",
+        Action = ["logs:CreateLogGroup", "logs:CreateLogStream", "logs:PutLogEvents"],
+        Resource = "arn:aws:logs:*:*:*"
+      }
+    ]
+  })
+}
+
+data "archive_file" "menu_lambda_zip" {
+  type        = "zip"
+  output_path = "${path.module}/../lambda/lambda_menu.zip"
+  source {
+    content  = file("${path.module}/../lambda/lambda_menu.py")
+    filename = "lambda_menu.py"
+  }
+  # Bedrock calls go through the shared limiter
+  source {
+    content  = file("${path.module}/../lambda/rate_limiter.py")
+    filename = "rate_limiter.py"
+  }
+  # Version counter behind the ETag / 304 responses
+  source {
+    content  = file("${path.module}/../lambda/collection_version.py")
+    filename = "collection_version.py"
+  }
+}
+
+resource "aws_lambda_function" "menu" {
+  filename         = data.archive_file.menu_lambda_zip.output_path
+  function_name    = "menu-management"
+  role             = aws_iam_role.menu_lambda.arn
+  handler          = "lambda_menu.lambda_handler"
+  runtime          = "python3.11"
+  source_code_hash = data.archive_file.menu_lambda_zip.output_base64sha256
+  environment {
+    variables = {
+      BUCKET           = aws_s3_bucket.site.bucket
+      TABLE_NAME       = aws_dynamodb_table.menu_items.name
+      RATE_LIMIT_TABLE = aws_dynamodb_table.rate_limits.name
+      BEDROCK_TPS      = "0.5"
+      VERSIONS_TABLE   = aws_dynamodb_table.collection_versions.name
+    }
+  }
+  timeout     = 30
+  memory_size = 256
+}
+
+# --- Todo Lambda ---
+
+resource "aws_iam_role" "todo_lambda" {
+  name = "todo-lambda-role"
+  assume_role_policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [{
+      Action = "sts:AssumeRole",
+      Effect = "Allow",
+      Principal = { Service = "lambda.amazonaws.com" }
+    }]
+  })
+}
+
+resource "aws_iam_role_policy" "todo_lambda_policy" {
+  name = "todo-lambda-policy"
+  role = aws_iam_role.todo_lambda.id
+  policy = jsonencode({
+    Version = "2012-10-17",
+    Statement = [
+      {
+        Effect = "Allow",
+        Action = ["dynamodb:GetItem", "dynamodb:PutItem", "dynamodb:UpdateItem", "dynamodb:DeleteItem", "dynamodb:Scan"],
+        Resource = aws_dynamodb_table.todos.arn
+      },
+      {
+        Effect = "Allow",
+        Action = ["dynamodb:GetItem", "dynamodb:UpdateItem"],
+        Resource = aws_dynamodb_table.collection_versions.arn
+      },
+      {
+        Effect = "Allow",
+        Action = ["logs:CreateLogGroup", "logs:CreateLogStream", "logs:PutLogEvents"],
+        Resource = "arn:aws:logs:*:*:*"
+      }
+    ]
+  })
+}
+
+data "archive_file" "todo_lambda_zip" {
+  type        = "zip"
+  output_path = "${path.module}/../lambda/lambda_todo.zip"
+  source {
+    content  = file("${path.module}/../lambda/lambda_todo.py")
+    filename = "lambda_todo.py"
+  }
+  source {
+    content  = file("${path.module}/../lambda/collection_version.py")
+    filename = "collection_version.py"
+  }
+}
+
+resource "aws_lambda_function" "todo" {
+  filename         = data.archive_file.todo_lambda_zip.output_path
+  function_name    = "todo-management"
+  role             = aws_iam_role.todo_lambda.arn
+  handler          = "lambda_todo.lambda_handler"
+  runtime          = "python3.11"
+  source_code_hash = data.archive_file.todo_lambda_zip.output_base64sha256
+  environment {
+    variables = {
+      TABLE_NAME     = aws_dynamodb_table.todos.name
+      VERSIONS_TABLE = aws_dynamodb_table.collection_versions.name
+    }
+  }
+  timeout     = 10
+  memory_size = 128
+}
+
 # --- Counter Lambda ---
 
 resource "aws_iam_role" "counter_lambda" {
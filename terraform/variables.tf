@@ -29,4 +29,16 @@ variable "dynamodb_billing_mode" {
   description = "Billing mode for DynamoDB tables"
   type        = string
   default     = "PAY_PER_REQUEST"
-}
\ No newline at end of file
+}
+
+variable "ocr_memory_size" {
+  description = "Memory (MB) of the OCR and upload worker Lambdas; tiling an 8000x6000 photo peaks at ~120 MB before boto3"
+  type        = number
+  default     = 512
+}
+
+variable "ocr_worker_concurrency" {
+  description = "Most ocr-worker invocations the ocr-uploads queue runs at once (2-1000)"
+  type        = number
+  default     = 2
+}